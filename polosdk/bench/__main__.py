@@ -0,0 +1,54 @@
+import argparse
+import json
+
+from polosdk.bench import runner
+
+_suites = ('rest', 'parsers', 'ws', 'load')
+_default_suites = ('rest', 'parsers', 'ws')
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m polosdk.bench',
+                                     description='Offline benchmarks against local mock REST and websocket servers.')
+    parser.add_argument('suites', nargs='*', help=f'Suites to run, any of {", ".join(_suites)}. Default all but load.')
+    parser.add_argument('--count', type=int, default=1000, help='Operations per benchmark.')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds the mock REST server adds per response.')
+    parser.add_argument('--rate', type=float, default=5000.0, help='Messages per second published by the mock '
+                                                                    'websocket server.')
+    parser.add_argument('--duration', type=float, default=3.0, help='Seconds to listen in websocket benchmarks.')
+    parser.add_argument('--max-rate', type=float, default=200000.0, help='Highest rate tried by the load test.')
+    parser.add_argument('--futures', action='store_true', help='Load test the futures client.')
+    parser.add_argument('--json', action='store_true', help='Print results as json lines.')
+    args = parser.parse_args()
+
+    suites = args.suites or _default_suites
+    unknown = [suite for suite in suites if suite not in _suites]
+    if len(unknown) > 0:
+        parser.error(f'unknown suites {", ".join(unknown)}')
+
+    results = []
+    if 'rest' in suites:
+        results += runner.bench_rest(args.count, args.latency)
+
+    if 'parsers' in suites:
+        results += runner.bench_parsers(args.count)
+
+    if 'ws' in suites:
+        results.append(runner.bench_listen(args.rate, args.duration))
+        results.append(runner.bench_listen(args.rate, args.duration, futures=True))
+
+    if 'load' in suites:
+        load = runner.load_test(max_rate=args.max_rate, step_sec=args.duration, futures=args.futures)
+        for step in load.steps:
+            print(json.dumps(step))
+        print(f'max sustainable rate: {load.max_sustainable_rate}')
+
+    if args.json:
+        for result in results:
+            print(json.dumps(result.summary()))
+    elif len(results) > 0:
+        print(runner.format_results(results))
+
+
+if __name__ == '__main__':
+    main()
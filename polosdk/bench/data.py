@@ -0,0 +1,266 @@
+import random
+import time
+import zlib
+
+SPOT_SYMBOLS = ('BTC_USDT', 'ETH_USDT', 'TRX_USDT', 'XRP_USDT', 'SOL_USDT', 'DOGE_USDT', 'LTC_USDT', 'ADA_USDT')
+FUTURES_SYMBOLS = ('BTC_USDT_PERP', 'ETH_USDT_PERP', 'SOL_USDT_PERP', 'XRP_USDT_PERP')
+CURRENCIES = ('BTC', 'ETH', 'TRX', 'XRP', 'SOL', 'DOGE', 'LTC', 'ADA', 'USDT')
+
+_interval_ms = {
+    'MINUTE_1': 60000, 'MINUTE_5': 300000, 'MINUTE_10': 600000, 'MINUTE_15': 900000, 'MINUTE_30': 1800000,
+    'HOUR_1': 3600000, 'HOUR_2': 7200000, 'HOUR_4': 14400000, 'HOUR_6': 21600000, 'HOUR_12': 43200000,
+    'DAY_1': 86400000, 'DAY_3': 259200000, 'WEEK_1': 604800000, 'MONTH_1': 2592000000
+}
+
+
+def now_ms():
+    return int(time.time() * 1000)
+
+
+def interval_ms(interval):
+    return _interval_ms[interval]
+
+
+def _base_price(symbol):
+    """
+    Stable per symbol price level so generated books and candles look plausible.
+    """
+    return 10 ** (zlib.crc32(symbol.split('_')[0].encode()) % 5) * (1 + zlib.crc32(symbol.encode()) % 100 / 100)
+
+
+def _fmt(value):
+    return f'{value:.8f}'.rstrip('0').rstrip('.')
+
+
+class Generator:
+    """
+    Deterministic synthetic payloads in the trade engine's spot and futures formats, shared by the mock REST server
+    and the websocket feeds.
+
+    Attributes:
+        _random (random.Random): Seeded random source.
+        _seq (int): Sequence used for ids.
+    """
+    def __init__(self, seed=0):
+        self._random = random.Random(seed)
+        self._seq = 0
+
+    def _next_id(self):
+        self._seq += 1
+        return self._seq
+
+    def _price(self, symbol):
+        return _base_price(symbol) * (1 + self._random.uniform(-0.01, 0.01))
+
+    def _book_side(self, symbol, depth, side):
+        mid = _base_price(symbol)
+        step = mid * 0.0001
+        sign = 1 if side == 'asks' else -1
+        return [(_fmt(mid + sign * step * (i + 1)), _fmt(self._random.uniform(0.001, 5))) for i in range(depth)]
+
+    # Spot REST
+
+    def spot_market(self, symbol):
+        base, quote = symbol.split('_')
+        return {
+            'symbol': symbol,
+            'baseCurrencyName': base,
+            'quoteCurrencyName': quote,
+            'displayName': symbol.replace('_', '/'),
+            'state': 'NORMAL',
+            'visibleStartTime': 1659018819512,
+            'tradableStartTime': 1659018819512,
+            'symbolTradeLimit': {
+                'symbol': symbol,
+                'priceScale': 4,
+                'quantityScale': 6,
+                'amountScale': 4,
+                'minQuantity': '0.000001',
+                'minAmount': '1',
+                'highestBid': '0',
+                'lowestAsk': '0'
+            },
+            'crossMargin': {'supportCrossMargin': True, 'maxLeverage': 3}
+        }
+
+    def spot_currency(self, currency):
+        return {currency: {
+            'id': zlib.crc32(currency.encode()) % 1000,
+            'name': currency,
+            'description': 'BTC Clone',
+            'type': 'address',
+            'withdrawalFee': '0.0005',
+            'minConf': 2,
+            'depositAddress': None,
+            'blockchain': currency,
+            'delisted': False,
+            'tradingState': 'NORMAL',
+            'walletState': 'ENABLED',
+            'parentChain': None,
+            'isMultiChain': False,
+            'isChildChain': False,
+            'childChains': []
+        }}
+
+    def spot_price(self, symbol):
+        return {'symbol': symbol, 'price': _fmt(self._price(symbol)), 'time': now_ms(), 'dailyChange': '0.01',
+                'ts': now_ms()}
+
+    def spot_ticker(self, symbol):
+        price = self._price(symbol)
+        return {
+            'symbol': symbol,
+            'open': _fmt(price * 0.99),
+            'low': _fmt(price * 0.98),
+            'high': _fmt(price * 1.02),
+            'close': _fmt(price),
+            'quantity': _fmt(self._random.uniform(1, 1000)),
+            'amount': _fmt(self._random.uniform(1000, 100000)),
+            'tradeCount': self._random.randint(1, 10000),
+            'startTime': now_ms() - 86400000,
+            'closeTime': now_ms(),
+            'displayName': symbol.replace('_', '/'),
+            'dailyChange': '0.01',
+            'bid': _fmt(price * 0.9999),
+            'bidQuantity': '1',
+            'ask': _fmt(price * 1.0001),
+            'askQuantity': '1',
+            'ts': now_ms(),
+            'markPrice': _fmt(price)
+        }
+
+    def spot_candle(self, symbol, interval, start_time):
+        """
+        Returns:
+            Candle row in get_candles field order.
+        """
+        price = self._price(symbol)
+        low, high = price * 0.995, price * 1.005
+        open_price, close = self._random.uniform(low, high), self._random.uniform(low, high)
+        quantity = self._random.uniform(0.1, 100)
+        return [_fmt(low), _fmt(high), _fmt(open_price), _fmt(close), _fmt(quantity * price), _fmt(quantity),
+                _fmt(quantity * price / 2), _fmt(quantity / 2), self._random.randint(1, 500), now_ms(), _fmt(price),
+                interval, start_time, start_time + interval_ms(interval) - 1]
+
+    def spot_candles(self, symbol, interval, limit=100, end_time=None):
+        step = interval_ms(interval)
+        end = (end_time or now_ms()) // step * step
+        return [self.spot_candle(symbol, interval, end - step * i) for i in range(limit - 1, -1, -1)]
+
+    def spot_book(self, symbol, limit=10):
+        asks = [value for level in self._book_side(symbol, limit, 'asks') for value in level]
+        bids = [value for level in self._book_side(symbol, limit, 'bids') for value in level]
+        return {'time': now_ms(), 'scale': '0.01', 'asks': asks, 'bids': bids, 'ts': now_ms()}
+
+    def spot_trade(self, symbol):
+        price = self._price(symbol)
+        quantity = self._random.uniform(0.001, 2)
+        return {
+            'id': str(self._next_id()),
+            'price': _fmt(price),
+            'quantity': _fmt(quantity),
+            'amount': _fmt(price * quantity),
+            'takerSide': self._random.choice(('BUY', 'SELL')),
+            'ts': now_ms(),
+            'createTime': now_ms()
+        }
+
+    def spot_order(self, body):
+        return {'id': str(170000000000000000 + self._next_id()), 'clientOrderId': body.get('clientOrderId', '')}
+
+    # Futures REST
+
+    def futures_book(self, symbol, limit=10):
+        return {'s': '0.01', 'asks': [list(level) for level in self._book_side(symbol, limit, 'asks')],
+                'bids': [list(level) for level in self._book_side(symbol, limit, 'bids')], 'ts': now_ms()}
+
+    def futures_candle(self, symbol, interval, start_time):
+        """
+        Returns:
+            Candle row in futures order: low, high, open, close, amt, qty, tC, sT, cT.
+        """
+        row = self.spot_candle(symbol, interval, start_time)
+        return row[:6] + [str(row[8]), start_time, start_time + interval_ms(interval) - 1]
+
+    def futures_candles(self, symbol, interval, limit=100, end_time=None):
+        step = interval_ms(interval)
+        end = (end_time or now_ms()) // step * step
+        return [self.futures_candle(symbol, interval, end - step * i) for i in range(limit - 1, -1, -1)]
+
+    def futures_ticker(self, symbol):
+        ticker = self.spot_ticker(symbol)
+        return {'s': symbol, 'o': ticker['open'], 'h': ticker['high'], 'l': ticker['low'], 'c': ticker['close'],
+                'qty': ticker['quantity'], 'amt': ticker['amount'], 'tC': ticker['tradeCount'],
+                'sT': ticker['startTime'], 'cT': ticker['closeTime'], 'dN': symbol, 'dC': '0.01',
+                'bPx': ticker['bid'], 'bSz': '1', 'aPx': ticker['ask'], 'aSz': '1', 'mPx': ticker['markPrice'],
+                'iPx': ticker['markPrice']}
+
+    def futures_trade(self, symbol):
+        trade = self.spot_trade(symbol)
+        return {'id': trade['id'], 's': symbol, 'px': trade['price'], 'qty': trade['quantity'],
+                'amt': trade['amount'], 'side': trade['takerSide'].lower(), 'cT': trade['createTime']}
+
+    def futures_funding(self, symbol, funding_time):
+        return {'s': symbol, 'fR': _fmt(self._random.uniform(-0.0005, 0.0005)), 'fT': funding_time}
+
+    def futures_open_interest(self, symbol):
+        return {'s': symbol, 'oInterest': _fmt(self._random.uniform(1000, 100000))}
+
+    def futures_order(self, body):
+        return {'ordId': str(300000000000000000 + self._next_id()), 'clOrdId': body.get('clOrdId', '')}
+
+    # Websocket channel messages
+
+    def spot_message(self, channel, symbol):
+        """
+        Returns:
+            Spot websocket message of channel for symbol.
+        """
+        ts = now_ms()
+        if channel == 'trades':
+            trade = self.spot_trade(symbol)
+            data = dict(trade, symbol=symbol, takerSide=trade['takerSide'].lower())
+        elif channel in ('book', 'book_lv2'):
+            data = {'symbol': symbol, 'createTime': ts, 'asks': self._book_side(symbol, 5, 'asks'),
+                    'bids': self._book_side(symbol, 5, 'bids'), 'id': self._next_id(), 'lastId': self._seq - 1,
+                    'ts': ts}
+        elif channel == 'ticker':
+            data = self.spot_ticker(symbol)
+        elif channel.startswith('candles_'):
+            row = self.spot_candle(symbol, channel[len('candles_'):].upper(), ts)
+            data = {'symbol': symbol, 'low': row[0], 'high': row[1], 'open': row[2], 'close': row[3],
+                    'amount': row[4], 'quantity': row[5], 'tradeCount': row[8], 'startTime': row[12],
+                    'closeTime': row[13], 'ts': ts}
+        elif channel == 'orders':
+            data = {'symbol': symbol, 'type': 'LIMIT', 'quantity': '1', 'orderId': str(self._next_id()),
+                    'clientOrderId': '', 'accountType': 'SPOT', 'eventType': 'place', 'side': 'BUY',
+                    'state': 'NEW', 'price': _fmt(self._price(symbol)), 'createTime': ts, 'ts': ts}
+        else:
+            data = {'symbol': symbol, 'ts': ts}
+
+        msg = {'channel': channel, 'data': [data]}
+        if channel == 'book_lv2':
+            msg.update({'action': 'update'})
+
+        return msg
+
+    def futures_message(self, channel, symbol):
+        """
+        Returns:
+            Futures websocket message of channel for symbol.
+        """
+        ts = now_ms()
+        if channel == 'trades':
+            data = dict(self.futures_trade(symbol), ts=ts)
+        elif channel in ('book', 'book_lv2'):
+            data = dict(self.futures_book(symbol, 5), s=symbol, id=self._next_id(), lid=self._seq - 1, cT=ts)
+        elif channel == 'tickers':
+            data = dict(self.futures_ticker(symbol), ts=ts)
+        else:
+            data = {'s': symbol, 'ts': ts}
+
+        msg = {'channel': channel, 'data': [data]}
+        if channel == 'book_lv2':
+            msg.update({'action': 'update'})
+
+        return msg
@@ -0,0 +1,109 @@
+import json
+
+from polosdk.bench.data import Generator
+
+_default_pool_size = 256
+_ts_marker = '"ts": -1'
+
+
+def constant(rate):
+    """
+    Returns:
+        Rate shape publishing rate messages per second.
+    """
+    return lambda t: rate
+
+
+def burst(base_rate, burst_rate, burst_sec, period_sec):
+    """
+    Returns:
+        Rate shape publishing base_rate messages per second with burst_rate for the first burst_sec of every
+        period_sec, e.g. a quiet book with a flurry of updates on every trade print.
+    """
+    return lambda t: burst_rate if t % period_sec < burst_sec else base_rate
+
+
+def ramp(start_rate, end_rate, duration_sec):
+    """
+    Returns:
+        Rate shape rising linearly from start_rate to end_rate over duration_sec, then holding end_rate.
+    """
+    return lambda t: start_rate + (end_rate - start_rate) * min(t / duration_sec, 1.0)
+
+
+def steps(rates, step_sec):
+    """
+    Returns:
+        Rate shape holding each rate of rates for step_sec, then holding the last one.
+    """
+    return lambda t: rates[min(int(t / step_sec), len(rates) - 1)]
+
+
+class _Stream:
+    def __init__(self, frames):
+        self.frames = frames
+        self.cursor = 0
+
+
+class Feed:
+    """
+    Replayable synthetic feed of channel messages for a set of (channel, symbol) streams.  Messages are generated
+    once from a seed and pre-encoded, only the ts field is stamped when a frame is taken, so the feed costs little
+    CPU at high rates and lag measured from ts reflects the receiving side.  The same seed yields the same sequence.
+
+    Attributes:
+        _streams (list): Pre-encoded frames and cursor per stream, taken round robin.
+        _index (int): Next stream.
+
+    Example:
+        feed = Feed([('book_lv2', 'BTC_USDT'), ('trades', 'BTC_USDT')])
+        frame = feed.next_frame()
+    """
+    def __init__(self, streams, futures=False, seed=0, pool_size=_default_pool_size):
+        """
+        Args:
+            streams (list, required): (channel, symbol) tuples.
+            futures (bool, optional): Use futures message formats. Default false.
+            seed (int, optional): Seed for generated messages. Default 0.
+            pool_size (int, optional): Distinct messages per stream, replayed in a cycle. Default 256.
+        """
+        generator = Generator(seed)
+        message = generator.futures_message if futures else generator.spot_message
+        self._streams = [_Stream([self._encode(message(channel, symbol), index == 0) for index in range(pool_size)])
+                         for channel, symbol in streams]
+        self._index = 0
+
+    def next_frame(self, ts):
+        """
+        Args:
+            ts (int, required): Send time in ms since epoch stamped into the frame.
+
+        Returns:
+            Json encoded frame of the next stream.
+        """
+        stream = self._streams[self._index]
+        self._index = (self._index + 1) % len(self._streams)
+
+        head, tail = stream.frames[stream.cursor]
+        # The first frame of a book stream is its snapshot, later cycles replay only the updates.
+        stream.cursor = stream.cursor + 1 if stream.cursor + 1 < len(stream.frames) else min(1, stream.cursor)
+
+        if tail is None:
+            return head
+
+        return f'{head}"ts": {ts}{tail}'
+
+    def _encode(self, msg, first):
+        if msg.get('action') is not None and first:
+            msg.update({'action': 'snapshot'})
+
+        for item in msg.get('data', []):
+            if isinstance(item, dict) and 'ts' in item:
+                item.update({'ts': -1})
+
+        frame = json.dumps(msg)
+        if _ts_marker not in frame:
+            return frame, None
+
+        head, tail = frame.split(_ts_marker, 1)
+        return head, tail
@@ -0,0 +1,654 @@
+import asyncio
+import json
+import multiprocessing
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import websockets
+
+from polosdk.bench.data import CURRENCIES, FUTURES_SYMBOLS, SPOT_SYMBOLS, Generator, interval_ms, now_ms
+from polosdk.bench.feed import Feed
+from polosdk.spot.rest.metrics import Histogram
+
+# Publisher pacing tick, messages due within a tick are sent back to back.
+_publish_tick_sec = 0.001
+# Time a message became due to the time it was sent upper bounds in seconds.
+_send_lag_buckets = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+_routes = []
+
+
+def _route(method, pattern):
+    """
+    Registers a MockRestServer handler for a method and path regex, named groups are passed as arguments.
+    """
+    def register(func):
+        _routes.append((method, re.compile(f'^{pattern}$'), func))
+        return func
+
+    return register
+
+
+def _int(query, name, default):
+    return int(query.get(name, default))
+
+
+class _NotFound(Exception):
+    pass
+
+
+class MockRestServer:
+    """
+    Local stand-in for the spot and futures REST api serving generated data from a thread, used to benchmark Request
+    and the endpoint classes without network or credentials.  Signatures are not checked.
+
+    Attributes:
+        url (str): Base url to pass as url to Client, Public or Private.
+        latency_sec (float): Delay added to every response to emulate the exchange.
+        requests (int): Number of requests served.
+
+    Example:
+        with MockRestServer() as server:
+            client = Client('key', 'secret', url=server.url)
+            client.markets().get_candles('BTC_USDT', 'MINUTE_1')
+    """
+    def __init__(self, host='127.0.0.1', port=0, latency_sec=0.0, seed=0):
+        """
+        Args:
+            host (str, optional): Interface to listen on. Default 127.0.0.1.
+            port (int, optional): Port to listen on, 0 picks a free one. Default 0.
+            latency_sec (float, optional): Delay added to every response. Default 0.
+            seed (int, optional): Seed for generated data. Default 0.
+        """
+        self.latency_sec = latency_sec
+        self.requests = 0
+        self._generator = Generator(seed)
+        self._lock = threading.Lock()
+        self._orders = {}
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+        self.url = f'http://{host}:{self._server.server_port}'
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def handle(self, method, path, query, body):
+        """
+        Returns:
+            (status, payload) for a request.
+        """
+        with self._lock:
+            self.requests += 1
+            for route_method, pattern, func in _routes:
+                match = pattern.match(path)
+                if route_method == method and match is not None:
+                    try:
+                        payload = func(self, query, body, **match.groupdict())
+                    except _NotFound as err:
+                        return 400, {'code': 21707, 'message': str(err)}
+
+                    if path.startswith('/v3/'):
+                        payload = {'code': 200, 'msg': 'Success', 'data': payload}
+
+                    return 200, payload
+
+        return 404, {'code': 404, 'message': f'Not found: {method} {path}'}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately, with Nagle enabled every response waits for a delayed ack.
+            disable_nagle_algorithm = True
+
+            def _serve(self):
+                parsed = urlparse(self.path)
+                query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length)) if length > 0 else {}
+
+                if server.latency_sec > 0:
+                    time.sleep(server.latency_sec)
+
+                status, payload = server.handle(self.command, parsed.path, query, body)
+                content = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def _symbol(self, symbol, symbols=SPOT_SYMBOLS):
+        if symbol not in symbols:
+            raise _NotFound(f'Unknown symbol {symbol}')
+
+        return symbol
+
+    # Spot
+
+    @_route('GET', '/timestamp')
+    def _timestamp(self, query, body):
+        return {'serverTime': now_ms()}
+
+    @_route('GET', '/markets')
+    def _markets(self, query, body):
+        return [self._generator.spot_market(symbol) for symbol in SPOT_SYMBOLS]
+
+    @_route('GET', '/markets/price')
+    def _prices(self, query, body):
+        return [self._generator.spot_price(symbol) for symbol in SPOT_SYMBOLS]
+
+    @_route('GET', '/markets/ticker24h')
+    def _tickers(self, query, body):
+        return [self._generator.spot_ticker(symbol) for symbol in SPOT_SYMBOLS]
+
+    @_route('GET', '/markets/(?P<symbol>[A-Z_]+)')
+    def _market(self, query, body, symbol):
+        return [self._generator.spot_market(self._symbol(symbol))]
+
+    @_route('GET', '/markets/(?P<symbol>[A-Z_]+)/price')
+    def _price(self, query, body, symbol):
+        return self._generator.spot_price(self._symbol(symbol))
+
+    @_route('GET', '/markets/(?P<symbol>[A-Z_]+)/ticker24h')
+    def _ticker(self, query, body, symbol):
+        return self._generator.spot_ticker(self._symbol(symbol))
+
+    @_route('GET', '/markets/(?P<symbol>[A-Z_]+)/orderBook')
+    def _order_book(self, query, body, symbol):
+        return self._generator.spot_book(self._symbol(symbol), _int(query, 'limit', 10))
+
+    @_route('GET', '/markets/(?P<symbol>[A-Z_]+)/candles')
+    def _candles(self, query, body, symbol):
+        return self._candle_rows(self._generator.spot_candles, self._symbol(symbol), query)
+
+    @_route('GET', '/markets/(?P<symbol>[A-Z_]+)/trades')
+    def _trades(self, query, body, symbol):
+        return [self._generator.spot_trade(self._symbol(symbol)) for _ in range(_int(query, 'limit', 500))]
+
+    @_route('GET', '/currencies')
+    def _currencies(self, query, body):
+        return [self._generator.spot_currency(currency) for currency in CURRENCIES]
+
+    @_route('GET', '/orders')
+    def _open_orders(self, query, body):
+        return list(self._orders.values())
+
+    @_route('POST', '/orders')
+    def _create_order(self, query, body):
+        return self._store_order(body, self._generator.spot_order(body), 'id')
+
+    @_route('POST', '/orders/batch')
+    def _create_orders(self, query, body):
+        return [self._store_order(order, self._generator.spot_order(order), 'id') for order in body]
+
+    @_route('PUT', '/orders/(?P<order_id>[^/]+)')
+    def _cancel_replace(self, query, body, order_id):
+        self._orders.pop(order_id, None)
+        return self._store_order(body, self._generator.spot_order(body), 'id')
+
+    @_route('DELETE', '/orders/cancelByIds')
+    def _cancel_orders(self, query, body):
+        return [self._cancel(order_id, 'orderId') for order_id in body.get('orderIds', [])] + \
+               [{'orderId': '', 'clientOrderId': client_id, 'state': 'PENDING_CANCEL', 'code': 200,
+                 'message': ''} for client_id in body.get('clientOrderIds', [])]
+
+    @_route('DELETE', '/orders')
+    def _cancel_all(self, query, body):
+        return [self._cancel(order_id, 'orderId') for order_id in list(self._orders)]
+
+    # Futures
+
+    @_route('GET', '/v3/market/orderBook')
+    def _futures_order_book(self, query, body):
+        symbol = self._symbol(query.get('symbol'), FUTURES_SYMBOLS)
+        return self._generator.futures_book(symbol, _int(query, 'limit', 10))
+
+    @_route('GET', '/v3/market/(?P<series>candles|indexPriceCandlesticks|markPriceCandlesticks|'
+                   'premiumIndexCandlesticks)')
+    def _futures_candles(self, query, body, series):
+        symbol = self._symbol(query.get('symbol'), FUTURES_SYMBOLS)
+        return self._candle_rows(self._generator.futures_candles, symbol, query)
+
+    @_route('GET', '/v3/market/tickers')
+    def _futures_tickers(self, query, body):
+        return [self._generator.futures_ticker(symbol) for symbol in FUTURES_SYMBOLS]
+
+    @_route('GET', '/v3/market/trades')
+    def _futures_trades(self, query, body):
+        symbol = self._symbol(query.get('symbol'), FUTURES_SYMBOLS)
+        return [self._generator.futures_trade(symbol) for _ in range(_int(query, 'limit', 100))]
+
+    @_route('GET', '/v3/market/fundingRate/history')
+    def _funding_history(self, query, body):
+        symbol = self._symbol(query.get('symbol'), FUTURES_SYMBOLS)
+        step = 8 * 3600000
+        end = _int(query, 'eT', now_ms()) // step * step
+        start = _int(query, 'sT', 0)
+        times = [end - step * i for i in range(_int(query, 'limit', 100)) if end - step * i >= start]
+        return [self._generator.futures_funding(symbol, funding_time) for funding_time in times]
+
+    @_route('GET', '/v3/market/openInterest')
+    def _open_interest(self, query, body):
+        symbols = [query['symbol']] if 'symbol' in query else FUTURES_SYMBOLS
+        return [self._generator.futures_open_interest(self._symbol(symbol, FUTURES_SYMBOLS)) for symbol in symbols]
+
+    @_route('POST', '/v3/trade/order')
+    def _place_order(self, query, body):
+        return self._store_order(body, self._generator.futures_order(body), 'ordId')
+
+    @_route('POST', '/v3/trade/orders')
+    def _place_orders(self, query, body):
+        return [self._store_order(order, self._generator.futures_order(order), 'ordId') for order in body]
+
+    @_route('GET', '/v3/trade/order/opens')
+    def _futures_open_orders(self, query, body):
+        return [order for order in self._orders.values() if 'ordId' in order]
+
+    @_route('DELETE', '/v3/trade/order')
+    def _cancel_futures_order(self, query, body):
+        return self._cancel(body.get('ordId'), 'ordId')
+
+    @_route('DELETE', '/v3/trade/batchOrders')
+    def _cancel_futures_orders(self, query, body):
+        return [self._cancel(order_id, 'ordId') for order_id in body.get('ordIds', [])]
+
+    @_route('DELETE', '/v3/trade/allOrders')
+    def _cancel_all_futures(self, query, body):
+        return [self._cancel(order_id, 'ordId') for order_id, order in list(self._orders.items())
+                if 'ordId' in order]
+
+    @_route('GET', '/v3/account/balance')
+    def _balance(self, query, body):
+        return {'state': 'NORMAL', 'eq': '10000', 'isoEq': '0', 'im': '0', 'mm': '0', 'mmr': '0', 'upl': '0',
+                'availMgn': '10000', 'cTime': now_ms(), 'uTime': now_ms(),
+                'details': [{'ccy': 'USDT', 'eq': '10000', 'avail': '10000', 'upl': '0', 'isoEq': '0',
+                             'im': '0', 'mm': '0', 'mmr': '0', 'cTime': now_ms(), 'uTime': now_ms()}]}
+
+    def _candle_rows(self, candles, symbol, query):
+        interval = query.get('interval', 'MINUTE_1')
+        limit = _int(query, 'limit', 100)
+        end_time = query.get('endTime', query.get('eT'))
+        start_time = query.get('startTime', query.get('sT'))
+        rows = candles(symbol, interval, limit, int(end_time) if end_time is not None else None)
+        if start_time is not None:
+            step = interval_ms(interval)
+            rows = [row for row in rows if row[-2] + step > int(start_time)]
+
+        return rows
+
+    def _store_order(self, body, result, id_key):
+        self._orders[result[id_key]] = dict(body, **result)
+        return result
+
+    def _cancel(self, order_id, id_key):
+        order = self._orders.pop(order_id, None) or {}
+        return {id_key: order_id, 'state': 'PENDING_CANCEL', 'code': 200, 'message': '',
+                'clientOrderId': order.get('clientOrderId', order.get('clOrdId', ''))}
+
+
+def _subscription_symbols(msg, default):
+    symbols = msg.get('symbols') or default
+    if 'all' in symbols:
+        return list(default)
+
+    return symbols
+
+
+class MockWsServer:
+    """
+    Local stand-in for the public and private websocket api, run on its own thread and event loop.  Answers
+    subscribe, unsubscribe, ping and order request events and publishes a synthetic Feed of every subscribed channel
+    and symbol at a constant rate or following a rate shape.
+
+    Attributes:
+        url (str): Base url to pass as ws_url to the websocket clients.
+        rate (float): Messages per second per connection when no shape is set, spread over its subscriptions.
+        shape (func(float)): Seconds since the first subscription to messages per second, see feed.burst, feed.ramp.
+        futures (bool): Publish futures instead of spot message formats.
+        sent (int): Number of channel messages published.
+        _send_lag (Histogram): Time from a message becoming due at the current rate to it being sent, grows when the
+                               publisher can not keep up.
+
+    Example:
+        with MockWsServer(shape=feed.burst(1000, 50000, 0.1, 1.0)) as server:
+            client = ClientPublic(on_message, ws_url=server.url)
+    """
+    def __init__(self, host='127.0.0.1', port=0, rate=1000.0, futures=False, seed=0, shape=None):
+        """
+        Args:
+            host (str, optional): Interface to listen on. Default 127.0.0.1.
+            port (int, optional): Port to listen on, 0 picks a free one. Default 0.
+            rate (float, optional): Messages per second per connection. Default 1000.
+            futures (bool, optional): Publish futures message formats. Default false.
+            seed (int, optional): Seed for generated data, the same seed replays the same feed. Default 0.
+            shape (func(float), optional): Rate shape overriding rate. Default None.
+        """
+        self.rate = rate
+        self.shape = shape
+        self.futures = futures
+        self.sent = 0
+        self._seed = seed
+        self._paused = False
+        self._stats_lock = threading.Lock()
+        self._send_lag = Histogram(_send_lag_buckets)
+        self._period_sent = 0
+        self._period_started = time.monotonic()
+        self.url = None
+        self._host = host
+        self._port = port
+        self._generator = Generator(seed)
+        self._loop = None
+        self._thread = None
+        self._stopped = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        """
+        Starts the server thread and waits until it is listening.
+        """
+        started = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(started,), daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+            self._thread.join()
+
+    def pause(self):
+        """
+        Stops publishing, e.g. to let clients drain before they disconnect.
+        """
+        self._paused = True
+
+    def resume(self):
+        self._paused = False
+
+    def publisher_stats(self, reset=False):
+        """
+        Args:
+            reset (bool, optional): Start a new measurement period after taking the stats. Default false.
+
+        Returns:
+            Json object with messages sent and their rate over the measurement period, the send lag summary (count,
+            mean, p50, p99, max in seconds) and the total number of messages sent.
+        """
+        with self._stats_lock:
+            elapsed = max(time.monotonic() - self._period_started, 1e-9)
+            stats = {
+                'sent': self._period_sent,
+                'sent_rate': self._period_sent / elapsed,
+                'send_lag': self._send_lag.summary(),
+                'total_sent': self.sent
+            }
+
+            if reset:
+                self._send_lag = Histogram(_send_lag_buckets)
+                self._period_sent = 0
+                self._period_started = time.monotonic()
+
+        return stats
+
+    def rate_at(self, elapsed_sec):
+        """
+        Returns:
+            Messages per second to publish elapsed_sec after the first subscription.
+        """
+        if self._paused:
+            return 0
+
+        return self.shape(elapsed_sec) if self.shape is not None else self.rate
+
+    def message(self, channel, symbol):
+        """
+        Returns:
+            Generated message of channel for symbol in the configured format.
+        """
+        if self.futures:
+            return self._generator.futures_message(channel, symbol)
+
+        return self._generator.spot_message(channel, symbol)
+
+    def _run(self, started):
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._serve(started))
+        self._loop.close()
+
+    async def _serve(self, started):
+        self._stopped = asyncio.Event()
+        async with websockets.serve(self._connection, self._host, self._port) as server:
+            port = next(iter(server.sockets)).getsockname()[1]
+            self.url = f'ws://{self._host}:{port}/ws/'
+            started.set()
+            await self._stopped.wait()
+
+    async def _connection(self, websocket, *args):
+        subscriptions = {}
+        publisher = asyncio.create_task(self._publish(websocket, subscriptions))
+
+        try:
+            async for raw in websocket:
+                reply = self._reply(json.loads(raw), subscriptions)
+                if reply is not None:
+                    await websocket.send(json.dumps(reply))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            publisher.cancel()
+
+    def _reply(self, msg, subscriptions):
+        event = msg.get('event')
+        default_symbols = FUTURES_SYMBOLS if self.futures else SPOT_SYMBOLS
+
+        if event == 'ping':
+            return {'event': 'pong'}
+
+        if event == 'subscribe':
+            channels = msg.get('channel', [])
+            if channels == ['auth']:
+                return {'data': {'success': True, 'ts': now_ms()}, 'channel': 'auth'}
+
+            symbols = _subscription_symbols(msg, default_symbols)
+            for channel in channels:
+                subscriptions[channel] = symbols
+
+            return {'event': 'subscribe', 'channel': channels[0] if len(channels) == 1 else channels,
+                    'symbols': msg.get('symbols')}
+
+        if event == 'unsubscribe':
+            for channel in msg.get('channel', []):
+                subscriptions.pop(channel, None)
+
+            return {'event': 'unsubscribe', 'channel': msg.get('channel'), 'symbols': msg.get('symbols')}
+
+        if event == 'unsubscribe_all':
+            subscriptions.clear()
+            return {'event': 'unsubscribe_all', 'channel': 'ALL', 'symbols': []}
+
+        if event == 'list_subscriptions':
+            return {'subscriptions': list(subscriptions)}
+
+        if event == 'createOrder':
+            return {'id': msg.get('id'), 'data': [dict(self._generator.spot_order(msg.get('params', {})),
+                                                       orderId=str(now_ms()), message='', code=0)]}
+
+        if event in ('cancelOrders', 'cancelAllOrders'):
+            params = msg.get('params', {})
+            ids = params.get('orderIds', []) + params.get('clientOrderIds', [])
+            return {'id': msg.get('id'), 'data': [{'orderId': order_id, 'clientOrderId': '', 'message': '',
+                                                   'code': 0} for order_id in ids]}
+
+        return {'event': 'error', 'message': f'Unknown event {event}'}
+
+    async def _publish(self, websocket, subscriptions):
+        """
+        Publishes the feed of the subscribed channels and symbols, sending every tick the messages that became due
+        since the last one.
+        """
+        loop = asyncio.get_running_loop()
+        feed, streams, start, last, due = None, None, None, None, 0.0
+
+        while True:
+            current = [(channel, symbol) for channel, symbols in list(subscriptions.items()) for symbol in symbols]
+            if len(current) == 0:
+                await asyncio.sleep(0.01)
+                last, due = loop.time(), 0.0
+                continue
+
+            if current != streams:
+                feed = Feed(current, self.futures, self._seed)
+                streams = current
+
+            now = loop.time()
+            if start is None:
+                start = last = now
+
+            rate = self.rate_at(now - start)
+            due += rate * (now - last)
+            last = now
+
+            if due >= 1:
+                ts = now_ms()
+                while due >= 1:
+                    await websocket.send(feed.next_frame(ts))
+                    # The oldest of the due messages became due (due - 1) / rate before now.
+                    lag = loop.time() - now + (due - 1) / rate if rate > 0 else 0.0
+                    with self._stats_lock:
+                        self._send_lag.observe(lag)
+                        self._period_sent += 1
+                    self.sent += 1
+                    due -= 1
+
+            await asyncio.sleep(_publish_tick_sec)
+
+
+def _serve_process(conn, kwargs):
+    """
+    Child process of MockWsServerProcess, runs a MockWsServer and applies the commands received on conn.
+    """
+    with MockWsServer(**kwargs) as server:
+        conn.send(server.url)
+        while True:
+            command, value = conn.recv()
+            if command == 'stop':
+                break
+
+            if command == 'rate':
+                server.rate = value
+            elif command == 'pause':
+                server.pause()
+            elif command == 'resume':
+                server.resume()
+            elif command == 'stats':
+                conn.send(server.publisher_stats(value))
+
+
+class MockWsServerProcess:
+    """
+    MockWsServer run in a child process, so publishing does not compete with the client under test for the
+    interpreter lock and a load test measures the client rather than the publisher.  Takes the arguments of
+    MockWsServer, a shape must be picklable.
+
+    Attributes:
+        url (str): Base url to pass as ws_url to the websocket clients.
+
+    Example:
+        with MockWsServerProcess(rate=5000) as server:
+            client = ClientPublic(on_message, ws_url=server.url)
+            ...
+            print(server.publisher_stats())
+    """
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._rate = kwargs.get('rate', 1000.0)
+        self._conn = None
+        self._process = None
+        self._lock = threading.Lock()
+        self.url = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        """
+        Starts the child process and waits until its server is listening.
+        """
+        context = multiprocessing.get_context('spawn')
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_serve_process, args=(child_conn, self._kwargs), daemon=True)
+        self._process.start()
+        self.url = self._conn.recv()
+
+    def stop(self):
+        if self._process is not None:
+            self._command('stop')
+            self._process.join()
+            self._process = None
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate):
+        self._rate = rate
+        self._command('rate', rate)
+
+    def pause(self):
+        self._command('pause')
+
+    def resume(self):
+        self._command('resume')
+
+    def publisher_stats(self, reset=False):
+        """
+        Returns:
+            MockWsServer.publisher_stats of the child process.
+        """
+        with self._lock:
+            self._conn.send(('stats', reset))
+            return self._conn.recv()
+
+    @property
+    def sent(self):
+        return self.publisher_stats()['total_sent']
+
+    def _command(self, command, value=None):
+        with self._lock:
+            self._conn.send((command, value))
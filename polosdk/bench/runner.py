@@ -0,0 +1,360 @@
+import asyncio
+import json
+import time
+import tracemalloc
+
+from polosdk.bench.data import FUTURES_SYMBOLS, SPOT_SYMBOLS, Generator
+from polosdk.bench.mock_server import MockRestServer, MockWsServer, MockWsServerProcess
+from polosdk.futures.rest.public import Public
+from polosdk.futures.ws.client_public import ClientPublic as FuturesClientPublic
+from polosdk.spot.rest.batch import fan_out
+from polosdk.spot.rest.client import Client
+from polosdk.spot.rest.streaming import iter_items
+from polosdk.spot.ws.client_base import subscription_frame
+from polosdk.spot.ws.client_public import ClientPublic
+from polosdk.spot.ws.metrics import StreamMetrics
+from polosdk.spot.ws.order_store import OrderStore
+
+_default_count = 1000
+_alloc_count = 200
+
+
+def _percentile(values, q):
+    if len(values) == 0:
+        return None
+
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class BenchResult:
+    """
+    Outcome of one benchmark.
+
+    Attributes:
+        name (str): Benchmark name.
+        count (int): Operations completed.
+        seconds (float): Wall time of the timed run.
+        latencies (list): Per operation seconds, empty when not measured per operation.
+        peak_kib (float): Peak traced memory of the allocation run in KiB, None when not measured.
+        extra (dict): Additional benchmark specific values.
+    """
+    def __init__(self, name, count, seconds, latencies=None, peak_kib=None, extra=None):
+        self.name = name
+        self.count = count
+        self.seconds = seconds
+        self.latencies = latencies or []
+        self.peak_kib = peak_kib
+        self.extra = extra or {}
+
+    def summary(self):
+        p50 = _percentile(self.latencies, 0.5)
+        p99 = _percentile(self.latencies, 0.99)
+        summary = {
+            'name': self.name,
+            'count': self.count,
+            'ops_per_sec': self.count / self.seconds if self.seconds > 0 else None,
+            'p50_ms': p50 * 1000 if p50 is not None else None,
+            'p99_ms': p99 * 1000 if p99 is not None else None,
+            'peak_kib': self.peak_kib
+        }
+        summary.update(self.extra)
+        return summary
+
+
+def measure(name, func, count=_default_count, alloc_count=_alloc_count):
+    """
+    Times count calls of func, then repeats up to alloc_count calls with tracemalloc to measure peak allocations.
+    Timing and allocation runs are separate because tracing slows every allocation down.
+
+    Args:
+        name (str, required): Benchmark name.
+        func (func(), required): Operation to measure.
+        count (int, optional): Timed calls. Default 1000.
+        alloc_count (int, optional): Calls traced for allocations. Default 200.
+
+    Returns:
+        BenchResult object.
+    """
+    func()
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(count):
+        call_start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - call_start)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        for _ in range(min(count, alloc_count)):
+            func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchResult(name, count, seconds, latencies, peak / 1024)
+
+
+def measure_concurrent(name, func, count=_default_count, workers=8):
+    """
+    Runs count calls of func on workers threads and reports throughput and per call latency.
+
+    Returns:
+        BenchResult object.
+    """
+    def timed(_):
+        call_start = time.perf_counter()
+        func()
+        return time.perf_counter() - call_start
+
+    start = time.perf_counter()
+    results = fan_out(timed, list(range(count)), workers)
+    seconds = time.perf_counter() - start
+
+    errors = [err for _, err in results if err is not None]
+    if len(errors) > 0:
+        raise errors[0]
+
+    return BenchResult(name, count, seconds, [latency for latency, _ in results], extra={'workers': workers})
+
+
+def bench_rest(count=_default_count, latency_sec=0.0):
+    """
+    Benchmarks Request and the endpoint classes against MockRestServer.
+
+    Args:
+        count (int, optional): Requests per benchmark. Default 1000.
+        latency_sec (float, optional): Delay the mock server adds per response. Default 0.
+
+    Returns:
+        List of BenchResult objects.
+    """
+    with MockRestServer(latency_sec=latency_sec) as server:
+        client = Client('key', 'secret', url=server.url)
+        markets = client.markets()
+        orders = client.orders()
+        public = Public(url=server.url)
+
+        return [
+            measure('rest.get_timestamp', client.get_timestamp, count),
+            measure('rest.get_ticker24h_all', markets.get_ticker24h_all, count),
+            measure('rest.get_candles_500', lambda: markets.get_candles('BTC_USDT', 'MINUTE_1', limit=500), count),
+            measure('rest.stream_candles_500',
+                    lambda: sum(1 for _ in markets.stream_candles('BTC_USDT', 'MINUTE_1', limit=500)), count),
+            measure('rest.get_orderbook_150', lambda: markets.get_orderbook('BTC_USDT', limit=150), count),
+            measure('rest.create_order_signed',
+                    lambda: orders.create(symbol='BTC_USDT', side='BUY', type='LIMIT', price='40000',
+                                          quantity='0.001'), count),
+            measure('rest.futures_order_book', lambda: public.get_order_book('BTC_USDT_PERP', limit=100), count),
+            measure_concurrent('rest.get_timestamp_concurrent', client.get_timestamp, count)
+        ]
+
+
+def bench_parsers(count=_default_count):
+    """
+    Benchmarks response and message parsing without any network.
+
+    Returns:
+        List of BenchResult objects.
+    """
+    generator = Generator()
+    candles = json.dumps(generator.spot_candles('BTC_USDT', 'MINUTE_1', 500)).encode()
+    chunks = [candles[i:i + 65536] for i in range(0, len(candles), 65536)]
+    trade = json.dumps(generator.spot_message('trades', 'BTC_USDT'))
+    book = json.dumps(generator.spot_message('book_lv2', 'BTC_USDT'))
+    store = OrderStore()
+    order = generator.spot_message('orders', 'BTC_USDT')
+    channels = ['book_lv2', 'trades']
+
+    return [
+        measure('parse.json_loads_candles_500', lambda: json.loads(candles), count),
+        measure('parse.iter_items_candles_500', lambda: sum(1 for _ in iter_items(chunks)), count),
+        measure('parse.ws_trade', lambda: json.loads(trade), count * 10),
+        measure('parse.ws_book_lv2', lambda: json.loads(book), count * 10),
+        measure('ws.subscription_frame', lambda: subscription_frame('subscribe', channels, SPOT_SYMBOLS), count * 10),
+        measure('ws.order_store_apply', lambda: store.apply(order), count * 10)
+    ]
+
+
+async def _listen(client_class, server, channels, symbols, duration_sec):
+    received = [0]
+
+    def on_message(msg):
+        received[0] += 1
+
+    metrics = StreamMetrics()
+    client = client_class(on_message, ws_url=server.url, metrics=metrics)
+    await client.connect()
+    await client.subscribe(channels, symbols)
+
+    await asyncio.sleep(duration_sec)
+    count, snapshot = received[0], metrics.snapshot()
+
+    # Stop publishing and let the client drain first, a client that stops reading while the server keeps sending
+    # can not complete the close handshake and waits for the close timeout.
+    server.pause()
+    await asyncio.sleep(0.1)
+    await client.disconnect()
+    return count, snapshot
+
+
+def bench_listen(rate=5000.0, duration_sec=3.0, futures=False):
+    """
+    Benchmarks ClientBase.listen with StreamMetrics attached against MockWsServer publishing at rate.
+
+    Args:
+        rate (float, optional): Messages per second the server publishes. Default 5000.
+        duration_sec (float, optional): Seconds to listen. Default 3.
+        futures (bool, optional): Use the futures client and message formats. Default false.
+
+    Returns:
+        BenchResult object, latencies are not measured per message, decode and handler p99 come from StreamMetrics.
+    """
+    if futures:
+        client_class, channels, symbols = FuturesClientPublic, ['trades', 'book_lv2'], list(FUTURES_SYMBOLS)
+    else:
+        client_class, channels, symbols = ClientPublic, ['trades', 'book_lv2'], list(SPOT_SYMBOLS)
+
+    with MockWsServer(rate=rate, futures=futures) as server:
+        received, snapshot = asyncio.run(_listen(client_class, server, channels, symbols, duration_sec))
+        sent = server.sent
+
+    decode_p99 = snapshot['decode']['p99']
+    handler_p99 = snapshot['handler']['p99']
+    return BenchResult(f'ws.listen_{"futures" if futures else "spot"}', received, snapshot['elapsed_sec'], extra={
+        'target_rate': rate,
+        'sent': sent,
+        'decode_p99_ms': decode_p99 * 1000 if decode_p99 is not None else None,
+        'handler_p99_ms': handler_p99 * 1000 if handler_p99 is not None else None,
+        'max_queue_depth': snapshot['max_queue_depth']
+    })
+
+
+class LoadTestResult:
+    """
+    Outcome of a load test.
+
+    Attributes:
+        steps (list): Json objects per tested rate with target, sent and received rate, client lag p99, publisher send
+                      lag p99 and max queue depth.
+        max_sustainable_rate (float): Highest target rate received in full without lag growing, None if none was.
+    """
+    def __init__(self, steps, max_sustainable_rate):
+        self.steps = steps
+        self.max_sustainable_rate = max_sustainable_rate
+
+
+async def _load_test(client_class, server, channels, symbols, rates, step_sec, settle_sec, max_lag_sec,
+                     min_received, handler):
+    metrics = StreamMetrics()
+    client = client_class(handler, ws_url=server.url, metrics=metrics)
+    await client.connect()
+    await client.subscribe(channels, symbols)
+
+    steps = []
+    max_sustainable_rate = None
+    try:
+        for rate in rates:
+            server.rate = rate
+            await asyncio.sleep(settle_sec)
+            metrics.reset()
+            server.publisher_stats(reset=True)
+            await asyncio.sleep(step_sec)
+            snapshot = metrics.snapshot()
+            publisher = server.publisher_stats()
+
+            received = sum(stream['messages'] for stream in snapshot['streams'].values())
+            received_rate = received / snapshot['elapsed_sec']
+            lag_p99 = snapshot['lag']['p99']
+            send_lag_p99 = publisher['send_lag']['p99']
+            sustainable = received_rate >= min_received * rate and lag_p99 is not None and lag_p99 <= max_lag_sec
+            steps.append({
+                'target_rate': rate,
+                'sent_rate': publisher['sent_rate'],
+                'received_rate': received_rate,
+                'lag_p99_ms': lag_p99 * 1000 if lag_p99 is not None else None,
+                'send_lag_p99_ms': send_lag_p99 * 1000 if send_lag_p99 is not None else None,
+                'handler_p99_ms': snapshot['handler']['p99'] * 1000 if snapshot['handler']['p99'] else None,
+                'max_queue_depth': snapshot['max_queue_depth'],
+                'publisher_limited': publisher['sent_rate'] < min_received * rate,
+                'sustainable': sustainable
+            })
+
+            if not sustainable:
+                break
+
+            max_sustainable_rate = rate
+    finally:
+        server.pause()
+        await asyncio.sleep(0.1)
+        await client.disconnect()
+
+    return LoadTestResult(steps, max_sustainable_rate)
+
+
+def load_test(start_rate=1000.0, max_rate=200000.0, factor=1.5, step_sec=2.0, settle_sec=0.5, max_lag_sec=0.05,
+              min_received=0.95, futures=False, handler=None):
+    """
+    Finds the highest book_lv2 and trades message rate ClientBase.listen plus a handler keeps up with.  The rate is
+    raised by factor per step until the client receives less than min_received of the published messages or the
+    p99 lag between the ts stamped at publish time and receive time exceeds max_lag_sec.
+
+    The mock server runs in a child process so it does not compete with the client for the interpreter lock.  Each
+    step reports the publisher's sent rate and send lag next to the client's received rate and lag, a step where the
+    publisher falls behind its target rate is flagged publisher_limited and says nothing about the client.
+
+    Args:
+        start_rate (float, optional): First rate in messages per second. Default 1000.
+        max_rate (float, optional): Highest rate tried. Default 200000.
+        factor (float, optional): Rate increase per step. Default 1.5.
+        step_sec (float, optional): Measurement time per step. Default 2 seconds.
+        settle_sec (float, optional): Time after each rate change that is not measured. Default 0.5 seconds.
+        max_lag_sec (float, optional): Highest acceptable p99 lag. Default 50ms.
+        min_received (float, optional): Lowest acceptable fraction of the rate received. Default 0.95.
+        futures (bool, optional): Use the futures client and message formats. Default false.
+        handler (func(dict), optional): on_message handler under test. Default a no-op.
+
+    Returns:
+        LoadTestResult object.
+    """
+    if futures:
+        client_class, channels, symbols = FuturesClientPublic, ['trades', 'book_lv2'], list(FUTURES_SYMBOLS)
+    else:
+        client_class, channels, symbols = ClientPublic, ['trades', 'book_lv2'], list(SPOT_SYMBOLS)
+
+    rates = []
+    rate = start_rate
+    while rate <= max_rate:
+        rates.append(rate)
+        rate *= factor
+
+    with MockWsServerProcess(rate=0, futures=futures) as server:
+        return asyncio.run(_load_test(client_class, server, channels, symbols, rates, step_sec, settle_sec,
+                                      max_lag_sec, min_received, handler or (lambda msg: None)))
+
+
+def format_results(results):
+    """
+    Returns:
+        Results as a text table.
+    """
+    columns = ('name', 'count', 'ops_per_sec', 'p50_ms', 'p99_ms', 'peak_kib')
+    rows = [columns]
+    for result in results:
+        summary = result.summary()
+        rows.append(tuple(_format_value(summary.get(column)) for column in columns))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    return '\n'.join('  '.join(value.ljust(width) for value, width in zip(row, widths)) for row in rows)
+
+
+def _format_value(value):
+    if value is None:
+        return '-'
+
+    if isinstance(value, float):
+        return f'{value:.3f}' if value < 100 else f'{value:.0f}'
+
+    return str(value)
@@ -0,0 +1,264 @@
+import os
+import tempfile
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError('Funding history loading requires numpy, install it with: pip install numpy')
+
+from polosdk.spot.rest.batch import RateLimiter, fan_out
+
+# 资金费率历史每页最多 100 条
+_page_limit = 100
+_default_max_workers = 8
+_default_rate_limit = 20
+
+
+def _data(response):
+    return response.get('data') if isinstance(response, dict) else response
+
+
+class FundingHistory:
+    """
+    Funding rates of several perpetuals aligned on the union of their funding times.
+
+    Attributes:
+        symbols (list): Symbol of each row.
+        times (numpy.ndarray): Funding times in ms since epoch, ascending.
+        rates (numpy.ndarray): Funding rates, shape (symbols, times), nan where a symbol has no funding at a time.
+    """
+    def __init__(self, symbols, series):
+        """
+        Args:
+            symbols (list, required): Symbol names.
+            series (list, required): (times, rates) arrays per symbol.
+        """
+        self.symbols = list(symbols)
+        self.times = np.unique(np.concatenate([times for times, _ in series])) if len(series) > 0 else \
+            np.empty(0, dtype=np.int64)
+        self.rates = np.full((len(self.symbols), len(self.times)), np.nan)
+        for row, (times, rates) in enumerate(series):
+            self.rates[row, np.searchsorted(self.times, times)] = rates
+
+        self._index = {symbol: index for index, symbol in enumerate(self.symbols)}
+
+    def series(self, symbol):
+        """
+        Returns:
+            (times, rates) arrays of one symbol without gaps.
+        """
+        rates = self.rates[self._index[symbol]]
+        present = ~np.isnan(rates)
+        return self.times[present], rates[present]
+
+    def cumulative(self):
+        """
+        Returns:
+            Running sum of funding per symbol, shape (symbols, times), missing times add nothing.
+        """
+        return np.nancumsum(self.rates, axis=1)
+
+
+class FundingLoader:
+    """
+    Bulk loader of funding rate history and open interest snapshots for futures perpetuals.  Histories of all symbols
+    are paged through concurrently within a rate limit and kept in a local columnar cache, one .npz file per symbol
+    holding the funding times and the earliest time already fetched, so later loads only fetch funding times outside
+    the cached range.
+
+    The exchange only serves current open interest, snapshot_open_interest appends it to the cache on every call so a
+    history builds up when it is called periodically.
+
+    Attributes:
+        _public (Public): Futures public endpoints.
+        _cache_dir (str): Cache directory, None to keep nothing on disk.
+
+    Example:
+        loader = FundingLoader(Public(), cache_dir='cache')
+        history = loader.load(start_ms=start)
+        print(history.symbols, history.cumulative()[:, -1])
+    """
+    def __init__(self, public, cache_dir=None, max_workers=_default_max_workers, rate_limit=_default_rate_limit):
+        """
+        Args:
+            public (Public, required): Futures public endpoints.
+            cache_dir (str, optional): Directory of the cache, created if missing. Default no cache.
+            max_workers (int, optional): Maximum requests in flight. Default 8.
+            rate_limit (float or RateLimiter, optional): Requests started per second, None for no limit. Default 20.
+        """
+        self._public = public
+        self._cache_dir = cache_dir
+        self._max_workers = max_workers
+        self._limiter = rate_limit if rate_limit is None or isinstance(rate_limit, RateLimiter) else \
+            RateLimiter(rate_limit)
+
+    def perpetual_symbols(self):
+        """
+        Returns:
+            Sorted list of perpetual symbols from the tickers.
+        """
+        tickers = _data(self._public.get_narket_info()) or []
+        return sorted(ticker['s'] for ticker in tickers if ticker.get('s', '').endswith('_PERP'))
+
+    def load(self, symbols=None, start_ms=None, end_ms=None, update=True):
+        """
+        Loads funding history, from the cache and the exchange.
+
+        Args:
+            symbols (str[], optional): Symbols to load. Default every perpetual.
+            start_ms (int, optional): Earliest funding time in ms since epoch. Default the full history.
+            end_ms (int, optional): Latest funding time in ms since epoch. Default now.
+            update (bool, optional): Fetch funding times newer than the cache, false to use the cache only. Default
+                                     true.
+
+        Returns:
+            FundingHistory object.
+
+        Raises:
+            RequestError: Fetching a symbol failed, the cache of other symbols is still updated.
+        """
+        symbols = list(symbols) if symbols is not None else self.perpetual_symbols()
+        results = fan_out(lambda symbol: self._load_symbol(symbol, start_ms, end_ms, update), symbols,
+                          self._max_workers)
+
+        series = []
+        for result, err in results:
+            if err is not None:
+                raise err
+            series.append(result)
+
+        return FundingHistory(symbols, series)
+
+    def snapshot_open_interest(self, symbols=None):
+        """
+        Fetches current open interest and appends it to the cache.
+
+        Args:
+            symbols (str[], optional): Symbols to fetch. Default every perpetual.
+
+        Returns:
+            Dictionary of symbol to open interest.
+        """
+        symbols = list(symbols) if symbols is not None else self.perpetual_symbols()
+        results = fan_out(self._fetch_open_interest, symbols, self._max_workers, self._limiter)
+
+        snapshot = {}
+        for symbol, (result, err) in zip(symbols, results):
+            if err is not None:
+                raise err
+
+            snapshot[symbol] = result
+            if self._cache_dir is not None:
+                times, values = self._read('open_interest', symbol, 'ts', 'oInterest')
+                self._write('open_interest', symbol, ts=np.append(times, int(time.time() * 1000)),
+                            oInterest=np.append(values, result))
+
+        return snapshot
+
+    def open_interest_history(self, symbols):
+        """
+        Returns:
+            Dictionary of symbol to (times, open interest) arrays collected by snapshot_open_interest.
+        """
+        return {symbol: self._read('open_interest', symbol, 'ts', 'oInterest') for symbol in symbols}
+
+    def _load_symbol(self, symbol, start_ms, end_ms, update):
+        cached = self._read_cache('funding', symbol)
+        times = cached.get('fT', np.empty(0, dtype=np.int64))
+        rates = cached.get('fR', np.empty(0, dtype=np.float64))
+
+        if update:
+            # 缓存记录已拉取的最早时间, 只拉取缓存之后的新数据, 以及请求的起点早于已拉取范围时缺少的旧数据
+            wanted = start_ms or 0
+            since = int(cached['since']) if 'since' in cached else (int(times[0]) if len(times) > 0 else None)
+            ranges = [(int(times[-1]) + 1 if len(times) > 0 else wanted, end_ms)]
+            if since is not None and len(times) > 0 and wanted < since:
+                ranges.append((wanted, since - 1))
+
+            fetched = [self._fetch_funding(symbol, first, last) for first, last in ranges]
+            found = sum(len(new_times) for new_times, _ in fetched) > 0
+            if found:
+                times, unique = np.unique(np.concatenate([times] + [new_times for new_times, _ in fetched]),
+                                          return_index=True)
+                rates = np.concatenate([rates] + [new_rates for _, new_rates in fetched])[unique]
+
+            covered = min(since, wanted) if since is not None else wanted
+            if found or covered != since:
+                self._write('funding', symbol, fT=times, fR=rates, since=np.int64(covered))
+
+        keep = np.ones(len(times), dtype=bool)
+        if start_ms is not None:
+            keep &= times >= start_ms
+        if end_ms is not None:
+            keep &= times <= end_ms
+
+        return times[keep], rates[keep]
+
+    def _fetch_funding(self, symbol, start_ms, end_ms):
+        """
+        Pages backwards from end_ms to start_ms, the exchange returns the newest funding first.
+        """
+        end = end_ms if end_ms is not None else int(time.time() * 1000)
+        times, rates = [], []
+
+        while end >= start_ms:
+            if self._limiter is not None:
+                self._limiter.acquire()
+
+            page = _data(self._public.get_history_funding_rate(symbol=symbol, sT=start_ms, eT=end,
+                                                                limit=_page_limit)) or []
+            if len(page) == 0:
+                break
+
+            page_times = [int(item['fT']) for item in page]
+            times.extend(page_times)
+            rates.extend(float(item['fR']) for item in page)
+
+            if len(page) < _page_limit:
+                break
+            end = min(page_times) - 1
+
+        times = np.asarray(times, dtype=np.int64)
+        rates = np.asarray(rates, dtype=np.float64)
+        order = np.argsort(times, kind='stable')
+        return times[order], rates[order]
+
+    def _fetch_open_interest(self, symbol):
+        data = _data(self._public.get_current_open_positions(symbol))
+        item = data[0] if isinstance(data, list) else data
+        return float(item['oInterest'])
+
+    def _path(self, kind, symbol):
+        return os.path.join(self._cache_dir, kind, f'{symbol}.npz')
+
+    def _read_cache(self, kind, symbol):
+        if self._cache_dir is not None and os.path.exists(self._path(kind, symbol)):
+            with np.load(self._path(kind, symbol)) as cached:
+                return {key: cached[key] for key in cached.files}
+
+        return {}
+
+    def _read(self, kind, symbol, time_key, value_key):
+        cached = self._read_cache(kind, symbol)
+        if time_key in cached:
+            return cached[time_key], cached[value_key]
+
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    def _write(self, kind, symbol, **arrays):
+        if self._cache_dir is None:
+            return
+
+        path = self._path(kind, symbol)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 先写同目录下唯一的临时文件再替换, 中断或并发写入不会留下损坏的缓存
+        handle, temp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path))
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                np.savez(file, **arrays)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
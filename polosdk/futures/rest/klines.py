@@ -0,0 +1,136 @@
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError('K-line loading requires numpy, install it with: pip install numpy')
+
+from polosdk.futures.ws.channels import CANDLE_INTERVALS
+from polosdk.spot.rest.batch import RateLimiter, fan_out
+from polosdk.spot.ws.channels import CANDLE_INTERVAL_MS
+
+# series: (Public method, column prefix)
+SERIES = {
+    'candles': ('get_k_line_data', ''),
+    'index': ('get_index_price_k_line_data', 'index_'),
+    'mark': ('get_mark_price_k_line_data', 'mark_'),
+    'premium': ('get_premium_index_price_k_line_data', 'premium_')
+}
+# 每次请求最多返回 500 根 K 线
+_page_limit = 500
+_default_max_workers = 8
+_default_rate_limit = 20
+_price_fields = ('low', 'high', 'open', 'close')
+_volume_fields = ('amount', 'quantity')
+
+
+def _data(response):
+    return response.get('data') if isinstance(response, dict) else response
+
+
+def _windows(start_ms, end_ms, length):
+    """
+    Splits a time range into consecutive windows of at most one page of candles each, starting early enough to include
+    the candle open at start_ms.
+    """
+    span = length * _page_limit
+    return [(since, min(since + span, end_ms + 1) - 1) for since in range(start_ms - length + 1, end_ms + 1, span)]
+
+
+def load_klines(public, symbol, interval, start_ms, end_ms=None, series=tuple(SERIES),
+                max_workers=_default_max_workers, rate_limit=_default_rate_limit):
+    """
+    Loads candles, index, mark and premium index k-lines of a symbol and aligns them on their start times.  The range
+    is split into pages up front and every page of every series is fetched concurrently.
+
+    Args:
+        public (Public, required): Futures public endpoints.
+        symbol (str, required): Symbol name e.g. BTC_USDT_PERP.
+        interval (str, required): One of CANDLE_INTERVALS.
+        start_ms (int, required): Start of the range in ms since epoch.
+        end_ms (int, optional): End of the range in ms since epoch. Default now.
+        series (tuple, optional): Keys of SERIES to load. Default all four.
+        max_workers (int, optional): Maximum requests in flight. Default 8.
+        rate_limit (float or RateLimiter, optional): Requests started per second, None for no limit. Default 20.
+
+    Returns:
+        Dictionary of columns as numpy arrays of equal length, one row per start time found in any series:
+            {
+                'startTime': (int64) Start of the interval, ascending,
+                'low', 'high', 'open', 'close', 'amount', 'quantity': (float64) Trade candles,
+                'tradeCount': (int64) Trade candles, 0 when missing,
+                'index_low', ..., 'index_close': (float64) Index price k-lines,
+                'mark_low', ..., 'mark_close': (float64) Mark price k-lines,
+                'premium_low', ..., 'premium_close': (float64) Premium index k-lines
+            }
+        Only the columns of the loaded series are present, float values missing from a series are nan.
+
+    Raises:
+        ValueError: Interval or series is not supported.
+        RequestError: A page failed to load.
+
+    Example:
+        frame = load_klines(Public(), 'BTC_USDT_PERP', 'MINUTE_5', start_ms, end_ms)
+        basis = frame['close'] - frame['index_close']
+    """
+    if interval not in CANDLE_INTERVALS:
+        raise ValueError(f'interval must be one of {", ".join(CANDLE_INTERVALS)}')
+
+    unknown = [name for name in series if name not in SERIES]
+    if len(unknown) > 0:
+        raise ValueError(f'series must be any of {", ".join(SERIES)}')
+
+    end_ms = end_ms if end_ms is not None else int(time.time() * 1000)
+    length = CANDLE_INTERVAL_MS[interval]
+    limiter = rate_limit if rate_limit is None or isinstance(rate_limit, RateLimiter) else RateLimiter(rate_limit)
+    pages = [(name, since, until) for name in series
+             for since, until in _windows(start_ms, end_ms, length)]
+
+    def fetch(page):
+        name, since, until = page
+        method = getattr(public, SERIES[name][0])
+        return _data(method(symbol, interval, sT=since, eT=until, limit=_page_limit)) or []
+
+    rows = {name: [] for name in series}
+    for (name, _, _), (result, err) in zip(pages, fan_out(fetch, pages, max_workers, limiter)):
+        if err is not None:
+            raise err
+        rows[name].extend(result)
+
+    parsed = {name: _parse(rows[name], name == 'candles', start_ms - length + 1, end_ms) for name in series}
+    index = np.unique(np.concatenate([columns['startTime'] for columns in parsed.values()])) if len(parsed) > 0 \
+        else np.empty(0, dtype=np.int64)
+
+    frame = {'startTime': index}
+    for name, columns in parsed.items():
+        positions = np.searchsorted(index, columns['startTime'])
+        for field, values in columns.items():
+            if field == 'startTime':
+                continue
+
+            aligned = np.zeros(len(index), dtype=values.dtype) if values.dtype == np.int64 else \
+                np.full(len(index), np.nan)
+            aligned[positions] = values
+            frame[SERIES[name][1] + field] = aligned
+
+    return frame
+
+
+def _parse(rows, volumes, start_ms, end_ms):
+    """
+    Converts k-line rows to columns sorted by start time without duplicates.  Rows begin with low, high, open, close
+    and end with start and close time, trade candles hold amount, quantity and trade count in between.  Only candles
+    starting within start_ms and end_ms are kept.
+    """
+    columns = {'startTime': np.asarray([row[-2] for row in rows], dtype=np.int64)}
+    for position, field in enumerate(_price_fields):
+        columns[field] = np.asarray([row[position] for row in rows], dtype=np.float64)
+
+    if volumes:
+        for position, field in enumerate(_volume_fields, start=len(_price_fields)):
+            columns[field] = np.asarray([row[position] for row in rows], dtype=np.float64)
+        columns['tradeCount'] = np.asarray([row[6] for row in rows], dtype=np.int64)
+
+    start_time, unique = np.unique(columns['startTime'], return_index=True)
+    keep = (start_time >= start_ms) & (start_time <= end_ms)
+    return {field: values[unique][keep] for field, values in columns.items()}
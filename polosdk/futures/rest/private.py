@@ -1,10 +1,32 @@
 from pyclbr import Class
 
 from polosdk.futures.rest.request import Request
+from polosdk.spot.rest import batch
+
+_max_batch_orders = 10
 
 class Private:
-    def __init__(self, api_key, api_secret, url=None):
-        self._request = Request(api_key, api_secret, url)
+    def __init__(self, api_key, api_secret, url=None, validator=None, warmup_connections=0, **kwargs):
+        self._request = Request(api_key, api_secret, url, **kwargs)
+        self._validator = validator
+
+        # 预热连接, 避免首单承担DNS/TCP/TLS开销
+        if warmup_connections > 0:
+            self.warmup(warmup_connections)
+
+    def warmup(self, connections=4, keep_alive_sec=None):
+        """
+        Resolves the host and opens pooled connections ahead of time, see Request.warmup.
+
+        Args:
+            connections (int, optional): Number of connections to open. Default 4.
+            keep_alive_sec (float, optional): When set, keeps the connections open with a /timestamp request per
+                                              connection at this interval. Default None.
+
+        Returns:
+            Number of connections opened successfully.
+        """
+        return self._request.warmup(connections, keep_alive_sec)
 
     def get_account_balance(self):
         return self._request('GET',f'/v3/account/balance', True)
@@ -36,6 +58,9 @@ class Private:
         if px and order_type in ['LIMIT', 'LIMIT_MAKER']:
             order_data['px'] = px
 
+        if self._validator is not None:
+            self._validator.validate(order_data)
+
         # 发送请求
         return self._request('POST', '/v3/trade/order', True, body=order_data)
 
@@ -45,24 +70,60 @@ class Private:
             raise ValueError("orders must be a non-empty list")
 
         for order in orders:
-            if not isinstance(order, dict):
-                raise ValueError("Each order must be a dictionary")
-            if 'symbol' not in order:
-                raise ValueError("Each order must have a 'symbol'")
-            if 'side' not in order or order['side'] not in ['BUY', 'SELL']:
-                raise ValueError("Each order must have a 'side' and it must be 'BUY' or 'SELL'")
-            if 'type' not in order or order['type'] not in ['MARKET', 'LIMIT', 'LIMIT_MAKER']:
-                raise ValueError("Each order must have a 'type' and it must be 'MARKET', 'LIMIT', or 'LIMIT_MAKER'")
-            if 'sz' not in order:
-                raise ValueError("Each order must have a 'sz' (size)")
-            if 'mgnMode' not in order:
-                raise ValueError("Each order must have a 'mgnMode'")
-            if 'posSide' not in order:
-                raise ValueError("Each order must have a 'posSide'")
+            self._check_order(order)
 
         # 发送请求
         return self._request('POST', '/v3/trade/orders', True, body=orders)
 
+    def place_batch_orders(self, orders, max_workers=None):
+        # 任意数量的订单按每批 10 个拆分并发发送，结果按输入顺序合并，单个订单的错误以 {'code', 'msg'} 返回
+        if not isinstance(orders, list):
+            raise ValueError("orders must be a list")
+
+        results = [None] * len(orders)
+        pending = []
+        for index, order in enumerate(orders):
+            try:
+                self._check_order(order)
+            except ValueError as err:
+                results[index] = batch.error_item(err, 'msg')
+                continue
+            pending.append((index, order))
+
+        def send(chunk):
+            return self._request('POST', '/v3/trade/orders', True, body=[order for _, order in chunk])
+
+        chunks = batch.chunked(pending, _max_batch_orders)
+        for chunk, (response, err) in zip(chunks, batch.fan_out(send, chunks, max_workers)):
+            data = response.get('data') if isinstance(response, dict) else response
+            for position, (index, _) in enumerate(chunk):
+                if err is not None:
+                    results[index] = batch.error_item(err, 'msg')
+                elif isinstance(data, list) and position < len(data):
+                    results[index] = data[position]
+                else:
+                    results[index] = batch.error_item(RuntimeError('Missing result for order in batch response'), 'msg')
+
+        return results
+
+    def _check_order(self, order):
+        if not isinstance(order, dict):
+            raise ValueError("Each order must be a dictionary")
+        if 'symbol' not in order:
+            raise ValueError("Each order must have a 'symbol'")
+        if 'side' not in order or order['side'] not in ['BUY', 'SELL']:
+            raise ValueError("Each order must have a 'side' and it must be 'BUY' or 'SELL'")
+        if 'type' not in order or order['type'] not in ['MARKET', 'LIMIT', 'LIMIT_MAKER']:
+            raise ValueError("Each order must have a 'type' and it must be 'MARKET', 'LIMIT', or 'LIMIT_MAKER'")
+        if 'sz' not in order:
+            raise ValueError("Each order must have a 'sz' (size)")
+        if 'mgnMode' not in order:
+            raise ValueError("Each order must have a 'mgnMode'")
+        if 'posSide' not in order:
+            raise ValueError("Each order must have a 'posSide'")
+        if self._validator is not None:
+            self._validator.validate(order)
+
 
     def cancel_order(self, symbol, **kwargs):
         if symbol is None:
@@ -87,11 +148,37 @@ class Private:
         if clOrdIds is not None and ordIds is None:
             body['clOrdIds'] = clOrdIds
 
-        print(body)
-
         # 发送请求，使用 body 传递参数
         return self._request('DELETE', '/v3/trade/batchOrders', True, body=body)
 
+    def cancel_batch_orders(self, ordIds=None, clOrdIds=None, max_workers=None):
+        # ordIds / clOrdIds 为 {symbol: [id, ...]}，按交易对和每批 10 个拆分并发撤单，结果合并为一个列表
+        if not ordIds and not clOrdIds:
+            raise ValueError("Either ordIds or clOrdIds must be provided")
+
+        bodies = []
+        for ids_key, id_key, ids_by_symbol in (('ordIds', 'ordId', ordIds), ('clOrdIds', 'clOrdId', clOrdIds)):
+            for symbol, ids in (ids_by_symbol or {}).items():
+                for chunk in batch.chunked(list(ids), _max_batch_orders):
+                    bodies.append((id_key, symbol, chunk, {'symbol': symbol, ids_key: chunk}))
+
+        def send(body):
+            return self._request('DELETE', '/v3/trade/batchOrders', True, body=body[3])
+
+        results = []
+        for (id_key, symbol, chunk, _), (response, err) in zip(bodies, batch.fan_out(send, bodies, max_workers)):
+            if err is None:
+                data = response.get('data') if isinstance(response, dict) else response
+                results.extend(data or [])
+                continue
+
+            for item_id in chunk:
+                item = batch.error_item(err, 'msg')
+                item.update({'symbol': symbol, id_key: item_id})
+                results.append(item)
+
+        return results
+
     def cancel_all_order(self, **kwargs):
         params = {}
         params.update(kwargs)
@@ -189,7 +276,12 @@ class Private:
         params.update({'lever': lever})
         params.update({'mgnMode': mgnMode})
         params.update({'posSide': posSide})
-        return self._request('POST', '/v3/position/leverage', True, body=params)
+        if self._validator is not None:
+            self._validator.validate_leverage(symbol, lever)
+        response = self._request('POST', '/v3/position/leverage', True, body=params)
+        if self._validator is not None:
+            self._validator.set_leverage(symbol, lever)
+        return response
 
     def set_position_mode(self, posMode):
         if posMode is None:
@@ -1,13 +1,37 @@
 from polosdk.futures.rest.request import Request
 
+# 公共行情接口每秒请求上限
+_default_book_rate_limit = 200
+
 
 class Public:
-    def __init__(self, url=None):
+    def __init__(self, url=None, warmup_connections=0, **kwargs):
         """
         Args:
             url (str, optional): Url for endpoints, default is set to PROD in Request class.
+            warmup_connections (int, optional): Number of connections opened at construction, see warmup. Default 0.
+
+        Keyword Args:
+            Forwarded to Request e.g. session, single_flight, http2.
+        """
+        self._request = Request(url=url, **kwargs)
+
+        if warmup_connections > 0:
+            self.warmup(warmup_connections)
+
+    def warmup(self, connections=4, keep_alive_sec=None):
+        """
+        Resolves the host and opens pooled connections ahead of time, see Request.warmup.
+
+        Args:
+            connections (int, optional): Number of connections to open. Default 4.
+            keep_alive_sec (float, optional): When set, keeps the connections open with a /timestamp request per
+                                              connection at this interval. Default None.
+
+        Returns:
+            Number of connections opened successfully.
         """
-        self._request = Request(url=url)
+        return self._request.warmup(connections, keep_alive_sec)
 
     def get_order_book(self,symbol,**kwargs):
         if symbol is None:
@@ -17,6 +41,24 @@ class Public:
         params.update({'symbol': symbol})
         return self._request('GET', '/v3/market/orderBook', params=params)
 
+    def get_order_books(self, symbols, limit=10, max_workers=None, rate_limit=_default_book_rate_limit):
+        """
+        Get the order books of many symbols concurrently, see the spot Markets.get_orderbooks.  Needs numpy.
+
+        Args:
+            symbols (str[], required): Symbol names.
+            limit (int, optional): Levels per side. Default 10.
+            max_workers (int, optional): Maximum requests in flight. Default 32.
+            rate_limit (float or RateLimiter, optional): Requests started per second, None for no limit. Default 200.
+
+        Returns:
+            book_snapshot.BookSnapshot object.
+        """
+        from polosdk.spot.rest.book_snapshot import fetch_books, rate_limiter
+
+        return fetch_books(lambda symbol: self.get_order_book(symbol, limit=limit), symbols, limit,
+                           max_workers=max_workers, limiter=rate_limiter(rate_limit))
+
     def get_k_line_data(self,symbol,interval,**kwargs):
         if symbol is None or interval is None:
             raise ValueError("symbol or interval is need")
@@ -0,0 +1,149 @@
+from decimal import Decimal
+
+from polosdk.spot.rest.validation import OrderValidationError, to_decimal
+
+_sides = ('BUY', 'SELL')
+_types = ('MARKET', 'LIMIT', 'LIMIT_MAKER')
+_limit_types = ('LIMIT', 'LIMIT_MAKER')
+
+
+class OrderValidator:
+    """
+    Optional pre-trade checks for futures orders run locally before an order is sent.  Checks side and type, size
+    against minSz, maxSz and lotSz, price against tickSz, leverage against maxLever, and required margin against
+    available margin when an account cache and the symbol's leverage are known.
+
+    Attributes:
+        _instruments (dict): Symbol to instrument reference data.
+        _account (AccountCache): Account state used for available margin checks.
+        _leverage (dict): Symbol to leverage last set through Private.set_leverge.
+
+    Example:
+        validator = OrderValidator(public.get_product_info('BTC_USDT_PERP'), account=cache)
+        private = Private(api_key, api_secret, validator=validator)
+    """
+    def __init__(self, instruments, account=None):
+        """
+        Args:
+            instruments (dict or list, required): Response of Public.get_product_info() or its 'data' list.
+            account (AccountCache, optional): Account cache used for available margin checks.
+        """
+        self._instruments = {}
+        self._account = account
+        self._leverage = {}
+        self.update_instruments(instruments)
+
+    def update_instruments(self, instruments):
+        """
+        Replaces or adds instrument reference data.
+
+        Args:
+            instruments (dict or list, required): Response of Public.get_product_info() or its 'data' list.
+        """
+        if isinstance(instruments, dict):
+            instruments = instruments.get('data', [instruments])
+
+        if isinstance(instruments, dict):
+            instruments = [instruments]
+
+        for instrument in instruments:
+            self._instruments[instrument['symbol']] = instrument
+
+    def set_leverage(self, symbol, lever):
+        """
+        Records the leverage in use for a symbol, used for margin checks.
+
+        Args:
+            symbol (str, required): Symbol e.g. BTC_USDT_PERP.
+            lever (int, required): Leverage.
+        """
+        self._leverage[symbol] = Decimal(str(lever))
+
+    def validate_leverage(self, symbol, lever):
+        """
+        Raises:
+            OrderValidationError: Leverage is not positive or exceeds maxLever of the symbol.
+        """
+        instrument = self._instrument(symbol)
+        lever = to_decimal(symbol, 'lever', lever)
+
+        if lever <= 0:
+            raise OrderValidationError(symbol, 'lever must be positive')
+
+        max_lever = instrument.get('maxLever')
+        if max_lever is not None and lever > Decimal(str(max_lever)):
+            raise OrderValidationError(symbol, f'lever {lever} exceeds maxLever {max_lever}')
+
+    def validate(self, order):
+        """
+        Validates an order request body.
+
+        Args:
+            order (dict, required): Order request body as sent by Private.place_order e.g. symbol, side, type, sz, px,
+                                    reduceOnly.
+
+        Raises:
+            OrderValidationError: The order would be rejected by the trade engine.
+        """
+        symbol = order.get('symbol')
+        instrument = self._instrument(symbol)
+
+        if order.get('side') not in _sides:
+            raise OrderValidationError(symbol, "side must be 'BUY' or 'SELL'")
+
+        order_type = order.get('type')
+        if order_type not in _types:
+            raise OrderValidationError(symbol, "type must be 'MARKET', 'LIMIT', or 'LIMIT_MAKER'")
+
+        if order.get('sz') is None:
+            raise OrderValidationError(symbol, 'sz is required')
+
+        size = to_decimal(symbol, 'sz', order['sz'])
+        if size <= 0:
+            raise OrderValidationError(symbol, 'sz must be positive')
+
+        self._check_step(symbol, 'sz', size, instrument.get('lotSz'))
+        self._check_range(symbol, 'sz', size, instrument.get('minSz'), instrument.get('maxSz'))
+
+        price = None
+        if order.get('px') is not None:
+            price = to_decimal(symbol, 'px', order['px'])
+            if price <= 0:
+                raise OrderValidationError(symbol, 'px must be positive')
+
+            self._check_step(symbol, 'px', price, instrument.get('tickSz'))
+        elif order_type in _limit_types:
+            raise OrderValidationError(symbol, f'px is required for {order_type} orders')
+
+        if self._account is not None and price is not None and not order.get('reduceOnly'):
+            self._check_margin(symbol, instrument, size, price)
+
+    def _instrument(self, symbol):
+        instrument = self._instruments.get(symbol)
+        if instrument is None:
+            raise OrderValidationError(symbol, f'unknown symbol {symbol}')
+
+        return instrument
+
+    def _check_step(self, symbol, name, value, step):
+        if step is not None and Decimal(str(step)) > 0 and value % Decimal(str(step)) != 0:
+            raise OrderValidationError(symbol, f'{name} {value} is not a multiple of {step}')
+
+    def _check_range(self, symbol, name, value, minimum, maximum):
+        if minimum is not None and value < Decimal(str(minimum)):
+            raise OrderValidationError(symbol, f'{name} {value} is below {minimum}')
+
+        if maximum is not None and value > Decimal(str(maximum)):
+            raise OrderValidationError(symbol, f'{name} {value} is above {maximum}')
+
+    def _check_margin(self, symbol, instrument, size, price):
+        lever = self._leverage.get(symbol)
+        if lever is None:
+            return
+
+        contract_value = Decimal(str(instrument.get('ctVal') or 1))
+        required = size * contract_value * price / lever
+        available = self._account.get_available_margin()
+
+        if required > available:
+            raise OrderValidationError(symbol, f'{required} margin required, {available} available')
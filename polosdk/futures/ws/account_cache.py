@@ -0,0 +1,163 @@
+import threading
+from decimal import Decimal
+
+
+class AccountCache:
+    """
+    In-memory futures account and position state, seeded once from REST and kept current by the private account and
+    positions websocket channels.
+
+    Attributes:
+        _account (dict): Latest account summary e.g. eq, availMgn, im, mm, uTime.
+        _details (dict): Currency to balance details e.g. eq, avail, trdHold.
+        _positions (dict): (symbol, posSide) to position state.
+
+    Example:
+        cache = AccountCache()
+        cache.seed(private.get_account_balance(), private.get_current_position())
+        client = ClientAuthenticated(cache.apply, ws_url=ws_private)
+        await client.connect(API_KEY, API_SECRET)
+        await client.subscribe_to_account()
+        await client.subscribe_to_positions()
+        ...
+        margin = cache.get_available_margin()
+    """
+    _account_channel = 'account'
+    _positions_channel = 'positions'
+
+    def __init__(self):
+        self._account = {}
+        self._details = {}
+        self._positions = {}
+        self._lock = threading.Lock()
+
+    def seed(self, account_balance=None, positions=None):
+        """
+        Loads state from REST snapshots.
+
+        Args:
+            account_balance (dict, optional): Response of Private.get_account_balance().
+            positions (dict, optional): Response of Private.get_current_position(), replaces all positions.
+        """
+        with self._lock:
+            if account_balance is not None:
+                account = _data(account_balance)
+                for item in account if isinstance(account, list) else [account]:
+                    self._apply_account(item, force=True)
+
+            if positions is not None:
+                self._positions = {}
+                for position in _data(positions) or ():
+                    self._apply_position(position, force=True)
+
+    def apply(self, msg):
+        """
+        Applies a websocket message, messages from other channels are ignored so this can be used directly as the
+        on_message callback.
+
+        Args:
+            msg (dict, required): Decoded websocket message.
+        """
+        if not isinstance(msg, dict):
+            return
+
+        channel = msg.get('channel')
+        if channel == self._account_channel:
+            with self._lock:
+                for account in msg.get('data') or ():
+                    self._apply_account(account)
+        elif channel == self._positions_channel:
+            with self._lock:
+                for position in msg.get('data') or ():
+                    self._apply_position(position)
+
+    def get_account(self):
+        """
+        Returns:
+            Latest account summary as json object.
+        """
+        return dict(self._account)
+
+    def get_available_margin(self):
+        """
+        Returns:
+            Available margin (availMgn) as Decimal.
+        """
+        return Decimal(self._account.get('availMgn') or 0)
+
+    def get_balance(self, currency):
+        """
+        Args:
+            currency (str, required): Currency name e.g. USDT.
+
+        Returns:
+            Balance details as json object or None if unknown.
+        """
+        return self._details.get(currency)
+
+    def get_available(self, currency):
+        """
+        Args:
+            currency (str, required): Currency name e.g. USDT.
+
+        Returns:
+            Available amount (avail) as Decimal, zero if unknown.
+        """
+        details = self._details.get(currency)
+        return Decimal(details.get('avail') or 0) if details is not None else Decimal(0)
+
+    def get_position(self, symbol, pos_side='BOTH'):
+        """
+        Args:
+            symbol (str, required): Symbol e.g. BTC_USDT_PERP.
+            pos_side (str, optional): LONG, SHORT or BOTH for one-way mode. Default BOTH.
+
+        Returns:
+            Position as json object or None if there is no open position.
+        """
+        return self._positions.get((symbol, pos_side))
+
+    def get_positions(self, symbol=None):
+        """
+        Args:
+            symbol (str, optional): Only return positions for this symbol. Default all symbols.
+
+        Returns:
+            List of open positions.
+        """
+        with self._lock:
+            return [position for key, position in self._positions.items() if symbol is None or key[0] == symbol]
+
+    def _apply_account(self, account, force=False):
+        if not account:
+            return
+
+        if not force and int(account.get('uTime') or 0) < int(self._account.get('uTime') or 0):
+            return
+
+        self._account = {key: value for key, value in account.items() if key != 'details'}
+
+        for details in account.get('details') or ():
+            self._details[details['ccy']] = details
+
+    def _apply_position(self, position, force=False):
+        key = (position.get('symbol'), position.get('posSide') or 'BOTH')
+        current = self._positions.get(key)
+
+        if not force and current is not None and int(position.get('uTime') or 0) < int(current.get('uTime') or 0):
+            return
+
+        if Decimal(position.get('qty') or 0) == 0:
+            self._positions.pop(key, None)
+        else:
+            self._positions[key] = position
+
+
+def _data(response):
+    """
+    Unwraps the 'data' field of a REST response.
+    """
+    if isinstance(response, dict) and 'data' in response:
+        return response['data']
+
+    return response
@@ -0,0 +1,15 @@
+from polosdk.spot.ws.bar_builder import BarBuilder as SpotBarBuilder
+
+
+class BarBuilder(SpotBarBuilder):
+    """
+    Builds OHLCV bars from the futures public trades websocket channel.  See the spot BarBuilder for usage and the bar
+    fields.
+    """
+    _channels = ('trades',)
+    _symbol_field = 's'
+    _price_field = 'px'
+    _quantity_field = 'qty'
+    _amount_field = 'amt'
+    _side_field = 'side'
+    _time_fields = ('cT', 'ts')
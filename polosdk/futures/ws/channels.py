@@ -0,0 +1,83 @@
+from polosdk.futures.ws.client_base import subscription_frame
+
+ALL_SYMBOLS = 'all'
+# Symbol of the single symbol subscribe helpers when none is given, as before they took symbols.
+DEFAULT_SYMBOL = 'BTC_USDT_PERP'
+
+CANDLE_INTERVALS = ('MINUTE_1', 'MINUTE_5', 'MINUTE_15', 'MINUTE_30', 'HOUR_1', 'HOUR_2', 'HOUR_4', 'HOUR_12',
+                    'DAY_1', 'DAY_3', 'WEEK_1')
+CANDLE_SERIES = ('candles', 'index_candles', 'mark_price_candles')
+BOOK_DEPTHS = (5, 10, 20)
+
+
+def candles_channel(interval, series='candles'):
+    """
+    Get the candles channel name for an interval.
+
+    Args:
+        interval (str, required): One of CANDLE_INTERVALS e.g. MINUTE_1, HOUR_4, DAY_1.
+        series (str, optional): One of CANDLE_SERIES. Default candles.
+
+    Returns:
+        Channel name as string e.g. mark_price_candles_minute_1.
+
+    Raises:
+        ValueError: Interval or series is not supported.
+    """
+    if interval not in CANDLE_INTERVALS:
+        raise ValueError(f'interval must be one of {", ".join(CANDLE_INTERVALS)}')
+
+    if series not in CANDLE_SERIES:
+        raise ValueError(f'series must be one of {", ".join(CANDLE_SERIES)}')
+
+    return f'{series}_{interval.lower()}'
+
+
+def channel_frame(channel, symbols=ALL_SYMBOLS, event='subscribe'):
+    """
+    Args:
+        channel (str, required): Channel name e.g. symbol, tickers, trades, index_price, mark_price, funding_rate,
+                                 positions, orders, trade, account.
+        symbols (str or str[], optional): Symbol, list of symbols or ALL_SYMBOLS. Default all.
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the channel.
+    """
+    return subscription_frame(event, channel, symbols)
+
+
+def candles_frame(symbols, interval='MINUTE_1', series='candles', event='subscribe'):
+    """
+    Args:
+        symbols (str or str[], required): Symbol, list of symbols or ALL_SYMBOLS.
+        interval (str, optional): One of CANDLE_INTERVALS. Default MINUTE_1.
+        series (str, optional): One of CANDLE_SERIES. Default candles.
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the candles channel of the series and interval.
+    """
+    return subscription_frame(event, candles_channel(interval, series), symbols)
+
+
+def book_frame(symbols, depth=None, event='subscribe'):
+    """
+    Args:
+        symbols (str or str[], required): Symbol or list of symbols.
+        depth (int, optional): One of BOOK_DEPTHS. Server default is 5.
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the book channel.
+
+    Raises:
+        ValueError: Depth is not supported.
+    """
+    if depth is None:
+        return subscription_frame(event, 'book', symbols)
+
+    if depth not in BOOK_DEPTHS:
+        raise ValueError(f'depth must be one of {", ".join(str(d) for d in BOOK_DEPTHS)}')
+
+    return subscription_frame(event, 'book', symbols, depth=depth)
@@ -5,6 +5,7 @@ import hashlib
 import hmac
 from datetime import datetime
 
+from polosdk.futures.ws import channels
 from polosdk.futures.ws.client_base import ClientBase
 
 _default_ws_url = 'wss://ws.poloniex.com/ws/'
@@ -14,17 +15,25 @@ class ClientAuthenticated(ClientBase):
     """
     Websockets client for authenticated connections.  See [private channel](https://docs.poloniex.com/#authenticated-channels)
     documentation for more information on available commands.
+
+    The futures v3 websocket has no order entry events, unlike spot there is no create_order, cancel_orders or
+    send_request here.  Orders are placed and canceled through rest.private.Private e.g. place_order and cancel_order,
+    their updates arrive on the orders and trade channels.
     """
-    def __init__(self, on_message, on_error=None, ws_url=None):
+    def __init__(self, on_message, on_error=None, ws_url=None, on_reconnect=None, metrics=None):
         """
         Args:
             on_message (func(str), required): Function called when a new message arrives, must be able to handle a json string.
             on_error (func(Exception), optional): Function called when an error happens during normal operation, must be able to
                                         handle an exception object.
             ws_url (str, optional): Url to websockets interface of trade engine. Default is to production.
+            on_reconnect (func(), optional): Function called when the connection is re-established after it was lost.
+            metrics (StreamMetrics, optional): Records message rates, decode and handler time, queue depth and lag.
         """
         ws_url_base = ws_url or _default_ws_url
-        ClientBase.__init__(self, on_message, urljoin(ws_url_base, 'private'), on_error)
+        ClientBase.__init__(self, on_message, urljoin(ws_url_base, 'private'), on_error, on_reconnect, metrics)
+        self._api_key = None
+        self._api_secret = None
 
     async def connect(self, api_key, api_secret):
         """
@@ -35,9 +44,19 @@ class ClientAuthenticated(ClientBase):
             api_key (str, required): User api key used for authentication.
             api_secret (str, required): User api secret used for authentication.
         """
+        self._api_key = api_key
+        self._api_secret = api_secret
         await super().connect()
         await self._authenticate(api_key, api_secret)
 
+    async def _restore_session(self):
+        """
+        Authenticates a new connection after a reconnect, the server forgets the authentication of the lost one, then
+        re-sends the subscriptions.
+        """
+        await self._authenticate(self._api_key, self._api_secret)
+        await super()._restore_session()
+
     async def _authenticate(self, api_key, api_secret):
         """
         Sends an authentication event to the server.
@@ -75,44 +94,38 @@ class ClientAuthenticated(ClientBase):
         secret_key = base64.b64encode(sig_hash).decode()
         return secret_key
 
-    async def subscribe_to_positions(self):
-        """订阅市场深度LV2"""
-        subscribe_message = {
-            "event": "subscribe",
-  "channel": ["positions"],
-  "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_orders(self):
-        """订阅市场深度LV2"""
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["orders"],
-            "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_trade(self):
-        """订阅市场深度LV2"""
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["trade"],
-            "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_account(self):
-        """订阅市场深度LV2"""
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["account"],
-            "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
+    async def subscribe_to_positions(self, symbols=channels.ALL_SYMBOLS):
+        """
+        Subscribe to position updates.
 
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default all.
+        """
+        await self._send_frame(channels.channel_frame('positions', symbols))
 
+    async def subscribe_to_orders(self, symbols=channels.ALL_SYMBOLS):
+        """
+        Subscribe to order updates.
 
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default all.
+        """
+        await self._send_frame(channels.channel_frame('orders', symbols))
+
+    async def subscribe_to_trade(self, symbols=channels.ALL_SYMBOLS):
+        """
+        Subscribe to trade execution updates.
 
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default all.
+        """
+        await self._send_frame(channels.channel_frame('trade', symbols))
 
+    async def subscribe_to_account(self, symbols=channels.ALL_SYMBOLS):
+        """
+        Subscribe to account balance updates.
 
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default all.
+        """
+        await self._send_frame(channels.channel_frame('account', symbols))
@@ -1,11 +1,101 @@
 import asyncio
+import functools
 import websockets
 import json
 import ssl
+import time
 import certifi
 
+from polosdk.spot.ws.metrics import queue_depth
+
 ssl_context = ssl.create_default_context(cafile=certifi.where())
 _default_ping_delay_seconds = 5
+_frame_cache_size = 4096
+
+
+def _as_tuple(value):
+    """
+    Normalizes a single name or a list of names to a tuple so it can be used as a cache key.
+    """
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+class _FrozenDict(tuple):
+    """
+    Sorted (key, value) pairs of a dict parameter, kept apart from list parameters so it is encoded as an object.
+    """
+    pass
+
+
+def _freeze(value):
+    """
+    Converts list and dict values of extra frame parameters, recursively, to tuples so they can be used as a cache key.
+    """
+    if isinstance(value, dict):
+        return _FrozenDict(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """
+    Reverses _freeze for encoding.
+    """
+    if isinstance(value, _FrozenDict):
+        return {key: _thaw(item) for key, item in value}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class _Frame(str):
+    """
+    Encoded subscription frame that keeps the (event, channels, symbols, extra) it was built from, so subscriptions
+    can be tracked without decoding the frame again.
+    """
+    __slots__ = ('subscription',)
+
+
+@functools.lru_cache(maxsize=_frame_cache_size)
+def _encode_frame(event, channels, symbols, extra):
+    msg = {
+        'event': event,
+        'channel': list(channels)
+    }
+
+    if symbols is not None:
+        msg.update({'symbols': list(symbols)})
+
+    msg.update((key, _thaw(value)) for key, value in extra)
+    frame = _Frame(json.dumps(msg))
+    frame.subscription = (event, channels, symbols, extra)
+    return frame
+
+
+def subscription_frame(event, channels, symbols=None, **kwargs):
+    """
+    Builds a json encoded subscription frame.  Frames are cached, so building the same subscription again returns
+    the already encoded string.
+
+    Args:
+        event (str, required): Frame event e.g. subscribe, unsubscribe.
+        channels (str or str[], required): Channel or list of channels.
+        symbols (str or str[], optional): Symbol or list of symbols.
+
+    Keyword Args:
+        Any additional parameters for the frame e.g. depth.
+
+    Returns:
+        Json encoded frame as string.
+    """
+    if symbols is not None:
+        symbols = _as_tuple(symbols)
+
+    extra = tuple(sorted((key, _freeze(value)) for key, value in kwargs.items()))
+    return _encode_frame(event, _as_tuple(channels), symbols, extra)
 
 
 class ClientBase:
@@ -17,8 +107,13 @@ class ClientBase:
         _ws_url (str): Url to websockets interface of trade engine.
         _on_error (func(Exception)): Function called when an error happens during normal operation, must be able to
                                      handle an exception object.
+        _on_reconnect (func()): Function called when the connection is re-established after it was lost.
+        _metrics (StreamMetrics): Message path instrumentation.
+        _frame_listeners (list): Functions called with every raw frame and its receive time, e.g. a Recorder.
+        _subscriptions (dict): (channel, extra parameters) to subscribed symbols, None for channels without symbols,
+                               replayed after a reconnect.
     """
-    def __init__(self, on_message, ws_url, on_error=None):
+    def __init__(self, on_message, ws_url, on_error=None, on_reconnect=None, metrics=None):
         """
         Args:初始化 ClientBase 类的实例。
             on_message (func(str), required): Function called when a new message arrives, must be able to handle a json
@@ -26,10 +121,18 @@ class ClientBase:
             ws_url (str, required): Url to websockets interface of trade engine.
             on_error (func(Exception), optional): Function called when an error happens during normal operation, must be
                                                   able to handle an exception object.
+            on_reconnect (func(), optional): Function called when the connection is re-established after it was lost,
+                                             e.g. to reconcile local state that may have missed messages.
+            metrics (StreamMetrics, optional): Records message rates, decode and handler time, queue depth and lag.
         """
         self._on_message = on_message
         self._ws_url = ws_url
         self._on_error = on_error
+        self._on_reconnect = on_reconnect
+        self._metrics = metrics
+        self._frame_listeners = []
+        self._subscriptions = {}
+        self._connections = 0
         self._websocket = None
         self._conn_event = None
         self._ping_task = None
@@ -52,6 +155,8 @@ class ClientBase:
 
         self._conn_event = asyncio.Event()
         self._keep_alive = True
+        self._connections = 0
+        self._subscriptions.clear()
         self._conn_task = asyncio.create_task(self.listen())
         self._ping_task = asyncio.create_task(self._ping())
 
@@ -74,13 +179,14 @@ class ClientBase:
             raise RuntimeError('Not connected to websocket')
 
         self._keep_alive = False
+        websocket = self._websocket
 
         await self._cancel_ping_task()
         await self._cancel_conn_task()
 
-        # 发送关闭帧
+        # 发送关闭帧, listen 任务退出时可能已清空 self._websocket
         try:
-            await self._websocket.close()  # 确保发送关闭帧
+            await websocket.close()  # 确保发送关闭帧
         except Exception as e:
             print("Error while closing websocket:", e)
         self._conn_event = None
@@ -99,15 +205,40 @@ class ClientBase:
         """
         while self._keep_alive:
             try:
-                async with websockets.connect(self._ws_url, ssl=ssl_context) as socket:
+                ssl_arg = ssl_context if self._ws_url.startswith('wss://') else None
+                async with websockets.connect(self._ws_url, ssl=ssl_arg) as socket:
                     self._websocket = socket
                     self._conn_event.set()
 
+                    self._connections += 1
+                    if self._connections > 1:
+                        try:
+                            await self._restore_session()
+                        except Exception as err:
+                            if self._on_error is not None:
+                                self._on_error(err)
+
+                        if self._on_reconnect is not None:
+                            try:
+                                self._on_reconnect()
+                            except Exception as err:
+                                if self._on_error is not None:
+                                    self._on_error(err)
+
                     while self._keep_alive:
                         try:
                             msg = await socket.recv()
+                            if len(self._frame_listeners) > 0:
+                                self._notify_frame_listeners(msg)
+
+                            if self._metrics is not None:
+                                self._handle_measured(msg, socket)
+                                continue
+
                             msg = json.loads(msg)
-                            self._on_message(msg)
+                            self._handle_message(msg)
+                        except websockets.ConnectionClosed:
+                            raise
                         except Exception as err:
                             if self._on_error is not None:
                                 self._on_error(err)
@@ -123,6 +254,7 @@ class ClientBase:
                     await self._websocket.close()  # Close the websocket
                 self._websocket = None
                 self._conn_event.clear()
+                self._on_connection_lost()
 
     async def subscribe(self, channels, symbols=None, **kwargs):
         """订阅一个或多个频道。
@@ -130,8 +262,8 @@ class ClientBase:
         refer to [websocket docs](https://docs.poloniex.com/#notes) for valid channels, symbols and arguments.
 
         Args:
-            channels (str[]): List of channels for subscription command.
-            symbols (str[]): List of symbols for subscription command.
+            channels (str or str[]): Channel or list of channels for subscription command.
+            symbols (str or str[]): Symbol or list of symbols for subscription command.
 
         Keyword Args:
             Dictionary of any additional parameters for the subscription request.
@@ -139,42 +271,20 @@ class ClientBase:
         Returns:
             _on_message callback function will be called with response messages.
         """
-        msg = {
-            'event': 'subscribe',
-            'channel': channels
-        }
-
-        if symbols is not None:
-            msg.update({'symbols': symbols})
-            # 添加其他可选参数
-        msg.update(kwargs)
-
-            # 发送消息前进行调试
-        print("Sending subscribe message:", msg)  # 调试信息，查看发送的消息内容
-        msg.update(kwargs)
-        msg=json.dumps(msg)
-
-        await self._send_message(msg)
+        await self._send_frame(subscription_frame('subscribe', channels, symbols, **kwargs))
 
     async def unsubscribe(self, channels, symbols=None):
         """
         Unsubscribe from a channel or set of channels for single or many instruments.
 
         Args:
-            channels (str[]): List of channels for unsubscribe command.
-            symbols (str[]): List of symbols for unsubscribe command.
+            channels (str or str[]): Channel or list of channels for unsubscribe command.
+            symbols (str or str[]): Symbol or list of symbols for unsubscribe command.
 
         Returns:
             _on_message callback function will be called with response messages.
         """
-        msg = {
-            'event': 'unsubscribe',
-            'channel': channels
-        }
-
-        if symbols is not None:
-            msg.update({'symbols': symbols})
-        await self._send_message(msg)
+        await self._send_frame(subscription_frame('unsubscribe', channels, symbols))
 
     async def unsubscribe_all(self):
         """
@@ -185,6 +295,7 @@ class ClientBase:
         """
         msg = {'event': 'unsubscribe_all'}
         await self._send_message(msg)
+        self._subscriptions.clear()
 
     async def list_subscriptions(self):
         """
@@ -196,6 +307,103 @@ class ClientBase:
         msg = {'event': 'list_subscriptions'}
         await self._send_message(msg)
 
+    def _handle_message(self, msg):
+        """
+        Internal dispatch of a decoded message, subclasses can intercept messages before they reach _on_message.
+
+        Args:
+            msg(dict): Decoded message.
+        """
+        self._on_message(msg)
+
+    def add_frame_listener(self, listener):
+        """
+        Registers a function called with every raw frame before it is decoded.  Listeners run on the receive loop and
+        must return quickly, e.g. by queueing the frame.
+
+        Args:
+            listener (func(str, int), required): Function called with the frame and its receive time in ns since
+                                                 epoch.
+        """
+        self._frame_listeners.append(listener)
+
+    def remove_frame_listener(self, listener):
+        if listener in self._frame_listeners:
+            self._frame_listeners.remove(listener)
+
+    def _notify_frame_listeners(self, raw):
+        received_ns = time.time_ns()
+        for listener in self._frame_listeners:
+            try:
+                listener(raw, received_ns)
+            except Exception as err:
+                if self._on_error is not None:
+                    self._on_error(err)
+
+    def _handle_measured(self, raw, socket, received_sec=None):
+        """
+        Decodes and dispatches a message like listen does, timing both steps for the metrics object.
+
+        Args:
+            raw(str): Message as received.
+            socket: Websocket connection the message was read from.
+            received_sec(float): Receive time in seconds since epoch lag is measured against. Default now.
+        """
+        received_sec = received_sec if received_sec is not None else time.time()
+        start = time.perf_counter()
+        msg = json.loads(raw)
+        decoded = time.perf_counter()
+
+        try:
+            self._handle_message(msg)
+        finally:
+            self._metrics.record(len(raw), msg, decoded - start, time.perf_counter() - decoded, received_sec,
+                                 queue_depth(socket))
+
+    async def _restore_session(self):
+        """
+        Internal hook called on every connection after the first, before _on_reconnect, to restore server side state
+        of the lost connection.  Re-sends the subscriptions made so far, the new connection starts without any.
+        """
+        for (channel, extra), symbols in list(self._subscriptions.items()):
+            symbols = tuple(sorted(symbols)) if symbols is not None else None
+            await self._websocket.send(_encode_frame('subscribe', (channel,), symbols, extra))
+
+    def _track_frame(self, frame):
+        """
+        Internal function to keep _subscriptions in line with the subscribe and unsubscribe frames sent.  Uses the
+        values subscription_frame built the frame from, frames built otherwise are not tracked.
+
+        Args:
+            frame(str): Json encoded frame.
+        """
+        subscription = getattr(frame, 'subscription', None)
+        if subscription is None or subscription[0] not in ('subscribe', 'unsubscribe'):
+            return
+
+        event, channels, symbols, extra = subscription
+        for channel in channels:
+            if event == 'subscribe':
+                key = (channel, extra)
+                current = self._subscriptions.get(key, set())
+                self._subscriptions[key] = current | set(symbols) if symbols is not None and current is not None \
+                    else None
+                continue
+
+            for key in [key for key in self._subscriptions if key[0] == channel]:
+                current = self._subscriptions[key]
+                remaining = current - set(symbols) if symbols is not None and current is not None else set()
+                if len(remaining) > 0:
+                    self._subscriptions[key] = remaining
+                else:
+                    del self._subscriptions[key]
+
+    def _on_connection_lost(self):
+        """
+        Internal hook called every time the websocket connection is closed or lost.
+        """
+        pass
+
     async def _cancel_conn_task(self):
         """
         Internal function to cancel connection task.
@@ -225,6 +433,19 @@ class ClientBase:
         # print("Sending message:", msg)  # 确保格式正确
         await self._websocket.send(msg)
 
+    async def _send_frame(self, frame):
+        """
+        Internal send function for frames that are already json encoded.
+
+        Args:
+            frame(str): Json encoded frame.
+        """
+        if self._websocket is None:
+            raise RuntimeError('Not connected to websocket')
+
+        await self._websocket.send(frame)
+        self._track_frame(frame)
+
     async def _ping(self):
         """
         Main ping task function, sends a ping to the server every 10 seconds.  If the server does not receive a ping at
@@ -1,5 +1,6 @@
 from urllib.parse import urljoin
 
+from polosdk.futures.ws import channels
 from polosdk.futures.ws.client_base import ClientBase
 
 # _default_ws_url = 'wss://ws.poloniex.com/ws/'
@@ -11,112 +12,118 @@ class ClientPublic(ClientBase):
     documentation for more information on available commands.
     """
 
-    def __init__(self, on_message, on_error=None, ws_url=None):
+    def __init__(self, on_message, on_error=None, ws_url=None, on_reconnect=None, metrics=None):
         """
         Args:
             on_message (func(str), required): Function called when a new message arrives, must be able to handle a json string.
             on_error (func(Exception), optional): Function called when an error happens during normal operation, must be able to
                                         handle an exception object.
             ws_url (str, optional): Url to websockets interface of trade engine. Default is to production.
+            on_reconnect (func(), optional): Function called when the connection is re-established after it was lost.
+            metrics (StreamMetrics, optional): Records message rates, decode and handler time, queue depth and lag.
         """
         ws_url_base = ws_url
-        ClientBase.__init__(self, on_message, urljoin(ws_url_base, 'public'), on_error)
-
-    async def subscribe_to_ProductInfosymbol(self):
-
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["symbol"],
-            "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_OrderBook(self):
-
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["book"],
-            "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_orderbooklv2(self):
-
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["book_lv2"],
-            "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_KlineData(self):
-
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["candles_minute_1"],
-            "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_Tickers(self):
-
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["tickers"],
-            "symbols": ["BTC_USDT_PERP", ""]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_Trades(self):
-
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["trades"],
-            "symbols": ['BTC_USDT_PERP','BTC_USDT_PERP']
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_IndexPrice(self):
-
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["index_price"],
-            "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_MarkPrice(self):
-
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["mark_price"],
-            "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_IndexPriceKlineData(self):
-
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["index_candles_minute_1"],
-            "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_MarkPriceKlineData(self):
-
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["mark_price_candles_minute_1"],
-            "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_FundingRate(self):
-
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["funding_rate"],
-            "symbols": ["BTC_USDT_PERP"]
-        }
-        await self._send_message(subscribe_message)
+        ClientBase.__init__(self, on_message, urljoin(ws_url_base, 'public'), on_error, on_reconnect, metrics)
+
+    async def subscribe_to_ProductInfosymbol(self, symbols=channels.ALL_SYMBOLS):
+        """
+        Subscribe to product info updates.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default all.
+        """
+        await self._send_frame(channels.channel_frame('symbol', symbols))
+
+    async def subscribe_to_OrderBook(self, symbols=channels.DEFAULT_SYMBOL, depth=None):
+        """
+        Subscribe to book snapshots.
+
+        Args:
+            symbols (str or str[], optional): Symbol or list of symbols. Default BTC_USDT_PERP.
+            depth (int, optional): One of channels.BOOK_DEPTHS. Server default is 5.
+        """
+        await self._send_frame(channels.book_frame(symbols, depth))
+
+    async def subscribe_to_orderbooklv2(self, symbols=channels.DEFAULT_SYMBOL):
+        """
+        Subscribe to full book snapshots followed by incremental updates.
+
+        Args:
+            symbols (str or str[], optional): Symbol or list of symbols. Default BTC_USDT_PERP.
+        """
+        await self._send_frame(channels.channel_frame('book_lv2', symbols))
+
+    async def subscribe_to_KlineData(self, symbols=channels.DEFAULT_SYMBOL, interval='MINUTE_1'):
+        """
+        Subscribe to candles for an interval.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default BTC_USDT_PERP.
+            interval (str, optional): One of channels.CANDLE_INTERVALS. Default MINUTE_1.
+        """
+        await self._send_frame(channels.candles_frame(symbols, interval, 'candles'))
+
+    async def subscribe_to_Tickers(self, symbols=channels.ALL_SYMBOLS):
+        """
+        Subscribe to 24 hour ticker updates.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default all.
+        """
+        await self._send_frame(channels.channel_frame('tickers', symbols))
+
+    async def subscribe_to_Trades(self, symbols=channels.ALL_SYMBOLS):
+        """
+        Subscribe to trades.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default all.
+        """
+        await self._send_frame(channels.channel_frame('trades', symbols))
+
+    async def subscribe_to_IndexPrice(self, symbols=channels.ALL_SYMBOLS):
+        """
+        Subscribe to index price updates.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default all.
+        """
+        await self._send_frame(channels.channel_frame('index_price', symbols))
+
+    async def subscribe_to_MarkPrice(self, symbols=channels.ALL_SYMBOLS):
+        """
+        Subscribe to mark price updates.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default all.
+        """
+        await self._send_frame(channels.channel_frame('mark_price', symbols))
+
+    async def subscribe_to_IndexPriceKlineData(self, symbols=channels.DEFAULT_SYMBOL, interval='MINUTE_1'):
+        """
+        Subscribe to index price candles for an interval.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default BTC_USDT_PERP.
+            interval (str, optional): One of channels.CANDLE_INTERVALS. Default MINUTE_1.
+        """
+        await self._send_frame(channels.candles_frame(symbols, interval, 'index_candles'))
+
+    async def subscribe_to_MarkPriceKlineData(self, symbols=channels.DEFAULT_SYMBOL, interval='MINUTE_1'):
+        """
+        Subscribe to mark price candles for an interval.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default BTC_USDT_PERP.
+            interval (str, optional): One of channels.CANDLE_INTERVALS. Default MINUTE_1.
+        """
+        await self._send_frame(channels.candles_frame(symbols, interval, 'mark_price_candles'))
+
+    async def subscribe_to_FundingRate(self, symbols=channels.ALL_SYMBOLS):
+        """
+        Subscribe to funding rate updates.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default all.
+        """
+        await self._send_frame(channels.channel_frame('funding_rate', symbols))
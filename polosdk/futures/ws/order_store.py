@@ -0,0 +1,21 @@
+from polosdk.spot.ws.order_store import OrderStore as SpotOrderStore
+
+
+class OrderStore(SpotOrderStore):
+    """
+    In-memory order state fed by the futures private orders and trade websocket channels.  See the spot OrderStore for
+    usage, reconcile against client.get_current_orders() after a reconnect.
+    """
+    _channels = ('orders',)
+    _trade_channels = ('trade',)
+    _id_field = 'ordId'
+    _snapshot_id_field = 'ordId'
+    _client_id_field = 'clOrdId'
+    _symbol_field = 'symbol'
+    _state_field = 'state'
+    _time_fields = ('ts', 'uTime')
+    _trade_event_field = None
+    _trade_event = None
+    _closed_states = frozenset(('FILLED', 'CANCELED', 'PARTIALLY_CANCELED', 'REJECTED', 'EXPIRED', 'FAILED'))
+    # get_current_orders 默认每页 20 条
+    _snapshot_limit = 20
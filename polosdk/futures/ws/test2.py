@@ -32,19 +32,19 @@ async def main():
     await client.subscribe_to_ProductInfosymbol()
 
     # 订阅交易信息
-    await client.subscribe_to_OrderBook()
+    await client.subscribe_to_OrderBook('BTC_USDT_PERP')
     #
     # # 订阅市场深度
-    await client.subscribe_to_orderbooklv2()
+    await client.subscribe_to_orderbooklv2('BTC_USDT_PERP')
     #
     # # 订阅 K 线数据
-    await client.subscribe_to_KlineData()
+    await client.subscribe_to_KlineData('BTC_USDT_PERP')
 
     # # 订阅 Ticker 信息
-    await client.subscribe_to_IndexPriceKlineData()
+    await client.subscribe_to_IndexPriceKlineData('BTC_USDT_PERP')
     #
     # # 订阅符号信息
-    await client.subscribe_to_MarkPriceKlineData()
+    await client.subscribe_to_MarkPriceKlineData('BTC_USDT_PERP')
     await client.subscribe_to_Tickers()
     await client.subscribe_to_Trades()
 
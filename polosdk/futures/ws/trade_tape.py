@@ -0,0 +1,15 @@
+from polosdk.spot.ws.trade_tape import TradeTape as SpotTradeTape
+
+
+class TradeTape(SpotTradeTape):
+    """
+    Per symbol trade history fed by the futures public trades websocket channel and get_execution_info.  See the spot
+    TradeTape for usage and queries.
+    """
+    _channels = ('trades',)
+    _symbol_field = 's'
+    _id_field = 'id'
+    _price_field = 'px'
+    _quantity_field = 'qty'
+    _side_field = 'side'
+    _time_fields = ('cT', 'ts')
@@ -0,0 +1,140 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+_default_max_workers = 4
+
+
+class AmendManager:
+    """
+    Amends orders through cancel_replace with at most one request in flight per order.  Amends arriving while a
+    request is in flight are coalesced into a single follow-up request carrying the newest values, superseded values
+    are never sent.  cancel_replace returns a new order id, the manager keeps sending later amends to the latest id so
+    callers can keep using the id they started with.
+
+    Attributes:
+        _orders (Orders or SmartOrders): Endpoint class whose cancel_replace is used.
+        _state (dict): Order key to amend state with the current order id, pending changes and their futures.
+        _aliases (dict): Replacement order id to the order key it belongs to.
+
+    Example:
+        amends = AmendManager(client.orders())
+        for tick in ticks:
+            amends.amend(order_id, price=quote(tick))
+        result = amends.amend(order_id, price='19000').result()
+    """
+    def __init__(self, orders, max_workers=_default_max_workers):
+        """
+        Args:
+            orders (Orders or SmartOrders, required): Endpoint class used to send cancel_replace requests.
+            max_workers (int, optional): Maximum number of orders amended concurrently. Default 4.
+        """
+        self._orders = orders
+        self._state = {}
+        self._aliases = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def amend(self, order_id, **kwargs):
+        """
+        Requests an amend, sent immediately if no amend is in flight for the order, otherwise merged into the next one.
+
+        Args:
+            order_id (str, required): Id of the order, either the original id or any replacement id.
+
+        Keyword Args:
+            Parameters for cancel_replace e.g. price, quantity, amount, type, time_in_force, proceed_on_failure.
+
+        Returns:
+            concurrent.futures.Future resolved with the cancel_replace response of the request that carried these
+            values, or with its error.
+        """
+        future = Future()
+
+        with self._lock:
+            key = self._aliases.get(order_id, order_id)
+            state = self._state.get(key)
+            if state is None:
+                state = {'current_id': order_id, 'in_flight': False, 'pending': None, 'waiters': []}
+                self._state[key] = state
+
+            if state['in_flight']:
+                state['pending'] = dict(state['pending'] or {}, **kwargs)
+                state['waiters'].append(future)
+                return future
+
+            state['in_flight'] = True
+
+        self._executor.submit(self._run, key, kwargs, [future])
+        return future
+
+    def current_id(self, order_id):
+        """
+        Args:
+            order_id (str, required): Id of the order, either the original id or any replacement id.
+
+        Returns:
+            Id of the latest replacement order.
+        """
+        with self._lock:
+            state = self._state.get(self._aliases.get(order_id, order_id))
+            return state['current_id'] if state is not None else order_id
+
+    def forget(self, order_id):
+        """
+        Drops the state of an order that will not be amended again, e.g. after it was filled or canceled.
+
+        Args:
+            order_id (str, required): Id of the order, either the original id or any replacement id.
+        """
+        with self._lock:
+            key = self._aliases.get(order_id, order_id)
+            state = self._state.get(key)
+            if state is None or state['in_flight']:
+                return
+
+            del self._state[key]
+            for alias in [alias for alias, alias_key in self._aliases.items() if alias_key == key]:
+                del self._aliases[alias]
+
+    def shutdown(self, wait=True):
+        """
+        Stops the worker threads.
+
+        Args:
+            wait (bool, optional): Wait for in flight amends to finish. Default True.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, key, changes, waiters):
+        """
+        Sends amends for one order until no coalesced changes are left.
+        """
+        while True:
+            with self._lock:
+                state = self._state[key]
+                order_id = state['current_id']
+
+            try:
+                result = self._orders.cancel_replace(order_id, **changes)
+            except Exception as err:
+                for waiter in waiters:
+                    waiter.set_exception(err)
+            else:
+                with self._lock:
+                    new_id = result.get('id') if isinstance(result, dict) else None
+                    if new_id:
+                        state['current_id'] = new_id
+                        self._aliases[new_id] = key
+
+                for waiter in waiters:
+                    waiter.set_result(result)
+
+            with self._lock:
+                if state['pending'] is None:
+                    state['in_flight'] = False
+                    return
+
+                changes = state['pending']
+                waiters = state['waiters']
+                state['pending'] = None
+                state['waiters'] = []
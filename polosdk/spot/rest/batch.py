@@ -0,0 +1,146 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+_default_max_workers = 8
+
+
+class RateLimiter:
+    """
+    Token bucket shared by any number of threads.  Allows bursts of up to burst calls, then rate calls per second.
+
+    Example:
+        limiter = RateLimiter(200)
+        results = fan_out(markets.get_orderbook, symbols, max_workers=32, limiter=limiter)
+    """
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate (float, required): Calls per second.
+            burst (int, optional): Calls allowed at once after an idle period. Default rate.
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+
+        self._rate = float(rate)
+        self._burst = float(burst if burst is not None else max(rate, 1))
+        self._tokens = self._burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Takes one token, sleeping until one is available.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self._rate
+
+            time.sleep(wait)
+
+
+def chunked(items, size):
+    """
+    Splits a list into consecutive chunks.
+
+    Args:
+        items (list, required): Items to split.
+        size (int, required): Maximum chunk size.
+
+    Returns:
+        List of lists with at most size items each.
+    """
+    if size <= 0:
+        raise ValueError('size must be positive')
+
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def fan_out(func, args, max_workers=None, limiter=None):
+    """
+    Calls func once per argument concurrently on a thread pool.  Errors are captured per call, so one failed request
+    does not discard the results of the others.
+
+    Args:
+        func (func(arg), required): Function to call, typically sending one REST request.
+        args (list, required): One argument per call.
+        max_workers (int, optional): Maximum concurrent calls. Default 8.
+        limiter (RateLimiter, optional): Limits how fast calls are started.
+
+    Returns:
+        List of (result, error) tuples in the order of args, error is None on success.
+    """
+    if len(args) == 0:
+        return []
+
+    def call(arg):
+        try:
+            if limiter is not None:
+                limiter.acquire()
+
+            return func(arg), None
+        except Exception as err:
+            return None, err
+
+    if len(args) == 1:
+        return [call(args[0])]
+
+    workers = min(len(args), max_workers or _default_max_workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(call, args))
+
+
+def error_item(err, message_key='message'):
+    """
+    Converts an exception to a per-item error in the trade engine's response format.
+
+    Args:
+        err (Exception, required): Error raised for the item or its batch, RequestError code and message are kept.
+        message_key (str, optional): Key of the message field, 'message' for spot and 'msg' for futures.
+
+    Returns:
+        Json object with 'code' and message.
+    """
+    return {'code': getattr(err, 'code', -1), message_key: getattr(err, 'message', str(err))}
+
+
+def cancel_by_ids(send, order_ids, client_order_ids, size, max_workers=None):
+    """
+    Cancels any number of orders by id through a batch cancel endpoint.  Ids are split into batches of size, the
+    batches are sent concurrently and their results are concatenated.  A failed batch yields one error item per id so
+    callers can retry exactly the ids that were not confirmed.
+
+    Args:
+        send (func(dict), required): Function sending one batch cancel request body and returning its result list.
+        order_ids (str[], required): Order ids, may be empty.
+        client_order_ids (str[], required): Client order ids, may be empty.
+        size (int, required): Maximum ids per request.
+        max_workers (int, optional): Maximum number of batches in flight. Default 8.
+
+    Returns:
+        List of json objects with information on canceled orders or per-id errors.
+    """
+    bodies = [('orderIds', 'orderId', chunk) for chunk in chunked(list(order_ids), size)]
+    bodies += [('clientOrderIds', 'clientOrderId', chunk) for chunk in chunked(list(client_order_ids), size)]
+
+    results = []
+    responses = fan_out(lambda body: send({body[0]: body[2]}), bodies, max_workers)
+    for (_, id_key, ids), (response, err) in zip(bodies, responses):
+        if err is None:
+            results.extend(response)
+            continue
+
+        for item_id in ids:
+            item = error_item(err)
+            item.update({id_key: item_id})
+            results.append(item)
+
+    return results
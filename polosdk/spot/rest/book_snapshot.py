@@ -0,0 +1,144 @@
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError('Order book snapshots require numpy, install it with: pip install numpy')
+
+from polosdk.spot.rest.batch import RateLimiter, fan_out
+
+_default_max_workers = 32
+
+
+def parse_levels(levels, depth):
+    """
+    Converts one side of an order book response to arrays.
+
+    Args:
+        levels (list, required): Flat [price, quantity, price, quantity, ...] list as returned by spot, or
+                                 [[price, quantity], ...] pairs as returned by futures.
+        depth (int, required): Number of levels kept.
+
+    Returns:
+        (prices, quantities) float64 arrays of length depth, missing levels are nan.
+    """
+    values = np.asarray(levels, dtype=np.float64).reshape(-1, 2) if len(levels) > 0 else np.empty((0, 2))
+    prices = np.full(depth, np.nan)
+    quantities = np.full(depth, np.nan)
+    count = min(len(values), depth)
+    prices[:count] = values[:count, 0]
+    quantities[:count] = values[:count, 1]
+    return prices, quantities
+
+
+class BookSnapshot:
+    """
+    Order books of many symbols in aligned arrays, row i of every array belongs to symbols[i].  Bids are sorted best
+    first i.e. descending, asks ascending, levels a book does not have are nan.
+
+    Attributes:
+        symbols (list): Symbol of each row.
+        bid_prices (numpy.ndarray): Bid prices, shape (symbols, depth).
+        bid_quantities (numpy.ndarray): Bid quantities, shape (symbols, depth).
+        ask_prices (numpy.ndarray): Ask prices, shape (symbols, depth).
+        ask_quantities (numpy.ndarray): Ask quantities, shape (symbols, depth).
+        exchange_ts (numpy.ndarray): Time the exchange produced each book in ms since epoch, 0 when unknown.
+        fetched_ms (numpy.ndarray): Local time each response was received in ms since epoch, 0 when it failed.
+        errors (dict): Symbol to the exception raised fetching its book, failed rows are all nan.
+    """
+    def __init__(self, symbols, depth):
+        self.symbols = list(symbols)
+        self.bid_prices = np.full((len(self.symbols), depth), np.nan)
+        self.bid_quantities = np.full((len(self.symbols), depth), np.nan)
+        self.ask_prices = np.full((len(self.symbols), depth), np.nan)
+        self.ask_quantities = np.full((len(self.symbols), depth), np.nan)
+        self.exchange_ts = np.zeros(len(self.symbols), dtype=np.int64)
+        self.fetched_ms = np.zeros(len(self.symbols), dtype=np.int64)
+        self.errors = {}
+        self._index = {symbol: index for index, symbol in enumerate(self.symbols)}
+
+    def index(self, symbol):
+        return self._index[symbol]
+
+    def book(self, symbol):
+        """
+        Returns:
+            Json object with the bids, asks and times of one symbol, bids and asks as (depth, 2) price, quantity
+            arrays.
+        """
+        index = self._index[symbol]
+        return {
+            'bids': np.column_stack((self.bid_prices[index], self.bid_quantities[index])),
+            'asks': np.column_stack((self.ask_prices[index], self.ask_quantities[index])),
+            'ts': int(self.exchange_ts[index]),
+            'fetched': int(self.fetched_ms[index])
+        }
+
+    def best_bid(self):
+        return self.bid_prices[:, 0]
+
+    def best_ask(self):
+        return self.ask_prices[:, 0]
+
+    def mid(self):
+        return (self.bid_prices[:, 0] + self.ask_prices[:, 0]) / 2
+
+    def spread(self):
+        return self.ask_prices[:, 0] - self.bid_prices[:, 0]
+
+    def skew_ms(self):
+        """
+        Returns:
+            Time between the first and last book received, a measure of how consistent the snapshot is.
+        """
+        fetched = self.fetched_ms[self.fetched_ms > 0]
+        return int(fetched.max() - fetched.min()) if len(fetched) > 0 else 0
+
+
+def fetch_books(get_book, symbols, depth, max_workers=None, limiter=None):
+    """
+    Fetches the order books of many symbols concurrently.
+
+    Args:
+        get_book (func(str), required): Function returning the order book response of a symbol, spot flat level lists
+                                        and futures level pairs are both accepted.
+        symbols (list, required): Symbol names.
+        depth (int, required): Levels kept per side.
+        max_workers (int, optional): Maximum requests in flight. Default 32.
+        limiter (RateLimiter, optional): Limits how fast requests are started.
+
+    Returns:
+        BookSnapshot object.
+    """
+    def fetch(symbol):
+        response = get_book(symbol)
+        return response, int(time.time() * 1000)
+
+    snapshot = BookSnapshot(symbols, depth)
+    results = fan_out(fetch, snapshot.symbols, max_workers or _default_max_workers, limiter)
+
+    for index, (symbol, (result, err)) in enumerate(zip(snapshot.symbols, results)):
+        if err is not None:
+            snapshot.errors[symbol] = err
+            continue
+
+        response, fetched_ms = result
+        book = response['data'] if isinstance(response, dict) and 'data' in response else response
+        snapshot.bid_prices[index], snapshot.bid_quantities[index] = parse_levels(book.get('bids') or [], depth)
+        snapshot.ask_prices[index], snapshot.ask_quantities[index] = parse_levels(book.get('asks') or [], depth)
+        snapshot.exchange_ts[index] = int(book.get('ts') or book.get('time') or 0)
+        snapshot.fetched_ms[index] = fetched_ms
+
+    return snapshot
+
+
+def rate_limiter(rate_limit):
+    """
+    Returns:
+        RateLimiter for a rate in requests per second, None when rate_limit is None, or rate_limit itself when it
+        already is a limiter.
+    """
+    if rate_limit is None or isinstance(rate_limit, RateLimiter):
+        return rate_limit
+
+    return RateLimiter(rate_limit)
@@ -1,7 +1,7 @@
 from polosdk.spot.rest.accounts import Accounts
 from polosdk.spot.rest.subaccounts import Subaccounts
 from polosdk.spot.rest.markets import Markets
-from polosdk.spot.rest.request import Request
+from polosdk.spot.rest.request import Request, create_session
 from polosdk.spot.rest.orders import Orders
 from polosdk.spot.rest.smartorders import SmartOrders
 from polosdk.spot.rest.wallets import Wallets
@@ -19,7 +19,7 @@ class Client:
         _smartorders (SmartOrders): Class to handle all endpoints related to smart orders.
         _wallets (Wallets): Class to handle all endpoints related to wallets.
     """
-    def __init__(self, api_key=None, api_secret=None, url=None):
+    def __init__(self, api_key=None, api_secret=None, url=None, validator=None, warmup_connections=0, **kwargs):
         """
         Args:
             api_key (str, required): User api key used for authentication. Not required if using markets or currency
@@ -27,14 +27,45 @@ class Client:
             api_secret (str, required): User api secret used for authentication. Not required if using markets or
                                         currency endpoints.
             url (str, optional): Url for endpoints, default is set to PROD in Request class.
+            validator (OrderValidator, optional): Pre-trade checks run locally before orders are created.
+            warmup_connections (int, optional): Number of connections opened at construction, see warmup. Default 0.
+
+        Keyword Args:
+            Forwarded to every Request e.g. session, single_flight, http2. A single session is shared by all
+            endpoint classes by default.
+        """
+        if kwargs.get('session') is None:
+            kwargs.update({'session': create_session(http2=kwargs.get('http2', False))})
+
+        self._accounts = Accounts(api_key, api_secret, url, **kwargs)
+        self._subaccounts = Subaccounts(api_key, api_secret, url, **kwargs)
+        self._markets = Markets(url, **kwargs)
+        self._request = Request(url=url, **kwargs)
+        self._orders = Orders(api_key, api_secret, url, validator, **kwargs)
+        self._smartorders = SmartOrders(api_key, api_secret, url, **kwargs)
+        self._wallets = Wallets(api_key, api_secret, url, **kwargs)
+
+        if warmup_connections > 0:
+            self.warmup(warmup_connections)
+
+    def warmup(self, connections=4, keep_alive_sec=None):
+        """
+        Resolves the host and opens pooled connections shared by all endpoint classes ahead of time, so the first
+        order is as fast as later ones.
+
+        Args:
+            connections (int, optional): Number of connections to open. Default 4.
+            keep_alive_sec (float, optional): When set, keeps the connections open with a /timestamp request per
+                                              connection at this interval. Default None.
+
+        Returns:
+            Number of connections opened successfully.
+
+        Example:
+            client = Client(api_key, api_secret)
+            client.warmup(4, keep_alive_sec=30)
         """
-        self._accounts = Accounts(api_key, api_secret, url)
-        self._subaccounts = Subaccounts(api_key, api_secret, url)
-        self._markets = Markets(url)
-        self._request = Request(url=url)
-        self._orders = Orders(api_key, api_secret, url)
-        self._smartorders = SmartOrders(api_key, api_secret, url)
-        self._wallets = Wallets(api_key, api_secret, url)
+        return self._request.warmup(connections, keep_alive_sec)
 
     def get_market(self, symbol):
         """
@@ -255,6 +286,23 @@ class Client:
         params = {'includeMultiChainCurrencies': multichain}
         return self._request('GET', '/currencies', params=params)
 
+    def stream_currencies(self, multichain=False):
+        """
+        Same request as get_currencies, parsed incrementally while the response is received.
+
+        Returns:
+            Generator of currency json objects, see get_currencies.
+
+        Raises:
+            RequestError: An error occurred communicating with trade engine.
+
+        Example:
+            for currency in client.stream_currencies(multichain=True):
+                print(currency)
+        """
+        params = {'includeMultiChainCurrencies': multichain}
+        return self._request.stream('GET', '/currencies', params=params)
+
     def get_currencies_v2(self):
         """
         Get all supported currencies.
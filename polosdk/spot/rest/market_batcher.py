@@ -0,0 +1,122 @@
+import threading
+import time
+
+from polosdk.spot.rest.request import RequestError
+
+_default_window_sec = 0.005
+
+# kind: (bulk method of Markets, key field of each item)
+_bulk_endpoints = {
+    'price': ('get_prices', 'symbol'),
+    'ticker24h': ('get_ticker24h_all', 'symbol'),
+    'mark_price': ('get_mark_prices', 'symbol'),
+    'collateral_info': ('get_collateral_info_all', 'currency')
+}
+
+
+class _Batch:
+    """
+    Per-symbol requests collected during one window, satisfied by a single bulk request.
+    """
+    def __init__(self):
+        self.done = threading.Event()
+        self.items = None
+        self.error = None
+
+
+class MarketBatcher:
+    """
+    Serves per-symbol market queries from all-symbol endpoints.  Calls arriving within a short window from any thread
+    are collected and answered by one bulk request, so N concurrent get_price calls cost one get_prices call.
+
+    Attributes:
+        _markets (Markets): Markets class used for the bulk requests.
+        _window_sec (float): How long the first call of a batch waits for others to join.
+        _open (dict): Kind of query to the batch currently collecting calls.
+
+    Example:
+        batcher = MarketBatcher(client.markets())
+        with ThreadPoolExecutor(32) as executor:
+            prices = list(executor.map(batcher.get_price, symbols))
+    """
+    def __init__(self, markets, window_sec=_default_window_sec):
+        """
+        Args:
+            markets (Markets, required): Markets class used for the bulk requests.
+            window_sec (float, optional): How long the first call of a batch waits for others to join. Default 5ms.
+        """
+        self._markets = markets
+        self._window_sec = window_sec
+        self._open = {}
+        self._lock = threading.Lock()
+
+    def get_price(self, symbol):
+        """
+        Same result as Markets.get_price(symbol), served from Markets.get_prices().
+        """
+        return self._get('price', symbol)
+
+    def get_ticker24h(self, symbol):
+        """
+        Same result as Markets.get_ticker24h(symbol), served from Markets.get_ticker24h_all().
+        """
+        return self._get('ticker24h', symbol)
+
+    def get_mark_price(self, symbol):
+        """
+        Same result as Markets.get_mark_price(symbol), served from Markets.get_mark_prices().
+        """
+        return self._get('mark_price', symbol)
+
+    def get_collateral_info(self, currency):
+        """
+        Same result as Markets.get_collateral_info(currency), served from Markets.get_collateral_info_all().
+        """
+        return self._get('collateral_info', currency)
+
+    def _get(self, kind, key):
+        """
+        Joins the open batch for kind or starts a new one, then waits for the bulk result.
+
+        Raises:
+            RequestError: The bulk request failed or has no item for key.
+        """
+        with self._lock:
+            batch = self._open.get(kind)
+            leader = batch is None
+            if leader:
+                batch = _Batch()
+                self._open[kind] = batch
+
+        if leader:
+            self._run(kind, batch)
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+
+        item = batch.items.get(key)
+        if item is None:
+            raise RequestError(-1, f'No {kind} data for {key}')
+
+        return item
+
+    def _run(self, kind, batch):
+        """
+        Waits for the window to pass, closes the batch and answers it with one bulk request.
+        """
+        if self._window_sec > 0:
+            time.sleep(self._window_sec)
+
+        with self._lock:
+            del self._open[kind]
+
+        method, key_field = _bulk_endpoints[kind]
+        try:
+            response = getattr(self._markets, method)()
+            batch.items = {item.get(key_field): item for item in response}
+        except Exception as err:
+            batch.error = err
+        finally:
+            batch.done.set()
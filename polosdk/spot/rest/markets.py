@@ -1,5 +1,12 @@
 from polosdk.spot.rest.request import Request
 
+# Public market data requests per second allowed for an ip.
+_default_book_rate_limit = 200
+
+# Field names of the values in a candle row, in order, for use with streaming.to_columns.
+CANDLE_FIELDS = ('low', 'high', 'open', 'close', 'amount', 'quantity', 'buyTakerAmount', 'buyTakerQuantity',
+                 'tradeCount', 'ts', 'weightedAverage', 'interval', 'startTime', 'closeTime')
+
 
 class Markets:
     """
@@ -10,12 +17,15 @@ class Markets:
     Attributes:
         _request (Request): Class used to handle REST requests.
     """
-    def __init__(self, url=None):
+    def __init__(self, url=None, **kwargs):
         """
         Args:
             url (str, optional): Url for endpoints, default is set to PROD in Request class.
+
+        Keyword Args:
+            Forwarded to Request e.g. session, single_flight.
         """
-        self._request = Request(url=url)
+        self._request = Request(url=url, **kwargs)
 
     def getsymbol(self, symbol):
         return self._request('GET', f'/markets/{symbol}')
@@ -103,6 +113,31 @@ class Markets:
 
         return self._request('GET', f'/markets/{symbol}/candles', params=params)
 
+    def stream_candles(self, symbol, interval, start_time=None, end_time=None, **kwargs):
+        """
+        Same request as get_candles, parsed incrementally while the response is received.
+
+        Returns:
+            Generator of candle rows, see get_candles.  Use streaming.to_columns with CANDLE_FIELDS for columns.
+
+        Raises:
+            RequestError: An error occurred communicating with trade engine.
+
+        Example:
+            for candle in client.markets().stream_candles('BTC_USDT', 'MINUTE_1', limit=500):
+                print(candle)
+        """
+        params = {'interval': interval}
+        params.update(kwargs)
+
+        if start_time is not None:
+            params.update({'startTime': start_time})
+
+        if end_time is not None:
+            params.update({'endTime': end_time})
+
+        return self._request.stream('GET', f'/markets/{symbol}/candles', params=params)
+
     def get_orderbook(self, symbol, **kwargs):
         """
         Get the order book for a given symbol.
@@ -135,6 +170,32 @@ class Markets:
         """
         return self._request('GET', f'/markets/{symbol}/orderBook', params=kwargs)
 
+    def get_orderbooks(self, symbols, limit=10, max_workers=None, rate_limit=_default_book_rate_limit):
+        """
+        Get the order books of many symbols at once.  Books are requested concurrently so a snapshot of hundreds of
+        symbols takes about one round trip plus rate limiting, size the session pool to max_workers e.g.
+        Client(session=create_session(pool_size=32)) to reuse every connection.  Needs numpy.
+
+        Args:
+            symbols (str[], required): Symbol names.
+            limit (int, optional): Levels per side, one of the limit values of get_orderbook. Default 10.
+            max_workers (int, optional): Maximum requests in flight. Default 32.
+            rate_limit (float or RateLimiter, optional): Requests started per second, None for no limit, pass a shared
+                                                         RateLimiter to account for other requests. Default 200.
+
+        Returns:
+            book_snapshot.BookSnapshot object with aligned bid and ask arrays, exchange and fetch times per symbol and
+            the errors of symbols that failed.
+
+        Example:
+            snapshot = client.markets().get_orderbooks(['BTC_USDT', 'ETH_USDT'], limit=20)
+            print(snapshot.symbols, snapshot.mid())
+        """
+        from polosdk.spot.rest.book_snapshot import fetch_books, rate_limiter
+
+        return fetch_books(lambda symbol: self.get_orderbook(symbol, limit=limit), symbols, limit,
+                           max_workers=max_workers, limiter=rate_limiter(rate_limit))
+
     def get_price(self, symbol):
         """
         Get latest trade price for a symbol.
@@ -226,6 +287,21 @@ class Markets:
         """
         return self._request('GET', '/markets/ticker24h')
 
+    def stream_ticker24h_all(self):
+        """
+        Same request as get_ticker24h_all, parsed incrementally while the response is received.
+
+        Returns:
+            Generator of 24 hour ticker json objects, see get_ticker24h_all.
+
+        Raises:
+            RequestError: An error occurred communicating with trade engine.
+
+        Example:
+            closes = {ticker['symbol']: ticker['close'] for ticker in client.markets().stream_ticker24h_all()}
+        """
+        return self._request.stream('GET', '/markets/ticker24h')
+
     def get_ticker24h(self, symbol):
         """
         Retrieve ticker in last 24 hours for a given symbol.
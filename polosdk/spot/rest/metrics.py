@@ -0,0 +1,261 @@
+import bisect
+import re
+import threading
+from functools import lru_cache
+
+# Latency histogram upper bounds in seconds.
+_default_buckets = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_phases = ('sign', 'ttfb', 'download', 'parse', 'total')
+_id_segment = re.compile(r'^(\d+|cid:.+)$')
+_currency_parents = ('currencies', 'currency')
+
+
+@lru_cache(maxsize=1024)
+def endpoint_template(path):
+    """
+    Replaces the variable segments of a request path with placeholders so metrics are grouped per endpoint.
+
+    Args:
+        path (str, required): Request path e.g. /markets/BTC_USDT/candles.
+
+    Returns:
+        Path template e.g. /markets/{symbol}/candles, /orders/{id}, /currencies/{currency}.
+    """
+    segments = path.split('/')
+    for index, segment in enumerate(segments):
+        if _id_segment.match(segment):
+            segments[index] = '{id}'
+        elif index > 0 and segments[index - 1] in _currency_parents:
+            segments[index] = '{currency}'
+        elif segment == segment.upper() != segment.lower():
+            segments[index] = '{symbol}' if '_' in segment else '{currency}'
+
+    return '/'.join(segments)
+
+
+class RequestSample:
+    """
+    Timings and sizes of one REST request, passed to the metrics hook of Request.
+
+    DNS, connect and TLS time are not reported separately by requests, they are part of ttfb_sec for requests that
+    open a new connection.
+
+    Attributes:
+        method (str): Request method e.g. GET.
+        endpoint (str): Path template e.g. /markets/{symbol}/candles.
+        status (int): Http status code, None when no response was received.
+        error (Exception): Error raised to the caller, None on success.
+        request_bytes (int): Size of the request body.
+        response_bytes (int): Size of the response body.
+        sign_sec (float): Time spent encoding and signing the request.
+        ttfb_sec (float): Time from sending the request until the response headers were received.
+        download_sec (float): Time spent receiving the response body.
+        parse_sec (float): Time spent decoding the response body.
+        total_sec (float): Time spent in the call.
+    """
+    def __init__(self, method, endpoint):
+        self.method = method
+        self.endpoint = endpoint
+        self.status = None
+        self.error = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.sign_sec = None
+        self.ttfb_sec = None
+        self.download_sec = None
+        self.parse_sec = None
+        self.total_sec = None
+
+    def phase(self, name):
+        return getattr(self, f'{name}_sec')
+
+
+class Histogram:
+    """
+    Fixed bucket histogram of durations.
+
+    Attributes:
+        buckets (tuple): Bucket upper bounds in seconds, a final unbounded bucket is implied.
+        counts (list): Observations per bucket.
+        count (int): Number of observations.
+        sum (float): Sum of observations.
+        max (float): Largest observation.
+    """
+    def __init__(self, buckets=_default_buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """
+        Returns:
+            Upper bound of the bucket holding the q quantile, max for the unbounded bucket, None when empty.
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count > 0:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean': self.sum / self.count if self.count else None,
+            'p50': self.quantile(0.5),
+            'p99': self.quantile(0.99),
+            'max': self.max
+        }
+
+
+class _EndpointStats:
+    def __init__(self, buckets):
+        self.count = 0
+        self.errors = 0
+        self.status = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.phases = {phase: Histogram(buckets) for phase in _phases}
+
+    def observe(self, sample):
+        self.count += 1
+        self.errors += sample.error is not None
+        self.status[sample.status] = self.status.get(sample.status, 0) + 1
+        self.request_bytes += sample.request_bytes
+        self.response_bytes += sample.response_bytes
+
+        for phase, histogram in self.phases.items():
+            value = sample.phase(phase)
+            if value is not None:
+                histogram.observe(value)
+
+
+class RequestMetrics:
+    """
+    In process aggregation of request samples per method and endpoint template.  Pass an instance as the metrics hook
+    of Request, Client, Public or Private.
+
+    Attributes:
+        _buckets (tuple): Latency histogram upper bounds in seconds.
+        _endpoints (dict): (method, endpoint) to aggregated statistics.
+
+    Example:
+        metrics = RequestMetrics()
+        client = Client(api_key, api_secret, metrics=metrics)
+        client.markets().get_candles('BTC_USDT', 'MINUTE_1')
+        print(metrics.snapshot()['GET /markets/{symbol}/candles']['ttfb'])
+    """
+    def __init__(self, buckets=_default_buckets):
+        """
+        Args:
+            buckets (tuple, optional): Latency histogram upper bounds in seconds. Default 1ms to 10s.
+        """
+        self._buckets = buckets
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, sample):
+        key = (sample.method, sample.endpoint)
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = _EndpointStats(self._buckets)
+                self._endpoints[key] = stats
+
+            stats.observe(sample)
+
+    def snapshot(self):
+        """
+        Returns:
+            Dictionary of 'METHOD endpoint' to count, errors, status counts, byte totals and a count, mean, p50, p99
+            and max summary per phase (sign, ttfb, download, parse, total).
+        """
+        with self._lock:
+            snapshot = {}
+            for (method, endpoint), stats in self._endpoints.items():
+                entry = {
+                    'count': stats.count,
+                    'errors': stats.errors,
+                    'status': dict(stats.status),
+                    'request_bytes': stats.request_bytes,
+                    'response_bytes': stats.response_bytes
+                }
+                entry.update({phase: histogram.summary() for phase, histogram in stats.phases.items()})
+                snapshot[f'{method} {endpoint}'] = entry
+
+            return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._endpoints = {}
+
+
+class PrometheusExporter:
+    """
+    Exports request samples as Prometheus metrics, pass an instance as the metrics hook of Request, Client, Public or
+    Private.  Needs prometheus_client.
+
+    Metrics:
+        <namespace>_rest_request_seconds (histogram): Labels method, endpoint, phase.
+        <namespace>_rest_responses_total (counter): Labels method, endpoint, status, status is 'error' when no
+                                                    response was received.
+        <namespace>_rest_request_bytes_total (counter): Labels method, endpoint.
+        <namespace>_rest_response_bytes_total (counter): Labels method, endpoint.
+
+    Example:
+        prometheus_client.start_http_server(8000)
+        client = Client(api_key, api_secret, metrics=PrometheusExporter())
+    """
+    def __init__(self, registry=None, namespace='polosdk', buckets=_default_buckets):
+        """
+        Args:
+            registry (prometheus_client.CollectorRegistry, optional): Registry to register with. Default registry.
+            namespace (str, optional): Metric name prefix. Default polosdk.
+            buckets (tuple, optional): Latency histogram upper bounds in seconds. Default 1ms to 10s.
+
+        Raises:
+            ImportError: prometheus_client is not installed.
+        """
+        try:
+            import prometheus_client
+        except ImportError:
+            raise ImportError('PrometheusExporter requires prometheus_client, install it with: '
+                              'pip install prometheus_client')
+
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+
+        labels = ('method', 'endpoint')
+        self._seconds = prometheus_client.Histogram('rest_request_seconds', 'REST request duration by phase',
+                                                    labels + ('phase',), namespace=namespace, buckets=buckets,
+                                                    registry=registry)
+        self._responses = prometheus_client.Counter('rest_responses', 'REST responses by status',
+                                                    labels + ('status',), namespace=namespace, registry=registry)
+        self._request_bytes = prometheus_client.Counter('rest_request_bytes', 'REST request body bytes', labels,
+                                                        namespace=namespace, registry=registry)
+        self._response_bytes = prometheus_client.Counter('rest_response_bytes', 'REST response body bytes', labels,
+                                                         namespace=namespace, registry=registry)
+
+    def __call__(self, sample):
+        for phase in _phases:
+            value = sample.phase(phase)
+            if value is not None:
+                self._seconds.labels(sample.method, sample.endpoint, phase).observe(value)
+
+        status = str(sample.status) if sample.status is not None else 'error'
+        self._responses.labels(sample.method, sample.endpoint, status).inc()
+        self._request_bytes.labels(sample.method, sample.endpoint).inc(sample.request_bytes)
+        self._response_bytes.labels(sample.method, sample.endpoint).inc(sample.response_bytes)
@@ -1,5 +1,9 @@
+from polosdk.spot.rest import batch
 from polosdk.spot.rest.request import Request
 
+_max_batch_orders = 20
+_max_cancel_ids = 20
+
 
 class Orders:
     """
@@ -7,16 +11,22 @@ class Orders:
 这里是私有的orders+trsdes+order history
     Attributes:
         _request (Request): Class used to handle REST requests.
+        _validator (OrderValidator): Optional pre-trade checks run before orders are sent.
     """
 
-    def __init__(self, api_key, api_secret, url=None):
+    def __init__(self, api_key, api_secret, url=None, validator=None, **kwargs):
         """
         Args:
             api_key (str, required): User api key used for authentication.
             api_secret (str, required): User api secret used for authentication.
             url (str, optional): Url for endpoints, default is set to PROD in Request class.
+            validator (OrderValidator, optional): Pre-trade checks run locally before create and create_multiple.
+
+        Keyword Args:
+            Forwarded to Request e.g. session, single_flight.
         """
-        self._request = Request(api_key, api_secret, url)
+        self._request = Request(api_key, api_secret, url, **kwargs)
+        self._validator = validator
 
     def get_all(self, account_type=None, begins_from=None, **kwargs):
         """
@@ -103,6 +113,7 @@ class Orders:
 
         Raises:
             RequestError: An error occurred communicating with trade engine.
+            OrderValidationError: The order failed the validator's pre-trade checks.
 
         Example:
             Limit Buy 0.00025 BTC_USDT at 18,000.00 when price hits 20000 USDT:
@@ -137,6 +148,9 @@ class Orders:
         if allow_borrow is not None:
             body.update({'allowBorrow': allow_borrow})
 
+        if self._validator is not None:
+            self._validator.validate(body)
+
         return self._request('POST', '/orders', True, body=body)
 
     def cancel(self, symbol=None, account_type=None):
@@ -373,6 +387,37 @@ class Orders:
 
         return self._request('DELETE', '/orders/cancelByIds', True, body=body)
 
+    def cancel_batch(self, order_ids=None, client_order_ids=None, max_workers=None):
+        """
+        Cancel any number of active orders by ids. Ids are split into batches of 20, the batches are sent
+        concurrently and the results are returned as one list. Order_ids or client_order_ids is required.
+
+        Args:
+            order_ids (str[], optional): List of order ids
+            client_order_ids (str[], optional): List of client order ids
+            max_workers (int, optional): Maximum number of batches in flight. Default 8.
+
+        Returns:
+            List of json objects with information on deleted orders, see cancel_by_multiple_ids. Ids of batches that
+            failed as a whole are reported as:
+            {
+                'orderId' or 'clientOrderId': (str) The id that was not canceled,
+                'code': (int) Error code, -1 for errors raised locally,
+                'message': (str) Error message
+            }
+
+        Example:
+            response = client.orders().cancel_batch(order_ids=open_order_ids)
+            print([item for item in response if item.get('code') not in (None, 200)])
+        """
+        if order_ids is None and client_order_ids is None:
+            raise ValueError('cancel_batch requires order_ids or client_order_ids')
+
+        def send(body):
+            return self._request('DELETE', '/orders/cancelByIds', True, body=body)
+
+        return batch.cancel_by_ids(send, order_ids or [], client_order_ids or [], _max_cancel_ids, max_workers)
+
     def get_history(self, account_type=None, hide_cancel=None, start_time=None, end_time=None, begins_from=None,
                     **kwargs):
         """
@@ -636,6 +681,7 @@ class Orders:
 
         Raises:
             RequestError: An error occurred communicating with trade engine.
+            OrderValidationError: An order failed the validator's pre-trade checks, no order is sent.
 
         Example:
         multi_order_request =
@@ -667,21 +713,97 @@ class Orders:
         """
         body = []
         for order in orders:
-            order_request = {}
-            order_request.update(order)
+            order_request = self._order_request(order)
 
-            if 'time_in_force' in order_request.keys():
-                order_request.update({'timeInForce': order_request['time_in_force']})
-                order_request.pop('time_in_force')
-
-            if 'account_type' in order_request.keys():
-                order_request.update({'accountType': order_request['account_type']})
-                order_request.pop('account_type')
-
-            if 'client_order_id' in order_request.keys():
-                order_request.update({'clientOrderId': order_request['client_order_id']})
-                order_request.pop('client_order_id')
+            if self._validator is not None:
+                self._validator.validate(order_request)
 
             body.append(order_request)
 
         return self._request('POST', '/orders/batch', True, body=body)
+
+    def create_batch(self, orders, max_workers=None):
+        """
+        Create any number of orders. Orders are split into batches of 20, the batches are sent concurrently and the
+        results are merged back in input order. Orders failing the validator and batches failing as a whole are
+        reported per order instead of raising.
+
+        Args:
+            orders ([{}], required): List of dictionaries with parameters for one order each, see create_multiple.
+            max_workers (int, optional): Maximum number of batches in flight. Default 8.
+
+        Returns:
+            List of json objects in the same order as orders, each either the order id and client order id or an
+            error:
+            [
+                {
+                    'id': (str) Order id,
+                    'clientOrderId': (str) ClientOrderId user specifies in request or an empty string
+                },
+                {
+                    'code': (int) Error code, -1 for errors raised locally,
+                    'message': (str) Error message
+                },
+                ...
+            ]
+
+        Example:
+            response = client.orders().create_batch(basket)
+            failed = [order for order, result in zip(basket, response) if 'code' in result]
+        """
+        results = [None] * len(orders)
+        pending = []
+
+        for index, order in enumerate(orders):
+            order_request = self._order_request(order)
+
+            if self._validator is not None:
+                try:
+                    self._validator.validate(order_request)
+                except ValueError as err:
+                    results[index] = batch.error_item(err)
+                    continue
+
+            pending.append((index, order_request))
+
+        def send(chunk):
+            return self._request('POST', '/orders/batch', True, body=[order_request for _, order_request in chunk])
+
+        chunks = batch.chunked(pending, _max_batch_orders)
+        for chunk, (response, err) in zip(chunks, batch.fan_out(send, chunks, max_workers)):
+            for position, (index, _) in enumerate(chunk):
+                if err is not None:
+                    results[index] = batch.error_item(err)
+                elif isinstance(response, list) and position < len(response):
+                    results[index] = response[position]
+                else:
+                    results[index] = batch.error_item(RuntimeError('Missing result for order in batch response'))
+
+        return results
+
+    def _order_request(self, order):
+        """
+        Converts the snake case keys of an order dictionary to the request body keys.
+
+        Args:
+            order (dict, required): Order parameters, see create_multiple.
+
+        Returns:
+            Order request body.
+        """
+        order_request = {}
+        order_request.update(order)
+
+        if 'time_in_force' in order_request.keys():
+            order_request.update({'timeInForce': order_request['time_in_force']})
+            order_request.pop('time_in_force')
+
+        if 'account_type' in order_request.keys():
+            order_request.update({'accountType': order_request['account_type']})
+            order_request.pop('account_type')
+
+        if 'client_order_id' in order_request.keys():
+            order_request.update({'clientOrderId': order_request['client_order_id']})
+            order_request.pop('client_order_id')
+
+        return order_request
@@ -2,14 +2,26 @@ import json
 import urllib
 
 import requests
+import requests.adapters
 import base64
+import threading
 import hashlib
 import hmac
+import socket
+import time
 from datetime import datetime
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
+
+from polosdk.spot.rest.batch import fan_out
+from polosdk.spot.rest.metrics import RequestSample, endpoint_template
+from polosdk.spot.rest.streaming import iter_items
+from polosdk.spot.rest.transport import create_http2_session
 
 
 _default_url = 'https://api.poloniex.com'
+_default_pool_size = 10
+_default_chunk_size = 65536
+_default_warmup_path = '/timestamp'
 
 
 class RequestError(Exception):
@@ -29,10 +41,49 @@ class RequestError(Exception):
         return f'code: {self.code}, message: {self.message}'
 
 
+def create_session(pool_size=_default_pool_size, http2=False):
+    """
+    Creates a session with a keep-alive connection pool that can be shared by several Request objects.
+
+    Args:
+        pool_size (int, optional): Maximum number of pooled connections per host. Default 10.
+        http2 (bool, optional): Create an HTTP/2 session multiplexing requests over a few connections instead, needs
+                                httpx with HTTP/2 support. Default false.
+
+    Returns:
+        requests.Session or transport.Http2Session object.
+    """
+    if http2:
+        return create_http2_session()
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 def encode_uri_component(component):
     return urllib.parse.quote(str(component), safe='~()*!\'')
 #**urllib.parse.quote(...)**：使用 quote 函数对字符串进行 URL 编码。它会将字符串中不安全的字符替换为其百分号编码的形式。
 
+class _Call:
+    """
+    A request in flight whose result is shared by every caller that asked for it.
+    """
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+
+        return self.result
+
+
 class Request:
     """
     Creates, authenticates and handles responses from trade engine.
@@ -42,19 +93,39 @@ class Request:
          _api_secret (str): User api key used for authentication.
          _url (str): Url used for communicating with server.
          _timeout_sec (int): Timeout for REST connections.
+         _session (requests.Session): Connection pool used to send requests.
+         _single_flight (bool): Whether concurrent identical GET requests share one in-flight request.
+         _metrics (func(RequestSample)): Hook receiving per-request timings.
     """
-    def __init__(self, api_key=None, api_secret=None, url=None, timeout_sec=5):
+    def __init__(self, api_key=None, api_secret=None, url=None, timeout_sec=5, session=None, single_flight=False,
+                 http2=False, metrics=None):
         """
         Args:
             api_key (str, required): User api key used for authentication.
             api_secret (str, required): User api key used for authentication.
             url (str, optional): Url used for communicating with server. Default Production url.
             timeout_sec (int, optional): Timeout for REST connections. Default 5 seconds.
+            session (requests.Session, optional): Connection pool to send requests with, share one between Request
+                                                  objects to reuse connections. Default is a new session.
+            single_flight (bool, optional): When true, a GET issued while an identical GET (same path, params and
+                                            auth) is in flight waits for and returns that request's result instead of
+                                            sending another one. Shared results must not be mutated. Default false.
+            http2 (bool, optional): When no session is given, create an HTTP/2 session, see create_session. Default
+                                    false.
+            metrics (func(RequestSample), optional): Called after every request with its timings, status and sizes
+                                                     e.g. a metrics.RequestMetrics or metrics.PrometheusExporter.
+                                                     Default None.
         """
         self._api_key = api_key
         self._api_secret = api_secret.encode('utf8') if api_secret is not None else None
         self._url = url or _default_url
         self._timeout_sec = timeout_sec
+        self._session = session if session is not None else create_session(http2=http2)
+        self._single_flight = single_flight
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+        self._keep_alive = None
+        self._metrics = metrics
 
     def __call__(self, method, path, auth=False, params={}, body={}):
         """
@@ -74,9 +145,135 @@ class Request:
             RequestError: An error occurred communicating with trade engine.
             RuntimeError: An error occurred parsing the response from the server.
         """
-        headers = {}
         method = method.upper()
 
+        if self._single_flight and method == 'GET':
+            return self._shared_call(method, path, auth, params or {})
+
+        return self._send(method, path, auth, params, body)
+
+    def warmup(self, connections=1, keep_alive_sec=None, path=_default_warmup_path):
+        """
+        Resolves the host and opens pooled connections ahead of time, so the first real request does not pay for DNS
+        resolution, TCP connect and TLS handshake.  Optionally keeps the connections open with periodic light requests,
+        reused connections also skip DNS resolution.
+
+        Args:
+            connections (int, optional): Number of connections to open, at most the session's pool size. Default 1.
+            keep_alive_sec (float, optional): When set, repeats the warmup requests at this interval on a background
+                                              thread until stop_keep_alive is called. Default None.
+            path (str, optional): Public endpoint used for the warmup requests. Default /timestamp.
+
+        Returns:
+            Number of connections opened successfully.
+
+        Raises:
+            OSError: The host could not be resolved.
+        """
+        parsed = urlparse(self._url)
+        socket.getaddrinfo(parsed.hostname, parsed.port or (443 if parsed.scheme == 'https' else 80),
+                           type=socket.SOCK_STREAM)
+
+        warmed = self._open_connections(connections, path)
+
+        if keep_alive_sec is not None:
+            self.stop_keep_alive()
+            self._keep_alive = threading.Event()
+            thread = threading.Thread(target=self._run_keep_alive,
+                                      args=(self._keep_alive, connections, keep_alive_sec, path),
+                                      daemon=True)
+            thread.start()
+
+        return warmed
+
+    def stop_keep_alive(self):
+        """
+        Stops the keep-alive requests started by warmup.
+        """
+        if self._keep_alive is not None:
+            self._keep_alive.set()
+            self._keep_alive = None
+
+    def _open_connections(self, connections, path):
+        """
+        Sends concurrent requests so each one takes its own connection from the pool.
+        """
+        results = fan_out(lambda _: self._send('GET', path, False, {}, {}), list(range(connections)), connections)
+        return sum(1 for _, err in results if err is None)
+
+    def _run_keep_alive(self, stopped, connections, interval_sec, path):
+        while not stopped.wait(interval_sec):
+            self._open_connections(connections, path)
+
+    def _shared_call(self, method, path, auth, params):
+        """
+        Executes a request unless an identical one is already in flight, in which case its result or error is shared.
+        """
+        key = (method, path, auth, tuple(sorted((k, str(v)) for k, v in params.items())))
+
+        with self._in_flight_lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._in_flight[key] = call
+
+        if not leader:
+            return call.wait()
+
+        try:
+            call.result = self._send(method, path, auth, params, {})
+        except Exception as err:
+            call.error = err
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+            call.done.set()
+
+        return call.wait()
+
+    def stream(self, method, path, auth=False, params={}, body={}, item_key=None, chunk_size=_default_chunk_size):
+        """
+        Executes a server request and parses the response incrementally while it is received, instead of buffering
+        the whole body before decoding it.  Lowers peak memory and time to first record for large responses.
+
+        Args:
+            method (str, required): Method for request e.g. GET, POST, PUT, DELETE.
+            path (str, required): Endpoint path that is added to base url e.g. /accounts, /markets.
+            auth (bool, optional): Where or not this call requires authentication.
+            params (dict, optional): Dictionary of parameters to be passed as arguments in the url.
+            body (dict, optional): Dictionary of parameters to be passed as arguments in the body.
+            item_key (str, optional): Key of the array to stream when the response is a json object e.g. 'data'.
+            chunk_size (int, optional): Bytes read from the socket at a time. Default 64KiB.
+
+        Returns:
+            Generator of the elements of the response array.  The connection is released when the generator is
+            exhausted or closed.
+
+        Raises:
+            RequestError: An error occurred communicating with trade engine.
+            RuntimeError: An error occurred parsing the response from the server.
+        """
+        method = method.upper()
+        response = self._session.request(method, stream=True, **self._prepare(method, path, auth, params, body))
+
+        try:
+            if response.status_code != 200:
+                self._parse(response)
+
+            yield from iter_items(response.iter_content(chunk_size), item_key)
+        finally:
+            response.close()
+
+    def _prepare(self, method, path, auth, params, body):
+        """
+        Builds url, headers and encoded body of a request, signed when auth is set.
+
+        Returns:
+            Dictionary of keyword arguments for requests.Session.request.
+        """
+        headers = {}
+
         if len(body) > 0:
             headers.update({'content-type': 'application/json'})
             body = json.dumps(body)
@@ -87,13 +284,65 @@ class Request:
             else:
                 raise RequestError(-1, "Authenticated endpoints required api_secret and api_key to be set.")
 
-        url = urljoin(self._url, path)
-        response = requests.request(method,
-                                    url,
-                                    headers=headers,
-                                    timeout=self._timeout_sec,
-                                    params=params,
-                                    data=body)
+        return {
+            'url': urljoin(self._url, path),
+            'headers': headers,
+            'timeout': self._timeout_sec,
+            'params': params,
+            'data': body
+        }
+
+    def _send(self, method, path, auth, params, body):
+        """
+        Sends a request and parses the response, see __call__.
+        """
+        if self._metrics is not None:
+            return self._send_measured(method, path, auth, params, body)
+
+        response = self._session.request(method, **self._prepare(method, path, auth, params, body))
+        return self._parse(response)
+
+    def _send_measured(self, method, path, auth, params, body):
+        """
+        Same as _send, timing each phase of the request and reporting it to the metrics hook.
+        """
+        sample = RequestSample(method, endpoint_template(path))
+        start = time.perf_counter()
+
+        try:
+            kwargs = self._prepare(method, path, auth, params, body)
+            prepared = time.perf_counter()
+            sample.sign_sec = prepared - start
+            sample.request_bytes = len(kwargs['data']) if isinstance(kwargs['data'], str) else 0
+
+            # Stream so the body download is timed apart from the wait for the response headers.
+            response = self._session.request(method, stream=True, **kwargs)
+            received = time.perf_counter()
+            sample.ttfb_sec = received - prepared
+            sample.status = response.status_code
+
+            sample.response_bytes = len(response.content)
+            downloaded = time.perf_counter()
+            sample.download_sec = downloaded - received
+
+            result = self._parse(response)
+            sample.parse_sec = time.perf_counter() - downloaded
+            return result
+        except Exception as err:
+            sample.error = err
+            raise
+        finally:
+            sample.total_sec = time.perf_counter() - start
+            try:
+                self._metrics(sample)
+            except Exception:
+                # A failing metrics hook must not fail the request.
+                pass
+
+    def _parse(self, response):
+        """
+        Decodes a response, see __call__.
+        """
         try:
             response_json = response.json()
         except Exception:
@@ -0,0 +1,167 @@
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError('Candle resampling requires numpy, install it with: pip install numpy')
+
+from polosdk.spot.rest.markets import CANDLE_FIELDS
+from polosdk.spot.ws.channels import CANDLE_INTERVAL_MS
+
+_float_fields = ('low', 'high', 'open', 'close', 'amount', 'quantity', 'buyTakerAmount', 'buyTakerQuantity',
+                 'weightedAverage')
+_int_fields = ('tradeCount', 'ts', 'startTime', 'closeTime')
+_sum_fields = ('amount', 'quantity', 'buyTakerAmount', 'buyTakerQuantity', 'tradeCount')
+# Weekly candles start on Monday 00:00 UTC, epoch time 0 was a Thursday.
+_week_offset_ms = 4 * 86400000
+
+
+def candles_to_arrays(candles):
+    """
+    Converts candles to numpy columns sorted by start time.
+
+    Args:
+        candles (list or dict, required): Candle rows as returned by get_candles or stream_candles, or a dictionary
+                                          of columns e.g. from streaming.to_columns.
+
+    Returns:
+        Dictionary of CANDLE_FIELDS to numpy arrays, prices and volumes as float64, counts and times as int64.
+    """
+    if isinstance(candles, dict):
+        columns = candles
+    else:
+        rows = candles if isinstance(candles, list) else list(candles)
+        columns = {field: [row[index] for row in rows] for index, field in enumerate(CANDLE_FIELDS)}
+
+    arrays = {}
+    for field in _float_fields:
+        arrays[field] = np.asarray(columns[field], dtype=np.float64)
+    for field in _int_fields:
+        arrays[field] = np.asarray(columns[field], dtype=np.int64)
+    arrays['interval'] = np.asarray(columns['interval'], dtype=str)
+
+    start = arrays['startTime']
+    if len(start) > 1 and np.any(start[1:] < start[:-1]):
+        order = np.argsort(start, kind='stable')
+        arrays = {field: values[order] for field, values in arrays.items()}
+
+    return arrays
+
+
+def bucket_starts(start_times, interval):
+    """
+    Args:
+        start_times (numpy.ndarray, required): Times in ms since epoch.
+        interval (str or int, required): One of CANDLE_INTERVALS or a length in ms.
+
+    Returns:
+        Array with the start of the interval each time falls in, WEEK_1 starts on Monday and MONTH_1 on the first of the
+        month, both in UTC.
+    """
+    if interval == 'MONTH_1':
+        months = start_times.astype('datetime64[ms]').astype('datetime64[M]')
+        return months.astype('datetime64[ms]').astype(np.int64)
+
+    length = _interval_ms(interval)
+    offset = _week_offset_ms if interval == 'WEEK_1' else 0
+    return start_times - (start_times - offset) % length
+
+
+def resample(candles, interval, drop_partial=False):
+    """
+    Aggregates finer candles, usually MINUTE_1, into a coarser interval in one vectorized pass.  Open and close come
+    from the first and last candle of each bucket, high and low are the extremes, volumes and trade counts are summed
+    and the weighted average is recomputed as amount / quantity.  Buckets without candles are omitted.
+
+    Args:
+        candles (list or dict, required): Candles as accepted by candles_to_arrays.
+        interval (str or int, required): One of CANDLE_INTERVALS or a length in ms.
+        drop_partial (bool, optional): Drop the first and last bucket when the candles do not cover them fully, e.g.
+                                       the current, still open period. Default false.
+
+    Returns:
+        Dictionary of CANDLE_FIELDS to numpy arrays, one value per bucket.
+
+    Raises:
+        ValueError: Interval is not supported.
+
+    Example:
+        minutes = candles_to_arrays(client.markets().stream_candles('BTC_USDT', 'MINUTE_1', start_time, end_time))
+        hours = resample(minutes, 'HOUR_4')
+    """
+    arrays = candles_to_arrays(candles)
+    start_time = arrays['startTime']
+    if len(start_time) == 0:
+        return arrays
+
+    buckets = bucket_starts(start_time, interval)
+    first = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    last = np.r_[first[1:], len(buckets)] - 1
+
+    result = {
+        'low': np.minimum.reduceat(arrays['low'], first),
+        'high': np.maximum.reduceat(arrays['high'], first),
+        'open': arrays['open'][first],
+        'close': arrays['close'][last],
+        'ts': arrays['ts'][last]
+    }
+    for field in _sum_fields:
+        result[field] = np.add.reduceat(arrays[field], first)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result['weightedAverage'] = np.where(result['quantity'] > 0, result['amount'] / result['quantity'],
+                                             result['close'])
+
+    starts = buckets[first]
+    ends = _bucket_ends(starts, interval)
+    result['interval'] = np.full(len(first), interval if isinstance(interval, str) else str(interval))
+    result['startTime'] = starts
+    result['closeTime'] = ends - 1
+
+    if drop_partial:
+        keep = np.ones(len(first), dtype=bool)
+        keep[0] = start_time[0] == starts[0]
+        keep[-1] &= arrays['closeTime'][-1] >= ends[-1] - 1
+        result = {field: values[keep] for field, values in result.items()}
+
+    return {field: result[field] for field in CANDLE_FIELDS}
+
+
+def resample_many(candles, intervals, drop_partial=False):
+    """
+    Resamples the same candles to several intervals, converting them only once.
+
+    Returns:
+        Dictionary of interval to resampled columns, see resample.
+    """
+    arrays = candles_to_arrays(candles)
+    return {interval: resample(arrays, interval, drop_partial) for interval in intervals}
+
+
+def to_rows(columns):
+    """
+    Converts columns back to candle rows in get_candles field order.
+
+    Returns:
+        List of candle rows.
+    """
+    return [list(row) for row in zip(*(columns[field].tolist() for field in CANDLE_FIELDS))]
+
+
+def _interval_ms(interval):
+    if isinstance(interval, str):
+        if interval not in CANDLE_INTERVAL_MS:
+            raise ValueError(f'interval must be a length in ms or one of {", ".join(CANDLE_INTERVAL_MS)}, MONTH_1')
+
+        return CANDLE_INTERVAL_MS[interval]
+
+    if interval <= 0:
+        raise ValueError('interval must be positive')
+
+    return int(interval)
+
+
+def _bucket_ends(starts, interval):
+    if interval == 'MONTH_1':
+        months = starts.astype('datetime64[ms]').astype('datetime64[M]') + 1
+        return months.astype('datetime64[ms]').astype(np.int64)
+
+    return starts + _interval_ms(interval)
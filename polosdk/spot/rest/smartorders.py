@@ -1,5 +1,8 @@
+from polosdk.spot.rest import batch
 from polosdk.spot.rest.request import Request
 
+_max_cancel_ids = 20
+
 
 class SmartOrders:
     """
@@ -8,14 +11,17 @@ class SmartOrders:
     Attributes:
         _request (Request): Class used to handle REST requests.
     """
-    def __init__(self, api_key, api_secret, url=None):
+    def __init__(self, api_key, api_secret, url=None, **kwargs):
         """
         Args:
             api_key (str, required): User api key used for authentication.
             api_secret (str, required): User api secret used for authentication.
             url (str, optional): Url for endpoints, default is set to PROD in Request class.
+
+        Keyword Args:
+            Forwarded to Request e.g. session, single_flight.
         """
-        self._request = Request(api_key, api_secret, url)
+        self._request = Request(api_key, api_secret, url, **kwargs)
 
     def get_all(self, **kwargs):
         """
@@ -370,6 +376,37 @@ class SmartOrders:
 
         return self._request('DELETE', '/smartorders/cancelByIds', True, body=body)
 
+    def cancel_batch(self, order_ids=None, client_order_ids=None, max_workers=None):
+        """
+        Cancel any number of active smart orders by ids. Ids are split into batches of 20, the batches are sent
+        concurrently and the results are returned as one list. Order_ids or client_order_ids is required.
+
+        Args:
+            order_ids (str[], optional): List of order ids
+            client_order_ids (str[], optional): List of client order ids
+            max_workers (int, optional): Maximum number of batches in flight. Default 8.
+
+        Returns:
+            List of json objects with information on deleted orders, see cancel_by_multiple_ids. Ids of batches that
+            failed as a whole are reported as:
+            {
+                'orderId' or 'clientOrderId': (str) The id that was not canceled,
+                'code': (int) Error code, -1 for errors raised locally,
+                'message': (str) Error message
+            }
+
+        Example:
+            response = client.smartorders().cancel_batch(order_ids=open_order_ids)
+            print([item for item in response if item.get('code') not in (None, 200)])
+        """
+        if order_ids is None and client_order_ids is None:
+            raise ValueError('cancel_batch requires order_ids or client_order_ids')
+
+        def send(body):
+            return self._request('DELETE', '/smartorders/cancelByIds', True, body=body)
+
+        return batch.cancel_by_ids(send, order_ids or [], client_order_ids or [], _max_cancel_ids, max_workers)
+
     def get_history(self, account_type=None, hide_cancel=None, start_time=None, end_time=None, begins_from=None, **kwargs):
         """
         Get a list of historical smart orders in an account.
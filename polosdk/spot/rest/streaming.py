@@ -0,0 +1,195 @@
+import codecs
+import json
+
+_whitespace = ' \t\n\r'
+# Characters a number can end with in a chunk while continuing in the next, e.g. '1.' of '1.25'.
+_number_continuations = '.eE+-'
+_decoder = json.JSONDecoder()
+
+
+class _Buffer:
+    """
+    Decoded text read from an iterator of byte chunks, compacted as values are consumed so memory stays proportional
+    to the largest single value rather than the whole response.
+    """
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, min_length=0):
+        """
+        Reads chunks until the buffer holds at least min_length characters after pos.
+
+        Returns:
+            False when the input was exhausted before anything new was read.
+        """
+        if self.eof:
+            return False
+
+        parts = [self.text[self.pos:]]
+        length = len(parts[0])
+        read = False
+
+        while not read or length < min_length:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                parts.append(self._utf8.decode(b'', final=True))
+                self.eof = True
+                break
+
+            text = self._utf8.decode(chunk)
+            parts.append(text)
+            length += len(text)
+            read = True
+
+        self.text = ''.join(parts)
+        self.pos = 0
+        return read or len(parts[-1]) > 0
+
+    def peek(self):
+        """
+        Skips whitespace and returns the next character, None at end of input.
+        """
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _whitespace:
+                self.pos += 1
+
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+
+            if not self.fill():
+                return None
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise RuntimeError(f'Expected {char!r} in response, found {found!r}')
+
+        self.pos += 1
+
+    def value(self):
+        """
+        Decodes the next complete JSON value.
+        """
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                # The value continues in later chunks, grow the buffer geometrically so large values are not
+                # re-decoded once per chunk.
+                if not self.fill(2 * (len(self.text) - self.pos)):
+                    raise RuntimeError('Truncated JSON in response')
+                continue
+
+            # A number or literal ending at the end of the buffer may continue in the next chunk, including numbers
+            # decoded short because the buffer ends right after a '.', exponent or sign.
+            if not self.eof and self.text[end:].strip(_number_continuations) == '' and self.fill():
+                continue
+
+            self.pos = end
+            return obj
+
+
+def _iter_array(buffer):
+    buffer.expect('[')
+    if buffer.peek() == ']':
+        buffer.pos += 1
+        return
+
+    while True:
+        yield buffer.value()
+
+        separator = buffer.peek()
+        buffer.pos += 1
+        if separator == ']':
+            return
+
+        if separator != ',':
+            raise RuntimeError(f'Expected \',\' or \']\' in response, found {separator!r}')
+
+
+def iter_items(chunks, item_key=None):
+    """
+    Incrementally parses a JSON document from byte chunks, yielding each element of its array as soon as it has been
+    received.  Only one element is held decoded at a time.
+
+    Args:
+        chunks (iterable, required): Byte chunks e.g. requests.Response.iter_content().
+        item_key (str, optional): When the document is an object, the key of the array to stream e.g. 'data' for
+                                  futures responses.  Other members are parsed and discarded.
+
+    Returns:
+        Generator of decoded array elements.  A document that is neither an array nor an object yields itself once.
+
+    Raises:
+        RuntimeError: The response is not valid JSON, or an object without item_key.
+    """
+    buffer = _Buffer(chunks)
+    start = buffer.peek()
+
+    if start == '[':
+        yield from _iter_array(buffer)
+        return
+
+    if start != '{' or item_key is None:
+        yield buffer.value()
+        return
+
+    buffer.pos += 1
+    found = False
+    if buffer.peek() != '}':
+        while True:
+            key = buffer.value()
+            buffer.expect(':')
+
+            if key == item_key:
+                found = True
+
+            if key == item_key and buffer.peek() == '[':
+                yield from _iter_array(buffer)
+            else:
+                buffer.value()
+
+            separator = buffer.peek()
+            buffer.pos += 1
+            if separator == '}':
+                break
+
+            if separator != ',':
+                raise RuntimeError(f'Expected \',\' or \'}}\' in response, found {separator!r}')
+
+    if not found:
+        raise RuntimeError(f'Expected {item_key!r} in response')
+
+
+def to_columns(items, fields, converters=None):
+    """
+    Collects streamed rows into columns.
+
+    Args:
+        items (iterable, required): Rows, either lists in field order e.g. candles or json objects.
+        fields (tuple, required): Column names, positions for list rows and keys for json objects.
+        converters (dict, optional): Column name to function applied to each value e.g. {'close': float}.
+
+    Returns:
+        Dictionary of column name to list of values.
+
+    Example:
+        columns = to_columns(client.markets().stream_candles('BTC_USDT', 'MINUTE_1', limit=500), CANDLE_FIELDS,
+                             converters={'close': float, 'startTime': int})
+    """
+    converters = converters or {}
+    columns = {field: [] for field in fields}
+    appends = [(columns[field].append, converters.get(field), index, field) for index, field in enumerate(fields)]
+
+    for item in items:
+        keyed = isinstance(item, dict)
+        for append, convert, index, field in appends:
+            value = item.get(field) if keyed else item[index]
+            append(convert(value) if convert is not None and value is not None else value)
+
+    return columns
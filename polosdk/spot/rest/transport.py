@@ -0,0 +1,122 @@
+_default_max_connections = 2
+
+
+def create_http2_session(max_connections=_default_max_connections):
+    """
+    Creates an HTTP/2 session that multiplexes concurrent requests over a few connections instead of opening one
+    connection per request in flight.  Drop-in replacement for the requests.Session used by Request.
+
+    Args:
+        max_connections (int, optional): Maximum number of connections per host. Default 2.
+
+    Returns:
+        Http2Session object.
+
+    Raises:
+        ImportError: httpx with HTTP/2 support is not installed.
+    """
+    try:
+        import httpx
+        import h2  # noqa: F401
+    except ImportError:
+        raise ImportError('HTTP/2 transport requires httpx with HTTP/2 support, install it with: '
+                          'pip install "httpx[http2]"')
+
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    return Http2Session(httpx.Client(http2=True, limits=limits))
+
+
+def _encode_params(params):
+    """
+    Encodes parameters the way requests does, so values match the ones signed by Request e.g. True as 'True'.
+    """
+    if not params:
+        return None
+
+    encoded = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+
+        if isinstance(value, (list, tuple)):
+            encoded[key] = [str(item) for item in value]
+        else:
+            encoded[key] = str(value)
+
+    return encoded
+
+
+class Http2Session:
+    """
+    Adapter exposing the part of requests.Session used by Request on top of an httpx client.
+
+    Attributes:
+        _client (httpx.Client): HTTP/2 client sending the requests.
+    """
+    def __init__(self, client):
+        """
+        Args:
+            client (httpx.Client, required): Client created with http2=True.
+        """
+        self._client = client
+
+    def request(self, method, url, headers=None, timeout=None, params=None, data=None, stream=False):
+        """
+        Sends a request, see requests.Session.request.
+
+        Returns:
+            Http2Response object.
+        """
+        request = self._client.build_request(method,
+                                             url,
+                                             headers=headers,
+                                             params=_encode_params(params),
+                                             content=data if isinstance(data, (str, bytes)) and data else None,
+                                             timeout=timeout)
+        return Http2Response(self._client.send(request, stream=stream))
+
+    def close(self):
+        self._client.close()
+
+
+class Http2Response:
+    """
+    Adapter exposing the part of requests.Response used by Request on top of an httpx response.
+
+    Attributes:
+        _response (httpx.Response): Wrapped response.
+    """
+    def __init__(self, response):
+        self._response = response
+
+    @property
+    def status_code(self):
+        return self._response.status_code
+
+    @property
+    def text(self):
+        return self._response.text
+
+    @property
+    def content(self):
+        return self._response.read()
+
+    @property
+    def elapsed(self):
+        return self._response.elapsed
+
+    @property
+    def http_version(self):
+        return self._response.http_version
+
+    def json(self):
+        return self._response.json()
+
+    def raise_for_status(self):
+        self._response.raise_for_status()
+
+    def iter_content(self, chunk_size=None):
+        return self._response.iter_bytes(chunk_size)
+
+    def close(self):
+        self._response.close()
@@ -0,0 +1,169 @@
+from decimal import Decimal, InvalidOperation
+
+_sides = ('BUY', 'SELL')
+_types = ('MARKET', 'LIMIT', 'LIMIT_MAKER')
+_limit_types = ('LIMIT', 'LIMIT_MAKER')
+
+
+class OrderValidationError(ValueError):
+    """
+    Exception class used to report orders rejected locally before they are sent to the trade engine.
+
+    Attributes:
+        symbol (str): Symbol of the rejected order.
+        message (str): Reason the order was rejected.
+    """
+    def __init__(self, symbol, message):
+        self.symbol = symbol
+        self.message = message
+        super().__init__(message)
+
+    def __str__(self):
+        return f'symbol: {self.symbol}, message: {self.message}'
+
+
+def to_decimal(symbol, name, value):
+    """
+    Converts an order field to Decimal.
+
+    Raises:
+        OrderValidationError: Value is not a number.
+    """
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        raise OrderValidationError(symbol, f'{name} is not a number: {value}')
+
+
+def check_scale(symbol, name, value, scale):
+    """
+    Checks that a Decimal has no more decimal places than scale.
+
+    Raises:
+        OrderValidationError: Value has too many decimal places.
+    """
+    if scale is not None and -value.normalize().as_tuple().exponent > int(scale):
+        raise OrderValidationError(symbol, f'{name} {value} exceeds scale {scale}')
+
+
+class OrderValidator:
+    """
+    Optional pre-trade checks run locally before an order is sent, so malformed or out-of-limit orders fail without a
+    network round trip.  Checks side and type, price, quantity and amount scale, minQuantity and minAmount from the
+    symbol's tradeLimit, and available balance when a balance cache is given.
+
+    Attributes:
+        _markets (dict): Symbol to market reference data.
+        _balances (BalanceCache): Balances used for available balance checks.
+
+    Example:
+        validator = OrderValidator(client.get_markets(), balances=cache)
+        client = Client(api_key, api_secret, validator=validator)
+        client.orders().create(symbol='BTC_USDT', side='BUY', type='LIMIT', price='18000', quantity='0.00025')
+    """
+    def __init__(self, markets, balances=None):
+        """
+        Args:
+            markets (list, required): Response of Client.get_markets().
+            balances (BalanceCache, optional): Balance cache used for available balance checks.
+        """
+        self._markets = {}
+        self._balances = balances
+        self.update_markets(markets)
+
+    def update_markets(self, markets):
+        """
+        Replaces or adds market reference data.
+
+        Args:
+            markets (list, required): Response of Client.get_markets() or a list of Client.get_market() responses.
+        """
+        for market in markets:
+            self._markets[market['symbol']] = market
+
+    def validate(self, order):
+        """
+        Validates an order request body.
+
+        Args:
+            order (dict, required): Order request body as sent by Orders.create e.g. symbol, side, type, price,
+                                    quantity, amount, allowBorrow.
+
+        Raises:
+            OrderValidationError: The order would be rejected by the trade engine.
+        """
+        symbol = order.get('symbol')
+        market = self._markets.get(symbol)
+        if market is None:
+            raise OrderValidationError(symbol, f'unknown symbol {symbol}')
+
+        side = order.get('side')
+        if side not in _sides:
+            raise OrderValidationError(symbol, "side must be 'BUY' or 'SELL'")
+
+        order_type = order.get('type', 'MARKET')
+        if order_type not in _types:
+            raise OrderValidationError(symbol, "type must be 'MARKET', 'LIMIT', or 'LIMIT_MAKER'")
+
+        limits = market.get('symbolTradeLimit') or {}
+        price = self._field(order, symbol, 'price', limits.get('priceScale'))
+        quantity = self._field(order, symbol, 'quantity', limits.get('quantityScale'))
+        amount = self._field(order, symbol, 'amount', limits.get('amountScale'))
+
+        if order_type in _limit_types:
+            if price is None:
+                raise OrderValidationError(symbol, f'price is required for {order_type} orders')
+
+            if quantity is None and amount is None:
+                raise OrderValidationError(symbol, f'quantity or amount is required for {order_type} orders')
+
+            if price <= 0:
+                raise OrderValidationError(symbol, 'price must be positive')
+        elif quantity is None and amount is None:
+            raise OrderValidationError(symbol, 'quantity or amount is required for MARKET orders')
+
+        if amount is None and price is not None and quantity is not None:
+            amount = price * quantity
+
+        if quantity is None and price is not None and amount is not None:
+            quantity = amount / price
+
+        min_quantity = limits.get('minQuantity')
+        if quantity is not None and min_quantity is not None and quantity < Decimal(min_quantity):
+            raise OrderValidationError(symbol, f'quantity {quantity} is below minQuantity {min_quantity}')
+
+        min_amount = limits.get('minAmount')
+        if amount is not None and min_amount is not None and amount < Decimal(min_amount):
+            raise OrderValidationError(symbol, f'amount {amount} is below minAmount {min_amount}')
+
+        if self._balances is not None and not order.get('allowBorrow'):
+            self._check_balance(order, market, side, quantity, amount)
+
+    def _field(self, order, symbol, name, scale):
+        value = order.get(name)
+        if value is None:
+            return None
+
+        value = to_decimal(symbol, name, value)
+        if value <= 0 and name != 'price':
+            raise OrderValidationError(symbol, f'{name} must be positive')
+
+        check_scale(symbol, name, value, scale)
+        return value
+
+    def _check_balance(self, order, market, side, quantity, amount):
+        symbol = order.get('symbol')
+
+        if side == 'BUY':
+            currency = market.get('quoteCurrencyName')
+            required = amount
+        else:
+            currency = market.get('baseCurrencyName')
+            required = quantity
+
+        if currency is None or required is None:
+            return
+
+        available = self._balances.get_available(currency)
+        if required > available:
+            raise OrderValidationError(symbol, f'{required} {currency} required, {available} available')
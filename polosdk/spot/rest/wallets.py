@@ -9,14 +9,17 @@ class Wallets:
     Attributes:
         _request (Request): Class used to handle REST requests.
     """
-    def __init__(self, api_key, api_secret, url=None):
+    def __init__(self, api_key, api_secret, url=None, **kwargs):
         """
         Args:
             api_key (str, required): User api key used for authentication.
             api_secret (str, required): User api secret used for authentication.
             url (str, optional): Url for endpoints, default is set to PROD in Request class.
+
+        Keyword Args:
+            Forwarded to Request e.g. session, single_flight.
         """
-        self._request = Request(api_key, api_secret, url)
+        self._request = Request(api_key, api_secret, url, **kwargs)
 
     def get_deposit_addresses(self, currency=None):
         """
@@ -0,0 +1,120 @@
+import threading
+from decimal import Decimal
+
+
+class BalanceCache:
+    """
+    In-memory account balances, seeded once from REST and kept current by the private balances websocket channel.
+    Risk checks can read available and hold amounts locally instead of calling the API before every order.
+
+    Attributes:
+        _balances (dict): (account id, currency) to balance state with Decimal 'available' and 'hold'.
+        _default_account_id (str): Account used when no account id is given, the first SPOT account seeded or seen.
+
+    Example:
+        cache = BalanceCache()
+        cache.seed(rest_client.accounts().get_balances())
+        client = ClientAuthenticated(cache.apply, ws_url=ws_private)
+        await client.connect(API_KEY, API_SECRET)
+        await client.subscribe_to_balances()
+        ...
+        usdt = cache.get_available('USDT')
+    """
+    _channel = 'balances'
+
+    def __init__(self):
+        self._balances = {}
+        self._default_account_id = None
+        self._lock = threading.Lock()
+
+    def seed(self, accounts):
+        """
+        Loads balances from a REST snapshot, replacing balances of the accounts it contains.
+
+        Args:
+            accounts (list, required): Response of Accounts.get_balances() or Subaccounts.get_balances().
+        """
+        with self._lock:
+            for account in accounts:
+                account_id = str(account.get('accountId'))
+                self._set_default_account(account_id, account.get('accountType'))
+
+                for key in [key for key in self._balances if key[0] == account_id]:
+                    del self._balances[key]
+
+                for balance in account.get('balances') or ():
+                    self._balances[(account_id, balance['currency'])] = {
+                        'available': Decimal(balance.get('available') or 0),
+                        'hold': Decimal(balance.get('hold') or 0),
+                        'ts': 0
+                    }
+
+    def apply(self, msg):
+        """
+        Applies a websocket message, messages from other channels are ignored so this can be used directly as the
+        on_message callback.
+
+        Args:
+            msg (dict, required): Decoded websocket message.
+        """
+        if not isinstance(msg, dict) or msg.get('channel') != self._channel:
+            return
+
+        with self._lock:
+            for event in msg.get('data') or ():
+                account_id = str(event.get('accountId'))
+                self._set_default_account(account_id, event.get('accountType'))
+
+                ts = int(event.get('ts') or event.get('changeTime') or 0)
+                key = (account_id, event.get('currency'))
+                balance = self._balances.get(key)
+                if balance is not None and ts < balance['ts']:
+                    continue
+
+                self._balances[key] = {
+                    'available': Decimal(event.get('available') or 0),
+                    'hold': Decimal(event.get('hold') or 0),
+                    'ts': ts
+                }
+
+    def get(self, currency, account_id=None):
+        """
+        Args:
+            currency (str, required): Currency name.
+            account_id (str, optional): Account id. Default is the SPOT account.
+
+        Returns:
+            Json object with Decimal 'available' and 'hold' or None if the currency has no balance.
+        """
+        if account_id is None:
+            account_id = self._default_account_id
+
+        return self._balances.get((str(account_id), currency))
+
+    def get_available(self, currency, account_id=None):
+        """
+        Args:
+            currency (str, required): Currency name.
+            account_id (str, optional): Account id. Default is the SPOT account.
+
+        Returns:
+            Available amount as Decimal, zero if the currency has no balance.
+        """
+        balance = self.get(currency, account_id)
+        return balance['available'] if balance is not None else Decimal(0)
+
+    def get_hold(self, currency, account_id=None):
+        """
+        Args:
+            currency (str, required): Currency name.
+            account_id (str, optional): Account id. Default is the SPOT account.
+
+        Returns:
+            Amount on hold as Decimal, zero if the currency has no balance.
+        """
+        balance = self.get(currency, account_id)
+        return balance['hold'] if balance is not None else Decimal(0)
+
+    def _set_default_account(self, account_id, account_type):
+        if self._default_account_id is None and account_type in (None, 'SPOT'):
+            self._default_account_id = account_id
@@ -0,0 +1,278 @@
+import threading
+import time
+
+from polosdk.spot.ws.channels import CANDLE_INTERVAL_MS
+
+# Weekly bars start on Monday 00:00 UTC, epoch time 0 was a Thursday.
+_week_offset_ms = 4 * 86400000
+
+
+def _interval(interval):
+    """
+    Returns:
+        (label, length in ms, alignment offset in ms) of a CANDLE_INTERVALS name or a length in ms.
+    """
+    if isinstance(interval, str):
+        if interval not in CANDLE_INTERVAL_MS:
+            raise ValueError(f'interval must be a length in ms or one of {", ".join(CANDLE_INTERVAL_MS)}')
+
+        return interval, CANDLE_INTERVAL_MS[interval], _week_offset_ms if interval == 'WEEK_1' else 0
+
+    if interval <= 0:
+        raise ValueError('interval must be positive')
+
+    return interval, int(interval), 0
+
+
+class _Bar:
+    __slots__ = ('start', 'open', 'high', 'low', 'close', 'quantity', 'amount', 'buy_quantity', 'buy_amount', 'count',
+                 'ts')
+
+    def __init__(self, start, price, quantity, amount, buy, ts):
+        self.start = start
+        self.open = self.high = self.low = self.close = price
+        self.quantity = quantity
+        self.amount = amount
+        self.buy_quantity = quantity if buy else 0.0
+        self.buy_amount = amount if buy else 0.0
+        self.count = 1
+        self.ts = ts
+
+    def add(self, price, quantity, amount, buy, ts):
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.quantity += quantity
+        self.amount += amount
+        if buy:
+            self.buy_quantity += quantity
+            self.buy_amount += amount
+        self.count += 1
+        self.ts = ts
+
+
+class BarBuilder:
+    """
+    Builds OHLCV bars for any set of intervals, including sub-minute ones, from the trades websocket channel.  Every
+    trade updates the open bar of each interval in constant time, a bar is emitted when the first trade of a later bar
+    arrives or when close_due is called with a time past its end, so quiet markets still close their bars on time.
+
+    Bars are json objects with the fields of candles from get_candles:
+        {
+            'symbol': (str) Symbol name,
+            'interval': (str or int) Interval as passed in,
+            'low': (float) Lowest price,
+            'high': (float) Highest price,
+            'open': (float) First price,
+            'close': (float) Last price,
+            'amount': (float) Quote units traded,
+            'quantity': (float) Base units traded,
+            'buyTakerAmount': (float) Quote units bought by takers,
+            'buyTakerQuantity': (float) Base units bought by takers,
+            'tradeCount': (int) Number of trades,
+            'ts': (int) Time of the last trade,
+            'weightedAverage': (float) Volume weighted average price,
+            'startTime': (int) Start of the bar,
+            'closeTime': (int) Last ms of the bar, startTime + length - 1
+        }
+
+    Trades of a bar that was already emitted, because a later bar opened or close_due closed it, are dropped from that
+    interval and counted in late_trades.
+
+    Example:
+        builder = BarBuilder([5000, 'MINUTE_1', 'MINUTE_5'], on_bar=print)
+        client = ClientPublic(builder.apply, ws_url=ws_public)
+        await client.connect()
+        await client.subscribe_to_trades('BTC_USDT')
+    """
+    _channels = ('trades',)
+    _symbol_field = 'symbol'
+    _price_field = 'price'
+    _quantity_field = 'quantity'
+    _amount_field = 'amount'
+    _side_field = 'takerSide'
+    _time_fields = ('createTime', 'ts')
+
+    def __init__(self, intervals, on_bar=None, emit_empty=False):
+        """
+        Args:
+            intervals (list, required): Bar lengths, each a length in ms or one of the fixed length CANDLE_INTERVALS.
+            on_bar (func(dict), optional): Function called with every closed bar.
+            emit_empty (bool, optional): Emit bars without trades between two traded bars, priced at the previous
+                                         close. Default false.
+
+        Raises:
+            ValueError: An interval is not supported.
+        """
+        self._intervals = [_interval(interval) for interval in intervals]
+        self._on_bar = on_bar
+        self._emit_empty = emit_empty
+        self._bars = {}
+        self._emitted = {}
+        self._late_trades = 0
+        self._lock = threading.RLock()
+
+    @property
+    def late_trades(self):
+        return self._late_trades
+
+    def apply(self, msg):
+        """
+        Adds the trades of a websocket message, messages from other channels are ignored so this can be used directly
+        as the on_message callback.
+
+        Args:
+            msg (dict, required): Decoded websocket message.
+        """
+        if not isinstance(msg, dict) or msg.get('channel') not in self._channels:
+            return
+
+        for trade in msg.get('data') or ():
+            self.add_trade(trade)
+
+    def add_trade(self, trade, symbol=None):
+        """
+        Adds one trade json object, e.g. from get_trades when symbol is given.
+
+        Args:
+            trade (dict, required): Trade json object.
+            symbol (str, optional): Symbol of the trade. Default the symbol field of the trade.
+        """
+        price = float(trade[self._price_field])
+        quantity = float(trade[self._quantity_field])
+        amount = trade.get(self._amount_field)
+        amount = float(amount) if amount is not None else price * quantity
+        side = trade.get(self._side_field)
+        buy = side is not None and side[:1] in ('b', 'B')
+        ts = self._time(trade)
+        self.add(symbol if symbol is not None else trade.get(self._symbol_field), ts, price, quantity, amount, buy)
+
+    def add(self, symbol, ts, price, quantity, amount=None, buy=False):
+        """
+        Adds one trade from its values.
+
+        Args:
+            symbol (str, required): Symbol name.
+            ts (int, required): Trade time in ms since epoch.
+            price (float, required): Trade price.
+            quantity (float, required): Base units traded.
+            amount (float, optional): Quote units traded. Default price * quantity.
+            buy (bool, optional): Whether the taker bought. Default false.
+        """
+        if amount is None:
+            amount = price * quantity
+
+        closed = []
+        with self._lock:
+            for label, length, offset in self._intervals:
+                key = (symbol, label)
+                bar = self._bars.get(key)
+                start = ts - (ts - offset) % length
+
+                if bar is None:
+                    # A bar emitted by close_due is not reopened, empty bars continue from it.
+                    emitted = self._emitted.pop(key, None)
+                    if emitted is not None and start <= emitted.start:
+                        self._emitted[key] = emitted
+                        self._late_trades += 1
+                        continue
+
+                    if emitted is not None and self._emit_empty:
+                        closed += self._empty_bars(symbol, label, length, emitted, start)
+                    self._bars[key] = _Bar(start, price, quantity, amount, buy, ts)
+                elif start == bar.start:
+                    bar.add(price, quantity, amount, buy, ts)
+                elif start > bar.start:
+                    closed.append(self._to_dict(symbol, label, length, bar))
+                    if self._emit_empty:
+                        closed += self._empty_bars(symbol, label, length, bar, start)
+                    self._bars[key] = _Bar(start, price, quantity, amount, buy, ts)
+                else:
+                    self._late_trades += 1
+
+        self._emit(closed)
+
+    def close_due(self, now_ms=None):
+        """
+        Emits and removes open bars that ended before now, call periodically when trades may pause.  Later trades of
+        an emitted bar count as late trades.
+
+        Args:
+            now_ms (int, optional): Current time in ms since epoch. Default local clock.
+
+        Returns:
+            Number of bars emitted.
+        """
+        now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+        lengths = {label: length for label, length, _ in self._intervals}
+
+        closed = []
+        with self._lock:
+            for (symbol, label), bar in list(self._bars.items()):
+                if bar.start + lengths[label] <= now_ms:
+                    closed.append(self._to_dict(symbol, label, lengths[label], bar))
+                    self._emitted[(symbol, label)] = self._bars.pop((symbol, label))
+
+        self._emit(closed)
+        return len(closed)
+
+    def current(self, symbol, interval):
+        """
+        Returns:
+            Open bar of a symbol and interval as a json object, None when it has no trades yet.
+        """
+        label, length, _ = _interval(interval)
+        with self._lock:
+            bar = self._bars.get((symbol, label))
+            return self._to_dict(symbol, label, length, bar) if bar is not None else None
+
+    def _emit(self, bars):
+        if self._on_bar is None:
+            return
+
+        for bar in bars:
+            self._on_bar(bar)
+
+    def _empty_bars(self, symbol, label, length, bar, until):
+        bars = []
+        start = bar.start + length
+        while start < until:
+            bars.append({
+                'symbol': symbol, 'interval': label, 'low': bar.close, 'high': bar.close, 'open': bar.close,
+                'close': bar.close, 'amount': 0.0, 'quantity': 0.0, 'buyTakerAmount': 0.0, 'buyTakerQuantity': 0.0,
+                'tradeCount': 0, 'ts': bar.ts, 'weightedAverage': bar.close, 'startTime': start,
+                'closeTime': start + length - 1
+            })
+            start += length
+
+        return bars
+
+    def _time(self, trade):
+        for field in self._time_fields:
+            value = trade.get(field)
+            if value is not None:
+                return int(value)
+
+        return int(time.time() * 1000)
+
+    @staticmethod
+    def _to_dict(symbol, label, length, bar):
+        return {
+            'symbol': symbol,
+            'interval': label,
+            'low': bar.low,
+            'high': bar.high,
+            'open': bar.open,
+            'close': bar.close,
+            'amount': bar.amount,
+            'quantity': bar.quantity,
+            'buyTakerAmount': bar.buy_amount,
+            'buyTakerQuantity': bar.buy_quantity,
+            'tradeCount': bar.count,
+            'ts': bar.ts,
+            'weightedAverage': bar.amount / bar.quantity if bar.quantity > 0 else bar.close,
+            'startTime': bar.start,
+            'closeTime': bar.start + length - 1
+        }
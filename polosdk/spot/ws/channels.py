@@ -0,0 +1,167 @@
+from polosdk.spot.ws.client_base import subscription_frame
+
+ALL_SYMBOLS = 'all'
+# Symbol of the single symbol subscribe helpers when none is given, as before they took symbols.
+DEFAULT_SYMBOL = 'BTC_USDT'
+ALL_CURRENCIES = 'ALL'
+
+CANDLE_INTERVALS = ('MINUTE_1', 'MINUTE_5', 'MINUTE_10', 'MINUTE_15', 'MINUTE_30', 'HOUR_1', 'HOUR_2', 'HOUR_4',
+                    'HOUR_6', 'HOUR_12', 'DAY_1', 'DAY_3', 'WEEK_1', 'MONTH_1')
+# Length in ms of the fixed length intervals, MONTH_1 follows the calendar.
+CANDLE_INTERVAL_MS = {
+    'MINUTE_1': 60000, 'MINUTE_5': 300000, 'MINUTE_10': 600000, 'MINUTE_15': 900000, 'MINUTE_30': 1800000,
+    'HOUR_1': 3600000, 'HOUR_2': 7200000, 'HOUR_4': 14400000, 'HOUR_6': 21600000, 'HOUR_12': 43200000,
+    'DAY_1': 86400000, 'DAY_3': 259200000, 'WEEK_1': 604800000
+}
+BOOK_DEPTHS = (5, 10, 20)
+
+
+def candles_channel(interval):
+    """
+    Get the candles channel name for an interval.
+
+    Args:
+        interval (str, required): One of CANDLE_INTERVALS e.g. MINUTE_1, HOUR_4, DAY_1.
+
+    Returns:
+        Channel name as string e.g. candles_minute_1.
+
+    Raises:
+        ValueError: Interval is not supported.
+    """
+    if interval not in CANDLE_INTERVALS:
+        raise ValueError(f'interval must be one of {", ".join(CANDLE_INTERVALS)}')
+
+    return f'candles_{interval.lower()}'
+
+
+def currencies_frame(currencies=ALL_CURRENCIES, event='subscribe'):
+    """
+    Args:
+        currencies (str or str[], optional): Currency or list of currencies. Default ALL.
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the currencies channel.
+    """
+    if isinstance(currencies, str):
+        currencies = [currencies]
+
+    return subscription_frame(event, 'currencies', currencies=list(currencies))
+
+
+def symbols_frame(symbols=ALL_SYMBOLS, event='subscribe'):
+    """
+    Args:
+        symbols (str or str[], optional): Symbol or list of symbols. Default all.
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the symbols channel.
+    """
+    return subscription_frame(event, 'symbols', symbols)
+
+
+def exchange_frame(event='subscribe'):
+    """
+    Args:
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the exchange channel.
+    """
+    return subscription_frame(event, 'exchange')
+
+
+def candles_frame(symbols, interval='MINUTE_1', event='subscribe'):
+    """
+    Args:
+        symbols (str or str[], required): Symbol, list of symbols or ALL_SYMBOLS.
+        interval (str, optional): One of CANDLE_INTERVALS. Default MINUTE_1.
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the candles channel of the interval.
+    """
+    return subscription_frame(event, candles_channel(interval), symbols)
+
+
+def trades_frame(symbols, event='subscribe'):
+    """
+    Args:
+        symbols (str or str[], required): Symbol, list of symbols or ALL_SYMBOLS.
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the trades channel.
+    """
+    return subscription_frame(event, 'trades', symbols)
+
+
+def ticker_frame(symbols, event='subscribe'):
+    """
+    Args:
+        symbols (str or str[], required): Symbol, list of symbols or ALL_SYMBOLS.
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the ticker channel.
+    """
+    return subscription_frame(event, 'ticker', symbols)
+
+
+def book_frame(symbols, depth=None, event='subscribe'):
+    """
+    Args:
+        symbols (str or str[], required): Symbol or list of symbols.
+        depth (int, optional): One of BOOK_DEPTHS. Server default is 5.
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the book channel.
+
+    Raises:
+        ValueError: Depth is not supported.
+    """
+    if depth is None:
+        return subscription_frame(event, 'book', symbols)
+
+    if depth not in BOOK_DEPTHS:
+        raise ValueError(f'depth must be one of {", ".join(str(d) for d in BOOK_DEPTHS)}')
+
+    return subscription_frame(event, 'book', symbols, depth=depth)
+
+
+def book_lv2_frame(symbols, event='subscribe'):
+    """
+    Args:
+        symbols (str or str[], required): Symbol or list of symbols.
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the book_lv2 channel.
+    """
+    return subscription_frame(event, 'book_lv2', symbols)
+
+
+def orders_frame(symbols=ALL_SYMBOLS, event='subscribe'):
+    """
+    Args:
+        symbols (str or str[], optional): Symbol, list of symbols or ALL_SYMBOLS. Default all.
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the private orders channel.
+    """
+    return subscription_frame(event, 'orders', symbols)
+
+
+def balances_frame(event='subscribe'):
+    """
+    Args:
+        event (str, optional): subscribe or unsubscribe. Default subscribe.
+
+    Returns:
+        Json encoded frame for the private balances channel.
+    """
+    return subscription_frame(event, 'balances')
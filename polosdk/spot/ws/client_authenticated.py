@@ -1,11 +1,18 @@
+from polosdk.spot.rest.request import RequestError
+from polosdk.spot.ws import channels
 from polosdk.spot.ws.client_base import ClientBase
 from urllib.parse import urljoin
+import asyncio
 import base64
 import hashlib
 import hmac
+import itertools
+import warnings
 from datetime import datetime
 
 _default_ws_url = 'wss://ws.poloniex.com/ws/'
+_default_request_timeout_sec = 5
+_success_codes = (None, 0, 200)
 API_KEY = ''
 API_SECRET = ''
 
@@ -16,16 +23,23 @@ class ClientAuthenticated(ClientBase):
     documentation for more information on available commands.
     """
 
-    def __init__(self, on_message, on_error=None, ws_url=None):
+    def __init__(self, on_message, on_error=None, ws_url=None, on_reconnect=None, metrics=None):
         """
         Args:
             on_message (func(str), required): Function called when a new message arrives, must be able to handle a json string.
             on_error (func(Exception), optional): Function called when an error happens during normal operation, must be able to
                                         handle an exception object.
             ws_url (str, optional): Url to websockets interface of trade engine. Default is to production.
+            on_reconnect (func(), optional): Function called when the connection is re-established after it was lost.
+            metrics (StreamMetrics, optional): Records message rates, decode and handler time, queue depth and lag.
         """
         ws_url_base = ws_url
-        ClientBase.__init__(self, on_message, urljoin(ws_url_base, 'private'), on_error)
+        ClientBase.__init__(self, on_message, urljoin(ws_url_base, 'private'), on_error, on_reconnect, metrics)
+        self._api_key = None
+        self._api_secret = None
+        self._pending_requests = {}
+        self._request_ids = itertools.count(1)
+        self._request_id_prefix = str(int(datetime.now().timestamp() * 1000))
 
     async def connect(self, api_key, api_secret):
         """
@@ -36,9 +50,19 @@ class ClientAuthenticated(ClientBase):
             api_key (str, required): User api key used for authentication.
             api_secret (str, required): User api secret used for authentication.
         """
+        self._api_key = api_key
+        self._api_secret = api_secret
         await super().connect()
         await self._authenticate(api_key, api_secret)
 
+    async def _restore_session(self):
+        """
+        Authenticates a new connection after a reconnect, the server forgets the authentication of the lost one, then
+        re-sends the subscriptions.
+        """
+        await self._authenticate(self._api_key, self._api_secret)
+        await super()._restore_session()
+
     async def _authenticate(self, api_key, api_secret):
         """
         Sends an authentication event to the server.
@@ -76,53 +100,242 @@ class ClientAuthenticated(ClientBase):
         secret_key = base64.b64encode(sig_hash).decode()
         return secret_key
 
-    async def subscribe_to_orders(self):
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["orders"],
-            "symbols": ["all"]
-        }
-        await self._send_message(subscribe_message)
+    async def subscribe_to_orders(self, symbols=channels.ALL_SYMBOLS):
+        """
+        Subscribe to order updates.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default all.
+        """
+        await self._send_frame(channels.orders_frame(symbols))
 
     async def subscribe_to_balances(self):
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["balances"]
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_createorder(self):
-        subscribe_message = {
-            "id": "123456789",
-            "event": "createOrder",
-            "params": {
-                "symbol": "BTC_USDT",
-                "type": "LIMIT",
-                "quantity": "100",
-                "side": "BUY",
-                "price": "40000.50000",
-                "timeInForce": "IOC",
-                "clientOrderId": "1234Abc"
-            }
-        }
-        await self._send_message(subscribe_message)
-
-    async def subscribe_to_cancelmultipleorders(self):
-        subscribe_message = {
-            "id": "1234567",
-            "event": "cancelOrders",
-            "params": {
-                "orderIds": ["170903943331844096", "170904091512410112"],
-                "clientOrderIds": ["45662xyz", "xasd2343"]
-            }
-        }
-        await self._send_message(subscribe_message)
+        """
+        Subscribe to balance updates.
+        """
+        await self._send_frame(channels.balances_frame())
 
-    async def subscribe_to_cancelall(self):
-        subscribe_message = {
-            "id": "1234567",
-            "event": "cancelAllOrders",
-            "params": {
+    async def create_order(self, symbol, side, time_in_force=None, account_type=None, client_order_id=None,
+                           allow_borrow=None, timeout=_default_request_timeout_sec, **kwargs):
+        """
+        Create an order over the websocket connection.
+
+        Args:
+            symbol (str, required): The symbol to trade, like BTC_USDT.
+            side (str, required): BUY, SELL
+            time_in_force (str, optional): GTC, IOC, FOK (Default: GTC)
+            account_type (str, optional): SPOT is the default and only supported one.
+            client_order_id (str, optional): Custom client order id, Maximum 64-character length
+            allow_borrow (bool, optional): Allow order to be placed by borrowing funds (Default: false)
+            timeout (float, optional): Seconds to wait for the response. Default 5 seconds.
+
+        Keyword Args:
+            type (str, optional): MARKET, LIMIT, LIMIT_MAKER (Default: MARKET)
+            price (str, optional): Price is required for non-market orders
+            quantity (str, optional): Quantity is required for MARKET type and SELL side.
+            amount (str, optional): Amount is required for MARKET and BUY side.
+
+        Returns:
+            Json object with order id and client order id:
+            {
+                'orderId': (str) Order id,
+                'clientOrderId': (str) ClientOrderId user specifies in request or an empty string,
+                'message': (str) Response message,
+                'code': (int) Response code
             }
-        }
-        await self._send_message(subscribe_message)
+
+        Raises:
+            RequestError: The trade engine rejected the order.
+            asyncio.TimeoutError: No response arrived within timeout.
+            RuntimeError: Not connected or the connection was lost before the response arrived.
+
+        Example:
+            response = await client.create_order('BTC_USDT', 'BUY', type='LIMIT', price='40000.5', quantity='0.0001')
+            print(response)
+        """
+        params = {'symbol': symbol, 'side': side}
+        params.update(kwargs)
+
+        if time_in_force is not None:
+            params.update({'timeInForce': time_in_force})
+
+        if account_type is not None:
+            params.update({'accountType': account_type})
+
+        if client_order_id is not None:
+            params.update({'clientOrderId': client_order_id})
+
+        if allow_borrow is not None:
+            params.update({'allowBorrow': allow_borrow})
+
+        data = await self._request('createOrder', params, timeout)
+        result = data[0] if isinstance(data, list) and len(data) > 0 else data
+
+        if isinstance(result, dict) and result.get('code') not in _success_codes:
+            raise RequestError(result.get('code'), result.get('message'))
+
+        return result
+
+    async def cancel_orders(self, order_ids=None, client_order_ids=None, timeout=_default_request_timeout_sec):
+        """
+        Cancel one or many active orders by ids over the websocket connection. Order_ids or client_order_ids is
+        required.
+
+        Args:
+            order_ids (str[], optional): List of order ids
+            client_order_ids (str[], optional): List of client order ids
+            timeout (float, optional): Seconds to wait for the response. Default 5 seconds.
+
+        Returns:
+            List of json objects with information on canceled orders:
+            [
+                {
+                    'orderId': (str) The order id,
+                    'clientOrderId': (str) clientOrderId of the order,
+                    'message': (str) Response message,
+                    'code': (int) Response code
+                },
+                {...},
+                ...
+            ]
+
+        Raises:
+            asyncio.TimeoutError: No response arrived within timeout.
+            RuntimeError: Not connected or the connection was lost before the response arrived.
+
+        Example:
+            response = await client.cancel_orders(order_ids=['170903943331844096'])
+            print(response)
+        """
+        if order_ids is None and client_order_ids is None:
+            raise ValueError('cancel_orders requires order_ids or client_order_ids')
+
+        params = {}
+        if order_ids is not None:
+            params.update({'orderIds': order_ids})
+
+        if client_order_ids is not None:
+            params.update({'clientOrderIds': client_order_ids})
+
+        return await self._request('cancelOrders', params, timeout)
+
+    async def cancel_all_orders(self, symbols=None, account_types=None, timeout=_default_request_timeout_sec):
+        """
+        Cancel all active orders over the websocket connection.
+
+        Args:
+            symbols (str[], optional): If symbols are specified then only orders with those symbols are canceled.
+            account_types (str[], optional): SPOT is the only supported one.
+            timeout (float, optional): Seconds to wait for the response. Default 5 seconds.
+
+        Returns:
+            List of json objects with information on canceled orders, see cancel_orders.
+
+        Raises:
+            asyncio.TimeoutError: No response arrived within timeout.
+            RuntimeError: Not connected or the connection was lost before the response arrived.
+
+        Example:
+            response = await client.cancel_all_orders(symbols=['BTC_USDT'])
+            print(response)
+        """
+        params = {}
+        if symbols is not None:
+            params.update({'symbols': symbols})
+
+        if account_types is not None:
+            params.update({'accountTypes': account_types})
+
+        return await self._request('cancelAllOrders', params, timeout)
+
+    async def subscribe_to_createorder(self, symbol, side, **kwargs):
+        """
+        Deprecated, use create_order.  Accepts the arguments of create_order and returns its result.
+        """
+        warnings.warn('subscribe_to_createorder is deprecated, use create_order', DeprecationWarning, stacklevel=2)
+        return await self.create_order(symbol, side, **kwargs)
+
+    async def subscribe_to_cancelmultipleorders(self, order_ids=None, client_order_ids=None, **kwargs):
+        """
+        Deprecated, use cancel_orders.  Accepts the arguments of cancel_orders and returns its result.
+        """
+        warnings.warn('subscribe_to_cancelmultipleorders is deprecated, use cancel_orders', DeprecationWarning,
+                      stacklevel=2)
+        return await self.cancel_orders(order_ids, client_order_ids, **kwargs)
+
+    async def subscribe_to_cancelall(self, symbols=None, account_types=None, **kwargs):
+        """
+        Deprecated, use cancel_all_orders.  Accepts the arguments of cancel_all_orders and returns its result.
+        """
+        warnings.warn('subscribe_to_cancelall is deprecated, use cancel_all_orders', DeprecationWarning, stacklevel=2)
+        return await self.cancel_all_orders(symbols, account_types, **kwargs)
+
+    async def send_request(self, event, params):
+        """
+        Sends a request event and returns a future resolved with the data of the response frame that carries the same
+        id.  Use this to pipeline several requests and await them together.
+
+        Args:
+            event (str, required): Request event e.g. createOrder, cancelOrders, cancelAllOrders.
+            params (dict, required): Request parameters.
+
+        Returns:
+            asyncio.Future resolved with the response data.
+
+        Raises:
+            RuntimeError: Not connected to websocket.
+        """
+        request_id = f'{self._request_id_prefix}{next(self._request_ids)}'
+        future = asyncio.get_running_loop().create_future()
+        self._pending_requests[request_id] = future
+
+        try:
+            await self._send_message({'id': request_id, 'event': event, 'params': params})
+        except Exception:
+            self._pending_requests.pop(request_id, None)
+            raise
+
+        future.add_done_callback(lambda _: self._pending_requests.pop(request_id, None))
+        return future
+
+    async def _request(self, event, params, timeout):
+        """
+        Sends a request event and waits for its response.
+
+        Args:
+            event (str, required): Request event.
+            params (dict, required): Request parameters.
+            timeout (float, required): Seconds to wait for the response, None waits forever.
+
+        Returns:
+            Data of the response frame.
+        """
+        future = await self.send_request(event, params)
+        return await asyncio.wait_for(future, timeout)
+
+    def _handle_message(self, msg):
+        """
+        Resolves pending requests with their response frames, every other message goes to _on_message.
+
+        Args:
+            msg(dict): Decoded message.
+        """
+        if isinstance(msg, dict) and 'id' in msg:
+            future = self._pending_requests.pop(str(msg['id']), None)
+            if future is not None:
+                if not future.done():
+                    future.set_result(msg.get('data'))
+                return
+
+        self._on_message(msg)
+
+    def _on_connection_lost(self):
+        """
+        Fails all pending requests, their responses can not arrive on a new connection.
+        """
+        pending = self._pending_requests
+        self._pending_requests = {}
+
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError('Websocket connection lost before response arrived'))
@@ -1,5 +1,4 @@
-import json
-
+from polosdk.spot.ws import channels
 from polosdk.spot.ws.client_base import ClientBase
 from urllib.parse import urljoin
 
@@ -10,92 +9,86 @@ class ClientPublic(ClientBase):
     Websockets client for public connections. See [public channel](https://docs.poloniex.com/#public-channels)
     documentation for more information on available commands.
     """
-    def __init__(self, on_message, on_error=None, ws_url=None):
+    def __init__(self, on_message, on_error=None, ws_url=None, on_reconnect=None, metrics=None):
         """
         Args:
             on_message (func(str), required): Function called when a new message arrives, must be able to handle a json string.
             on_error (func(Exception), optional): Function called when an error happens during normal operation, must be able to
                                         handle an exception object.
             ws_url (str, optional): Url to websockets interface of trade engine. Default is to production.
+            on_reconnect (func(), optional): Function called when the connection is re-established after it was lost.
+            metrics (StreamMetrics, optional): Records message rates, decode and handler time, queue depth and lag.
         """
         ws_url_base = ws_url
-        ClientBase.__init__(self, on_message, urljoin(ws_url_base, 'public'), on_error)
-
+        ClientBase.__init__(self, on_message, urljoin(ws_url_base, 'public'), on_error, on_reconnect, metrics)
 
-    async def subscribe_to_currencies(self):
-        """订阅货币信息"""
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["currencies"],
-            "currencies": ["ALL"]
-        }
-        await self._send_message(subscribe_message)
+    async def subscribe_to_currencies(self, currencies=channels.ALL_CURRENCIES):
+        """
+        Subscribe to currency updates.
 
+        Args:
+            currencies (str or str[], optional): Currency or list of currencies. Default ALL.
+        """
+        await self._send_frame(channels.currencies_frame(currencies))
 
-    async def subscribe_to_symbols(self):
-        """订阅符号信息"""
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["symbols"],  # 改为字符串
-            "symbols": ["btc_usdt"]
-        }
-        await self._send_message(subscribe_message)
+    async def subscribe_to_symbols(self, symbols=channels.ALL_SYMBOLS):
+        """
+        Subscribe to symbol updates.
 
+        Args:
+            symbols (str or str[], optional): Symbol or list of symbols. Default all.
+        """
+        await self._send_frame(channels.symbols_frame(symbols))
 
     async def subscribe_to_exchange(self):
-            """订阅交易信息"""
-            subscribe_message = {
-                "event": "subscribe",
-                "channel": ["exchange" ] # 改为字符串
-            }
-            await self._send_message(subscribe_message)
-
-
-    async def subscribe_to_candles(self):
-        """订阅K线数据"""
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["candles_minute_1"],  # 改为字符串
-            "symbols": ["BTC_USDT"]
-    }
-        await self._send_message(subscribe_message)
-
-
-    async def subscribe_to_trades(self):
-        """订阅交易信息"""
-        subscribe_message = {
-             "event": "subscribe",
-            "channel": ["trades"],  # 改为字符串
-            "symbols": ["BTC_USDT"]
-        }
-        await self._send_message(subscribe_message)
-
-
-    async def subscribe_to_ticker(self):
-        """订阅Ticker信息"""
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["ticker"],  # 改为字符串
-            "symbols": ["btc_usdt"]
-        }
-        await self._send_message(subscribe_message)
-
-
-    async def subscribe_to_book(self):
-        """订阅市场深度"""
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["book"],  # 改为字符串
-            "symbols": ["BTC_USDT"]
-        }
-        await self._send_message(subscribe_message)
-
-
-    async def subscribe_to_booklv2(self):
-        """订阅市场深度LV2"""
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": ["book_lv2"],  # 改为字符串
-            "symbols": ["BTC_USDT"]
-        }
-        await self._send_message(subscribe_message)
\ No newline at end of file
+        """
+        Subscribe to exchange maintenance and post only mode updates.
+        """
+        await self._send_frame(channels.exchange_frame())
+
+    async def subscribe_to_candles(self, symbols=channels.DEFAULT_SYMBOL, interval='MINUTE_1'):
+        """
+        Subscribe to candles for an interval.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default BTC_USDT.
+            interval (str, optional): One of channels.CANDLE_INTERVALS. Default MINUTE_1.
+        """
+        await self._send_frame(channels.candles_frame(symbols, interval))
+
+    async def subscribe_to_trades(self, symbols=channels.DEFAULT_SYMBOL):
+        """
+        Subscribe to trades.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default BTC_USDT.
+        """
+        await self._send_frame(channels.trades_frame(symbols))
+
+    async def subscribe_to_ticker(self, symbols=channels.DEFAULT_SYMBOL):
+        """
+        Subscribe to 24 hour ticker updates.
+
+        Args:
+            symbols (str or str[], optional): Symbol, list of symbols or channels.ALL_SYMBOLS. Default BTC_USDT.
+        """
+        await self._send_frame(channels.ticker_frame(symbols))
+
+    async def subscribe_to_book(self, symbols=channels.DEFAULT_SYMBOL, depth=None):
+        """
+        Subscribe to book snapshots.
+
+        Args:
+            symbols (str or str[], optional): Symbol or list of symbols. Default BTC_USDT.
+            depth (int, optional): One of channels.BOOK_DEPTHS. Server default is 5.
+        """
+        await self._send_frame(channels.book_frame(symbols, depth))
+
+    async def subscribe_to_booklv2(self, symbols=channels.DEFAULT_SYMBOL):
+        """
+        Subscribe to full book snapshots followed by incremental updates.
+
+        Args:
+            symbols (str or str[], optional): Symbol or list of symbols. Default BTC_USDT.
+        """
+        await self._send_frame(channels.book_lv2_frame(symbols))
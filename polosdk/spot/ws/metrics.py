@@ -0,0 +1,179 @@
+import threading
+import time
+
+from polosdk.spot.rest.metrics import Histogram
+
+# Decode and handler duration upper bounds in seconds.
+_default_buckets = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.1)
+# Exchange timestamp to local receive time upper bounds in seconds.
+_default_lag_buckets = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_symbol_fields = ('symbol', 's')
+
+
+def queue_depth(socket):
+    """
+    Best effort number of messages received by the websocket library but not yet read by the client.
+
+    Returns:
+        Queue depth, None when the websockets version in use does not expose its receive queue.
+    """
+    messages = getattr(socket, 'recv_messages', None)
+    frames = getattr(messages, 'frames', None)
+    if frames is not None:
+        return len(frames)
+
+    messages = getattr(socket, 'messages', None)
+    if messages is not None:
+        return len(messages)
+
+    return None
+
+
+def _item_symbol(item):
+    if not isinstance(item, dict):
+        return None
+
+    return next((item[field] for field in _symbol_fields if field in item), None)
+
+
+def _message_key(msg):
+    """
+    Returns:
+        (channel, symbols, ts) of a decoded message, symbols holds each distinct symbol of its data items in order.
+        Event messages are keyed by their event.
+    """
+    if not isinstance(msg, dict):
+        return None, (None,), None
+
+    channel = msg.get('channel') or msg.get('event')
+    data = msg.get('data')
+    if isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
+        symbols = (_item_symbol(data[0]),) if len(data) == 1 else tuple(dict.fromkeys(map(_item_symbol, data)))
+        return channel, symbols, data[0].get('ts')
+
+    return channel, (None,), msg.get('ts')
+
+
+class _StreamStats:
+    def __init__(self):
+        self.messages = 0
+        self.bytes = 0
+
+
+class StreamMetrics:
+    """
+    Counters for the websocket message path, pass an instance as the metrics argument of a websocket client.  Records
+    messages and bytes per channel and symbol, json decode time, on_message handler time, the depth of the websocket
+    receive queue and the lag between the exchange ts field and local receive time.
+
+    Rising handler time means the client is CPU bound, rising queue depth and lag with flat handler time means the
+    network or the exchange is behind.
+
+    Attributes:
+        _streams (dict): (channel, symbol) to message and byte counters.
+        _decode (Histogram): Json decode durations.
+        _handler (Histogram): Message handler durations.
+        _lag (Histogram): Exchange timestamp to local receive time.
+        _started (float): Start of the current measurement period.
+
+    Example:
+        metrics = StreamMetrics()
+        client = ClientPublic(on_message, ws_url=url, metrics=metrics)
+        ...
+        print(metrics.snapshot(reset=True))
+    """
+    def __init__(self, buckets=_default_buckets, lag_buckets=_default_lag_buckets):
+        """
+        Args:
+            buckets (tuple, optional): Decode and handler duration upper bounds in seconds. Default 10us to 100ms.
+            lag_buckets (tuple, optional): Lag upper bounds in seconds. Default 1ms to 10s.
+        """
+        self._buckets = buckets
+        self._lag_buckets = lag_buckets
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, size, msg, decode_sec, handler_sec, received_sec, depth=None):
+        """
+        Records one received message.
+
+        Args:
+            size (int, required): Size of the raw message.
+            msg (dict, required): Decoded message.
+            decode_sec (float, required): Time spent decoding the message.
+            handler_sec (float, required): Time spent handling the message.
+            received_sec (float, required): Local receive time as a unix timestamp in seconds.
+            depth (int, optional): Receive queue depth after the message was read.
+        """
+        channel, symbols, ts = _message_key(msg)
+
+        with self._lock:
+            # a multi-symbol message counts once for each symbol, its bytes are split between them
+            share = size // len(symbols)
+            for index, symbol in enumerate(symbols):
+                stats = self._streams.get((channel, symbol))
+                if stats is None:
+                    stats = _StreamStats()
+                    self._streams[(channel, symbol)] = stats
+
+                stats.messages += 1
+                stats.bytes += share if index > 0 else size - share * (len(symbols) - 1)
+            self._decode.observe(decode_sec)
+            self._handler.observe(handler_sec)
+
+            if isinstance(ts, (int, float)):
+                self._lag.observe(received_sec - ts / 1000)
+
+            if depth is not None:
+                self._depth = depth
+                self._max_depth = max(self._max_depth, depth)
+
+    def snapshot(self, reset=False):
+        """
+        Args:
+            reset (bool, optional): Start a new measurement period after taking the snapshot. Default false.
+
+        Returns:
+            Json object with per stream message and byte rates over the measurement period, decode, handler and lag
+            summaries (count, mean, p50, p99, max in seconds) and last and max queue depth.
+        """
+        with self._lock:
+            elapsed = max(time.monotonic() - self._started, 1e-9)
+            snapshot = {
+                'elapsed_sec': elapsed,
+                'streams': {
+                    f'{channel}:{symbol}' if symbol is not None else str(channel): {
+                        'messages': stats.messages,
+                        'bytes': stats.bytes,
+                        'messages_per_sec': stats.messages / elapsed,
+                        'bytes_per_sec': stats.bytes / elapsed
+                    }
+                    for (channel, symbol), stats in self._streams.items()
+                },
+                'decode': self._decode.summary(),
+                'handler': self._handler.summary(),
+                'lag': self._lag.summary(),
+                'queue_depth': self._depth,
+                'max_queue_depth': self._max_depth
+            }
+
+            if reset:
+                self._reset()
+
+        return snapshot
+
+    def reset(self):
+        """
+        Clears all counters and starts a new measurement period.
+        """
+        with self._lock:
+            self._reset()
+
+    def _reset(self):
+        self._streams = {}
+        self._decode = Histogram(self._buckets)
+        self._handler = Histogram(self._buckets)
+        self._lag = Histogram(self._lag_buckets)
+        self._depth = None
+        self._max_depth = 0
+        self._started = time.monotonic()
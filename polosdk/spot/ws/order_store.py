@@ -0,0 +1,284 @@
+import threading
+from collections import OrderedDict
+
+_default_max_closed = 10000
+# Orders returned by get_all when no limit is given.
+_default_snapshot_limit = 100
+
+
+def _id_range(order_ids):
+    """
+    Returns:
+        (lowest, highest) numeric order id, None when there is none.
+    """
+    numeric = [int(order_id) for order_id in order_ids if str(order_id).isdigit()]
+    return (min(numeric), max(numeric)) if len(numeric) > 0 else None
+
+
+def _in_range(order_id, id_range):
+    return id_range is not None and str(order_id).isdigit() and id_range[0] <= int(order_id) <= id_range[1]
+
+
+class OrderStore:
+    """
+    In-memory order state fed by the private orders websocket channel.  Orders are indexed by order id, client order
+    id and symbol so status queries are local lookups instead of REST calls.  After a reconnect the client
+    re-authenticates and re-subscribes on its own, the store is marked stale and should be reconciled once against a
+    REST snapshot of open orders, e.g. client.orders().get_all(), to catch up on messages missed in between.
+
+    Attributes:
+        _orders (dict): Order id to merged order state.
+        _client_ids (dict): Client order id to order id.
+        _open_by_symbol (dict): Symbol to a dict of open order ids to order state.
+        _fills (dict): Order id to the list of trade events received for it.
+        _closed (OrderedDict): Order ids of closed orders in the order they closed, used for eviction.
+        _max_closed (int): Maximum number of closed orders kept.
+        _stale (bool): Whether messages may have been missed since the last reconcile.
+        _stale_marks (int): Number of mark_stale calls, a reconcile only clears _stale when none happened meanwhile.
+
+    Example:
+        store = OrderStore()
+        client = ClientAuthenticated(store.apply, ws_url=ws_private, on_reconnect=store.mark_stale)
+        await client.connect(API_KEY, API_SECRET)
+        await client.subscribe_to_orders()
+        ...
+        if store.is_stale():
+            store.reconcile(rest_client.orders().get_all(limit=2000),
+                            fetch=lambda order_id: rest_client.orders().get_by_id(order_id), limit=2000)
+        order = store.get(order_id)
+    """
+    _channels = ('orders',)
+    _trade_channels = ()
+    _id_field = 'orderId'
+    _snapshot_id_field = 'id'
+    _client_id_field = 'clientOrderId'
+    _symbol_field = 'symbol'
+    _state_field = 'state'
+    _time_fields = ('ts', 'updateTime')
+    _trade_event_field = 'eventType'
+    _trade_event = 'trade'
+    _closed_states = frozenset(('FILLED', 'CANCELED', 'PARTIALLY_CANCELED', 'REJECTED', 'EXPIRED', 'FAILED'))
+    _snapshot_limit = _default_snapshot_limit
+
+    def __init__(self, max_closed=_default_max_closed):
+        """
+        Args:
+            max_closed (int, optional): Maximum number of closed orders kept for lookups. Default 10000.
+        """
+        self._orders = {}
+        self._client_ids = {}
+        self._open_by_symbol = {}
+        self._fills = {}
+        self._closed = OrderedDict()
+        self._max_closed = max_closed
+        self._stale = False
+        self._stale_marks = 0
+        self._lock = threading.RLock()
+
+    def apply(self, msg):
+        """
+        Applies a websocket message, messages from other channels are ignored so this can be used directly as the
+        on_message callback.
+
+        Args:
+            msg (dict, required): Decoded websocket message.
+        """
+        if not isinstance(msg, dict):
+            return
+
+        channel = msg.get('channel')
+        if channel in self._channels:
+            with self._lock:
+                for event in msg.get('data') or ():
+                    self._apply_event(event)
+        elif channel in self._trade_channels:
+            with self._lock:
+                for event in msg.get('data') or ():
+                    self._add_fill(event.get(self._id_field), event)
+
+    def reconcile(self, snapshot, fetch=None, limit=None):
+        """
+        Replaces open order state with a REST snapshot of open orders.  Orders that are open locally but missing from
+        the snapshot were closed while disconnected; they are refreshed with fetch when given, otherwise dropped.
+
+        The open order endpoints are paged, pass the orders of all pages together.  A snapshot holding at least limit
+        orders may miss pages, then without fetch only missing orders with an id within the ids of the snapshot are
+        dropped, others are kept and the store stays stale until fetch settles them.
+
+        Args:
+            snapshot (list or dict, required): Open orders from REST, a list or a json object with a 'data' list.
+            fetch (func(str), optional): Function returning the current state of one order by id.
+            limit (int, optional): Page size the snapshot was requested with. Default the endpoint default, 100 for
+                                   spot get_all.
+        """
+        orders = snapshot.get('data', []) if isinstance(snapshot, dict) else snapshot
+        paged = len(orders) >= (limit if limit is not None else self._snapshot_limit)
+
+        with self._lock:
+            stale_marks = self._stale_marks
+            open_ids = set()
+            for order in orders:
+                order_id = order.get(self._id_field, order.get(self._snapshot_id_field))
+                open_ids.add(order_id)
+                self._apply_event(order, order_id, force=True)
+
+            missing = [order_id for symbol_orders in self._open_by_symbol.values() for order_id in symbol_orders
+                       if order_id not in open_ids]
+
+        complete = True
+        if paged and fetch is None:
+            # 快照只是一页时, 只有落在这一页 id 范围内的缺失订单才确定已关闭
+            covered = _id_range(open_ids)
+            complete = all(_in_range(order_id, covered) for order_id in missing)
+            missing = [order_id for order_id in missing if _in_range(order_id, covered)]
+
+        for order_id in missing:
+            order = fetch(order_id) if fetch is not None else None
+
+            with self._lock:
+                if isinstance(order, dict) and 'data' in order:
+                    order = order['data']
+                    order = order[0] if isinstance(order, list) and len(order) > 0 else order
+
+                if isinstance(order, dict) and order:
+                    self._apply_event(order, order_id, force=True)
+                else:
+                    self._remove(order_id)
+
+        with self._lock:
+            # 对账期间再次重连时, 快照可能已经过期, 保持 stale
+            if complete and self._stale_marks == stale_marks:
+                self._stale = False
+
+    def mark_stale(self):
+        """
+        Marks the store as possibly missing messages, intended as the websocket client on_reconnect callback.
+        """
+        with self._lock:
+            self._stale = True
+            self._stale_marks += 1
+
+    def is_stale(self):
+        """
+        Returns:
+            True if a reconnect happened since the last reconcile.
+        """
+        return self._stale
+
+    def get(self, order_id):
+        """
+        Args:
+            order_id (str, required): Order id.
+
+        Returns:
+            Copy of the order state as json object or None if unknown.
+        """
+        with self._lock:
+            order = self._orders.get(order_id)
+            return dict(order) if order is not None else None
+
+    def get_by_client_order_id(self, client_order_id):
+        """
+        Args:
+            client_order_id (str, required): Client order id.
+
+        Returns:
+            Copy of the order state as json object or None if unknown.
+        """
+        with self._lock:
+            order_id = self._client_ids.get(client_order_id)
+            return self.get(order_id) if order_id is not None else None
+
+    def get_open(self, symbol=None):
+        """
+        Args:
+            symbol (str, optional): Only return open orders for this symbol. Default all symbols.
+
+        Returns:
+            List of copies of the open order states.
+        """
+        with self._lock:
+            if symbol is not None:
+                return [dict(order) for order in self._open_by_symbol.get(symbol, {}).values()]
+
+            return [dict(order) for symbol_orders in self._open_by_symbol.values() for order in symbol_orders.values()]
+
+    def get_fills(self, order_id):
+        """
+        Args:
+            order_id (str, required): Order id.
+
+        Returns:
+            List of copies of the trade events received for the order.
+        """
+        with self._lock:
+            return [dict(event) for event in self._fills.get(order_id, ())]
+
+    def _apply_event(self, event, order_id=None, force=False):
+        """
+        Merges one order event into the order state and updates the indexes.  Events older than the current state are
+        ignored unless force is set.
+        """
+        if order_id is None:
+            order_id = event.get(self._id_field)
+
+        if order_id is None:
+            return
+
+        order = self._orders.get(order_id)
+        if order is None:
+            order = {self._id_field: order_id}
+            self._orders[order_id] = order
+        elif not force and self._event_time(event) < self._event_time(order):
+            return
+
+        order.update(event)
+        order[self._id_field] = order_id
+
+        if self._trade_event is not None and event.get(self._trade_event_field) == self._trade_event:
+            self._add_fill(order_id, event)
+
+        client_order_id = order.get(self._client_id_field)
+        if client_order_id:
+            self._client_ids[client_order_id] = order_id
+
+        symbol = order.get(self._symbol_field)
+        if order.get(self._state_field) in self._closed_states:
+            self._open_by_symbol.get(symbol, {}).pop(order_id, None)
+            self._closed[order_id] = None
+            self._closed.move_to_end(order_id)
+            self._evict()
+        else:
+            self._open_by_symbol.setdefault(symbol, {})[order_id] = order
+            self._closed.pop(order_id, None)
+
+    def _add_fill(self, order_id, event):
+        if order_id is not None:
+            self._fills.setdefault(order_id, []).append(event)
+
+    def _event_time(self, event):
+        for field in self._time_fields:
+            value = event.get(field)
+            if value is not None:
+                return int(value)
+
+        return 0
+
+    def _evict(self):
+        while len(self._closed) > self._max_closed:
+            order_id, _ = self._closed.popitem(last=False)
+            self._remove(order_id)
+
+    def _remove(self, order_id):
+        order = self._orders.pop(order_id, None)
+        self._fills.pop(order_id, None)
+        self._closed.pop(order_id, None)
+
+        if order is None:
+            return
+
+        self._open_by_symbol.get(order.get(self._symbol_field), {}).pop(order_id, None)
+
+        client_order_id = order.get(self._client_id_field)
+        if client_order_id and self._client_ids.get(client_order_id) == order_id:
+            del self._client_ids[client_order_id]
@@ -0,0 +1,237 @@
+import gzip
+import json
+import os
+import queue
+import re
+import struct
+import threading
+import time
+from datetime import datetime, timezone
+
+# Every record is a header of receive time in ns since epoch and payload length, followed by the utf-8 frame.
+RECORD_HEADER = struct.Struct('<qI')
+FILE_SUFFIX = '.rec.gz'
+EVENTS_CHANNEL = 'events'
+
+_channel_pattern = re.compile(r'"channel"\s*:\s*"([^"]+)"')
+_ns_per_hour = 3600 * 10 ** 9
+_default_flush_interval_sec = 1.0
+_default_max_batch = 10000
+_stop = object()
+
+
+def frame_channel(frame):
+    """
+    Returns:
+        Channel of a raw frame without decoding it, EVENTS_CHANNEL for frames without one e.g. pong.
+    """
+    match = _channel_pattern.search(frame)
+    return match.group(1) if match is not None else EVENTS_CHANNEL
+
+
+def recording_path(directory, channel, received_ns):
+    """
+    Returns:
+        Path of the file holding a channel's records of the hour of received_ns, <directory>/<channel>/YYYYMMDDHH.rec.gz
+        in UTC.
+    """
+    hour = datetime.fromtimestamp(received_ns // 10 ** 9, tz=timezone.utc).strftime('%Y%m%d%H')
+    return os.path.join(directory, channel, f'{hour}{FILE_SUFFIX}')
+
+
+def iter_records(path):
+    """
+    Reads a recording file.
+
+    Args:
+        path (str, required): Path of a .rec.gz file.
+
+    Returns:
+        Generator of (received_ns, frame) tuples in file order.  A record truncated by a crash ends the generator.
+    """
+    with gzip.open(path, 'rb') as file:
+        while True:
+            header = file.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+
+            received_ns, length = RECORD_HEADER.unpack(header)
+            payload = file.read(length)
+            if len(payload) < length:
+                return
+
+            yield received_ns, payload.decode('utf8')
+
+
+def list_recordings(directory, channels=None):
+    """
+    Args:
+        directory (str, required): Recorder directory.
+        channels (list, optional): Only include these channels. Default all.
+
+    Returns:
+        Dictionary of channel to its recording file paths in time order.
+    """
+    recordings = {}
+    for channel in sorted(os.listdir(directory)):
+        channel_dir = os.path.join(directory, channel)
+        if not os.path.isdir(channel_dir) or (channels is not None and channel not in channels):
+            continue
+
+        files = sorted(name for name in os.listdir(channel_dir) if name.endswith(FILE_SUFFIX))
+        recordings[channel] = [os.path.join(channel_dir, name) for name in files]
+
+    return recordings
+
+
+class Recorder:
+    """
+    Records websocket frames with their receive time to compressed, length-prefixed, append-only logs, one file per
+    channel and hour.  The receive loop only queues frames, a background thread batches, compresses and writes them so
+    recording does not slow message handling.  Every batch is appended as its own gzip member, a crash loses at most
+    the batch being written.
+
+    Attributes:
+        _directory (str): Root directory of the recordings.
+        _queue (queue.SimpleQueue): Frames waiting to be written.
+        _files (dict): (channel, hour) to the open file of that channel and hour.
+
+    Example:
+        recorder = Recorder('recordings')
+        client = ClientPublic(on_message, ws_url=url)
+        recorder.attach(client)
+        ...
+        recorder.close()
+    """
+    def __init__(self, directory, flush_interval_sec=_default_flush_interval_sec, max_batch=_default_max_batch,
+                 compresslevel=6, on_error=None):
+        """
+        Args:
+            directory (str, required): Root directory of the recordings, created if missing.
+            flush_interval_sec (float, optional): Longest time a frame waits before it is written. Default 1 second.
+            max_batch (int, optional): Most frames written per batch. Default 10000.
+            compresslevel (int, optional): Gzip compression level. Default 6.
+            on_error (func(Exception), optional): Function called when writing fails.
+        """
+        self._directory = directory
+        self._flush_interval_sec = flush_interval_sec
+        self._max_batch = max_batch
+        self._compresslevel = compresslevel
+        self._on_error = on_error
+        self._queue = queue.SimpleQueue()
+        self._files = {}
+        self._clients = []
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def attach(self, client):
+        """
+        Records every frame received by a websocket client.
+
+        Args:
+            client (ClientBase, required): Spot or futures, public or authenticated websocket client.
+
+        Returns:
+            self
+        """
+        client.add_frame_listener(self.record)
+        self._clients.append(client)
+        return self
+
+    def detach(self, client):
+        client.remove_frame_listener(self.record)
+        if client in self._clients:
+            self._clients.remove(client)
+
+    def record(self, frame, received_ns=None):
+        """
+        Queues a raw frame, never blocks.
+
+        Args:
+            frame (str, required): Frame as received.
+            received_ns (int, optional): Receive time in ns since epoch. Default now.
+        """
+        self._queue.put((received_ns if received_ns is not None else time.time_ns(), frame))
+
+    def record_message(self, msg, received_ns=None):
+        """
+        Queues a decoded message, stored as compact json, e.g. from an on_message handler after filtering.
+
+        Args:
+            msg (dict, required): Decoded message.
+            received_ns (int, optional): Receive time in ns since epoch. Default now.
+        """
+        self.record(json.dumps(msg, separators=(',', ':')), received_ns)
+
+    def close(self):
+        """
+        Detaches from all clients, writes all queued frames and closes the files.
+        """
+        for client in list(self._clients):
+            self.detach(client)
+
+        self._queue.put(_stop)
+        self._thread.join()
+
+    def _run(self):
+        stopped = False
+        while not stopped:
+            try:
+                batch = [self._queue.get(timeout=self._flush_interval_sec)]
+            except queue.Empty:
+                self._close_files(before_hour=time.time_ns() // _ns_per_hour)
+                continue
+
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if any(item is _stop for item in batch):
+                stopped = True
+                batch = [item for item in batch if item is not _stop]
+
+            try:
+                self._write(batch)
+            except Exception as err:
+                if self._on_error is not None:
+                    self._on_error(err)
+
+        self._close_files()
+
+    def _write(self, batch):
+        """
+        Groups a batch by channel and hour and appends each group as one compressed member.
+        """
+        if len(batch) == 0:
+            return
+
+        groups = {}
+        for received_ns, frame in batch:
+            payload = frame.encode('utf8') if isinstance(frame, str) else frame
+            key = (frame_channel(frame if isinstance(frame, str) else frame.decode('utf8')),
+                   received_ns // _ns_per_hour)
+            groups.setdefault(key, [received_ns, []])[1].append(RECORD_HEADER.pack(received_ns, len(payload)))
+            groups[key][1].append(payload)
+
+        for (channel, hour), (received_ns, parts) in groups.items():
+            file = self._files.get((channel, hour))
+            if file is None:
+                path = recording_path(self._directory, channel, received_ns)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                file = open(path, 'ab')
+                self._files[(channel, hour)] = file
+
+            file.write(gzip.compress(b''.join(parts), compresslevel=self._compresslevel))
+            file.flush()
+
+        self._close_files(before_hour=max(hour for _, hour in groups))
+
+    def _close_files(self, before_hour=None):
+        """
+        Closes files of hours before before_hour, all files when None.
+        """
+        for key in list(self._files):
+            if before_hour is None or key[1] < before_hour:
+                self._files.pop(key).close()
@@ -0,0 +1,233 @@
+import asyncio
+import heapq
+import json
+import time
+
+from polosdk.spot.ws.client_base import ClientBase
+from polosdk.spot.ws.recorder import iter_records, list_recordings
+
+# Frames dispatched between yields to the event loop when replaying as fast as possible.
+_yield_every = 1000
+# Shortest wait worth sleeping for in timed replay, shorter gaps are dispatched right away.
+_min_sleep_sec = 0.001
+
+
+async def _ignored(self, *args, **kwargs):
+    """
+    Ignored, the recording already holds what was subscribed.
+    """
+    pass
+
+
+def _iter_channel(paths, start_ns, end_ns):
+    for path in paths:
+        for received_ns, frame in iter_records(path):
+            if start_ns is not None and received_ns < start_ns:
+                continue
+            if end_ns is not None and received_ns >= end_ns:
+                return
+            yield received_ns, frame
+
+
+def iter_frames(directory, channels=None, start_ns=None, end_ns=None):
+    """
+    Merges the recordings of several channels into one stream in receive time order.  Frames of the same channel keep
+    their recorded order.
+
+    Args:
+        directory (str, required): Recorder directory.
+        channels (list, optional): Only replay these channels. Default all.
+        start_ns (int, optional): Skip frames received before this time in ns since epoch.
+        end_ns (int, optional): Stop at frames received at or after this time in ns since epoch.
+
+    Returns:
+        Generator of (received_ns, frame) tuples.
+    """
+    recordings = list_recordings(directory, channels)
+    return heapq.merge(*(_iter_channel(paths, start_ns, end_ns) for paths in recordings.values()),
+                       key=lambda record: record[0])
+
+
+class ReplayClient(ClientBase):
+    """
+    Websockets client that plays recorded frames back from disk instead of a connection, in real time, faster or as
+    fast as possible.  Messages reach on_message and errors reach on_error exactly as with ClientPublic or
+    ClientAuthenticated, so handlers, order books and strategies can be run and benchmarked offline.  Outgoing frames
+    e.g. subscriptions and pings are ignored, the recording already holds what was subscribed, and the subscribe_to_*
+    methods of the spot and futures clients are accepted and do nothing.
+
+    Frame listeners are called with the recorded receive time, and lag reported by metrics is measured against the
+    replay clock.
+
+    Example:
+        client = ReplayClient(on_message, 'recordings', speed=None)
+        await client.connect()
+        await client.wait()
+    """
+    def __init__(self, on_message, directory, on_error=None, channels=None, speed=1.0, start_ns=None, end_ns=None,
+                 on_reconnect=None, metrics=None):
+        """
+        Args:
+            on_message (func(str), required): Function called when a new message arrives, must be able to handle a json
+                                              string.
+            directory (str, required): Recorder directory to replay.
+            on_error (func(Exception), optional): Function called when an error happens during normal operation, must be
+                                                  able to handle an exception object.
+            channels (list, optional): Only replay these channels. Default all.
+            speed (float, optional): Playback speed, 1 for real time, 10 for ten times faster, None to replay as fast as
+                                     possible. Default 1.
+            start_ns (int, optional): Skip frames received before this time in ns since epoch.
+            end_ns (int, optional): Stop at frames received at or after this time in ns since epoch.
+            on_reconnect (func(), optional): Accepted for interface compatibility, a replay never reconnects.
+            metrics (StreamMetrics, optional): Records message rates, decode and handler time and lag.
+
+        Raises:
+            ValueError: Speed is not positive.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError('speed must be positive or None')
+
+        ClientBase.__init__(self, on_message, directory, on_error, on_reconnect, metrics)
+        self._directory = directory
+        self._channels = channels
+        self._speed = speed
+        self._start_ns = start_ns
+        self._end_ns = end_ns
+        self._replayed = 0
+
+    subscribe_to_currencies = subscribe_to_symbols = subscribe_to_exchange = subscribe_to_candles = _ignored
+    subscribe_to_trades = subscribe_to_ticker = subscribe_to_book = subscribe_to_booklv2 = _ignored
+    subscribe_to_orders = subscribe_to_balances = _ignored
+    subscribe_to_ProductInfosymbol = subscribe_to_OrderBook = subscribe_to_orderbooklv2 = subscribe_to_KlineData = \
+        _ignored
+    subscribe_to_Tickers = subscribe_to_Trades = subscribe_to_IndexPrice = subscribe_to_MarkPrice = _ignored
+    subscribe_to_IndexPriceKlineData = subscribe_to_MarkPriceKlineData = subscribe_to_FundingRate = _ignored
+    subscribe_to_positions = subscribe_to_trade = subscribe_to_account = _ignored
+
+    @property
+    def replayed(self):
+        """
+        Returns:
+            Number of frames dispatched by the last replay.
+        """
+        return self._replayed
+
+    async def connect(self, api_key=None, api_secret=None):
+        """
+        Starts replaying in a background task.
+
+        Args:
+            api_key (str, optional): Accepted for interface compatibility with ClientAuthenticated, not used.
+            api_secret (str, optional): Accepted for interface compatibility with ClientAuthenticated, not used.
+        """
+        if self._conn_task is not None:
+            raise RuntimeError('Already connected to websocket')
+
+        self._keep_alive = True
+        self._replayed = 0
+        self._conn_task = asyncio.create_task(self.listen())
+
+    async def disconnect(self):
+        """
+        Stops the replay.
+        """
+        if self._conn_task is None:
+            raise RuntimeError('Not connected to websocket')
+
+        self._keep_alive = False
+        await self._cancel_conn_task()
+
+    async def wait(self):
+        """
+        Waits until every frame was replayed.
+
+        Returns:
+            Number of frames dispatched.
+        """
+        if self._conn_task is not None:
+            task = self._conn_task
+            await asyncio.shield(task)
+            if self._conn_task is task:
+                self._conn_task = None
+
+        return self._replayed
+
+    async def listen(self):
+        """
+        Internal replay task, dispatches recorded frames paced by their receive time and the playback speed.
+        """
+        frames = iter_frames(self._directory, self._channels, self._start_ns, self._end_ns)
+        first_ns = None
+        started = time.perf_counter()
+
+        for received_ns, frame in frames:
+            if not self._keep_alive:
+                break
+
+            if self._speed is None:
+                if self._replayed % _yield_every == 0:
+                    await asyncio.sleep(0)
+            else:
+                if first_ns is None:
+                    first_ns = received_ns
+
+                delay = started + (received_ns - first_ns) / 10 ** 9 / self._speed - time.perf_counter()
+                if delay >= _min_sleep_sec:
+                    await asyncio.sleep(delay)
+
+            self._replayed += 1
+            # Lag on the replay clock covers both the recorded lag and any delay in dispatching the frame.
+            received_sec = received_ns / 10 ** 9 if first_ns is None else \
+                first_ns / 10 ** 9 + (time.perf_counter() - started) * self._speed
+            self._dispatch(frame, received_ns, received_sec)
+
+        self._keep_alive = False
+
+    def _dispatch(self, frame, received_ns, received_sec=None):
+        """
+        Dispatches one recorded frame.
+
+        Args:
+            frame(str): Recorded frame.
+            received_ns(int): Recorded receive time in ns since epoch.
+            received_sec(float): Receive time on the replay clock in seconds since epoch used for lag. Default the
+                                 recorded receive time.
+        """
+        for listener in self._frame_listeners:
+            try:
+                listener(frame, received_ns)
+            except Exception as err:
+                if self._on_error is not None:
+                    self._on_error(err)
+
+        try:
+            if self._metrics is not None:
+                self._handle_measured(frame, None, received_sec if received_sec is not None else received_ns / 10 ** 9)
+                return
+
+            self._handle_message(json.loads(frame))
+        except Exception as err:
+            if self._on_error is not None:
+                self._on_error(err)
+
+    async def _send_message(self, msg):
+        pass
+
+    async def _send_frame(self, frame):
+        pass
+
+
+def replay(directory, on_message, channels=None, start_ns=None, end_ns=None, on_error=None):
+    """
+    Replays a recording as fast as possible without an event loop, e.g. to benchmark message handlers.
+
+    Returns:
+        Number of frames dispatched.
+    """
+    client = ReplayClient(on_message, directory, on_error, channels, speed=None, start_ns=start_ns, end_ns=end_ns)
+    count = 0
+    for received_ns, frame in iter_frames(directory, channels, start_ns, end_ns):
+        client._dispatch(frame, received_ns)
+        count += 1
+
+    return count
@@ -38,20 +38,20 @@ async def main():
     await client.subscribe_to_currencies()
 
     # 订阅交易信息
-    await client.subscribe_to_trades()
+    await client.subscribe_to_trades('BTC_USDT')
     #
     # # 订阅市场深度
-    await client.subscribe_to_book()
+    await client.subscribe_to_book('BTC_USDT')
     #
     # # 订阅 K 线数据
-    await client.subscribe_to_candles()
+    await client.subscribe_to_candles('BTC_USDT')
 
     # # 订阅 Ticker 信息
-    await client.subscribe_to_ticker()
+    await client.subscribe_to_ticker('BTC_USDT')
     #
     # # 订阅符号信息
     await client.subscribe_to_symbols()
-    await client.subscribe_to_booklv2()
+    await client.subscribe_to_booklv2('BTC_USDT')
     await client.subscribe_to_exchange()
 
     # 持续监听消息
@@ -70,10 +70,16 @@ async def main2():
     await client.connect(api_key=API_KEY, api_secret=API_SECRET)
 
     await client.subscribe_to_orders()
-    await client.subscribe_to_createorder()
     await client.subscribe_to_balances()
-    await client.subscribe_to_cancelmultipleorders()
-    await client.subscribe_to_cancelall()
+
+    try:
+        order = await client.create_order('BTC_USDT', 'BUY', type='LIMIT', quantity='100', price='40000.50000',
+                                          time_in_force='IOC', client_order_id='1234Abc')
+        print("Create order:", order)
+        print("Cancel orders:", await client.cancel_orders(order_ids=[order['orderId']]))
+        print("Cancel all orders:", await client.cancel_all_orders())
+    except Exception as e:
+        print("Error during order entry:", e)
 
     # 持续监听消息
     try:
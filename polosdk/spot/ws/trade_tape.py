@@ -0,0 +1,429 @@
+import os
+import threading
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError('TradeTape requires numpy, install it with: pip install numpy')
+
+# Side is +1 for taker buys and -1 for taker sells.
+TRADE_DTYPE = np.dtype([('ts', '<i8'), ('price', '<f8'), ('quantity', '<f8'), ('side', 'i1'), ('id', '<i8')])
+BUY = 1
+SELL = -1
+
+_default_chunk_size = 4096
+_default_max_trades = 1000000
+
+
+def _side(value):
+    return BUY if value is not None and value[:1] in ('b', 'B') else SELL
+
+
+class _Tape:
+    """
+    Trades of one symbol in fixed size chunks, oldest first.  Only the last chunk is partially filled.
+    """
+    def __init__(self):
+        self.chunks = deque()
+        self.fill = 0
+        self.last_id = None
+        self.evicted_id = None
+
+    def size(self, chunk_size):
+        return max(len(self.chunks) - 1, 0) * chunk_size + self.fill
+
+    def truncate(self, size, chunk_size):
+        """
+        Drops the trades after the first size ones.
+        """
+        while len(self.chunks) > 0 and (len(self.chunks) - 1) * chunk_size >= size:
+            self.chunks.pop()
+
+        self.fill = size - (len(self.chunks) - 1) * chunk_size if len(self.chunks) > 0 else 0
+
+    def view(self):
+        if len(self.chunks) == 0:
+            return np.empty(0, dtype=TRADE_DTYPE)
+
+        parts = list(self.chunks)
+        parts[-1] = parts[-1][:self.fill]
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+
+class TradeTape:
+    """
+    Per symbol trade history in chunked columnar numpy arrays, fed by the trades websocket channel and by REST trade
+    lists.  Memory is bounded, when a symbol holds more than max_trades its oldest chunk is evicted, or written to a
+    Parquet file first when spill_dir is set.  Queries run vectorized over the arrays and return numpy values, no
+    per-trade Python objects are created.
+
+    Trades are kept in id order and trades whose id is already stored are dropped, so a REST backfill overlapping the
+    stream is not counted twice and may come before or after subscribing.  Trades older than the evicted ones of a
+    symbol can not be placed and are counted in dropped_trades.
+
+    Attributes:
+        _tapes (dict): Symbol to its chunks.
+        _chunk_size (int): Trades per chunk.
+        _max_chunks (int): Chunks kept per symbol.
+
+    Example:
+        tape = TradeTape()
+        tape.extend('BTC_USDT', client.markets().get_trades('BTC_USDT', limit=1000))
+        ws_client = ClientPublic(tape.apply, ws_url=ws_public)
+        await ws_client.connect()
+        await ws_client.subscribe_to_trades('BTC_USDT')
+        ...
+        vwap = tape.vwap('BTC_USDT', start_ms=now - 60000)
+    """
+    _channels = ('trades',)
+    _symbol_field = 'symbol'
+    _id_field = 'id'
+    _price_field = 'price'
+    _quantity_field = 'quantity'
+    _side_field = 'takerSide'
+    _time_fields = ('createTime', 'ts')
+
+    def __init__(self, chunk_size=_default_chunk_size, max_trades=_default_max_trades, spill_dir=None):
+        """
+        Args:
+            chunk_size (int, optional): Trades per chunk. Default 4096.
+            max_trades (int, optional): Trades kept in memory per symbol, rounded up to whole chunks. Default 1000000.
+            spill_dir (str, optional): Directory evicted chunks are written to as Parquet, needs pyarrow. Default
+                                       evicted trades are dropped.
+        """
+        self._tapes = {}
+        self._chunk_size = chunk_size
+        self._max_chunks = max(-(-max_trades // chunk_size), 1)
+        self._spill_dir = spill_dir
+        self._dropped_trades = 0
+        self._lock = threading.RLock()
+
+        if spill_dir is not None:
+            _import_parquet()
+
+    @property
+    def dropped_trades(self):
+        return self._dropped_trades
+
+    def apply(self, msg):
+        """
+        Appends the trades of a websocket message, messages from other channels are ignored so this can be used
+        directly as the on_message callback.
+
+        Args:
+            msg (dict, required): Decoded websocket message.
+        """
+        if not isinstance(msg, dict) or msg.get('channel') not in self._channels:
+            return
+
+        by_symbol = {}
+        for trade in msg.get('data') or ():
+            by_symbol.setdefault(trade.get(self._symbol_field), []).append(trade)
+
+        for symbol, trades in by_symbol.items():
+            self.extend(symbol, trades)
+
+    def extend(self, symbol, trades):
+        """
+        Appends trades of a symbol, e.g. the response of get_trades.
+
+        Args:
+            symbol (str, required): Symbol name.
+            trades (list or dict, required): Trade json objects in any order, or a json object with a 'data' list.
+
+        Returns:
+            Number of trades appended.
+        """
+        if isinstance(trades, dict):
+            trades = trades.get('data') or []
+
+        if len(trades) == 0:
+            return 0
+
+        rows = np.empty(len(trades), dtype=TRADE_DTYPE)
+        rows['ts'] = [self._time(trade) for trade in trades]
+        rows['price'] = np.array([trade[self._price_field] for trade in trades], dtype=np.float64)
+        rows['quantity'] = np.array([trade[self._quantity_field] for trade in trades], dtype=np.float64)
+        rows['side'] = [_side(trade.get(self._side_field)) for trade in trades]
+        rows['id'] = np.array([trade[self._id_field] for trade in trades], dtype=np.int64)
+        return self.append_rows(symbol, rows)
+
+    def append_rows(self, symbol, rows):
+        """
+        Appends trades that are already columnar.
+
+        Args:
+            symbol (str, required): Symbol name.
+            rows (numpy.ndarray, required): Array of TRADE_DTYPE.
+
+        Returns:
+            Number of trades added, trades already stored or older than the evicted ones are not counted.
+        """
+        if len(rows) > 1 and np.any(rows['id'][1:] <= rows['id'][:-1]):
+            rows = rows[np.argsort(rows['id'], kind='stable')]
+            rows = rows[np.r_[True, rows['id'][1:] != rows['id'][:-1]]]
+
+        with self._lock:
+            tape = self._tapes.get(symbol)
+            if tape is None:
+                tape = _Tape()
+                self._tapes[symbol] = tape
+
+            if tape.evicted_id is not None:
+                late = rows['id'] <= tape.evicted_id
+                self._dropped_trades += int(late.sum())
+                rows = rows[~late]
+
+            if tape.last_id is not None and len(rows) > 0 and rows['id'][0] <= tape.last_id:
+                return self._merge(symbol, tape, rows)
+
+            return self._append(symbol, tape, rows)
+
+    def _merge(self, symbol, tape, rows):
+        """
+        Inserts trades older than the last stored one, rewriting the stored trades from the oldest inserted id on.
+        """
+        stored = tape.view()
+        position = int(np.searchsorted(stored['id'], rows['id'][0]))
+        tail = stored[position:].copy()
+        new = rows[~np.isin(rows['id'], tail['id'])]
+        if len(new) == 0:
+            return 0
+
+        merged = np.concatenate([tail, new])
+        merged = merged[np.argsort(merged['id'], kind='stable')]
+        tape.truncate(position, self._chunk_size)
+        tape.last_id = None
+        self._append(symbol, tape, merged)
+        return len(new)
+
+    def _append(self, symbol, tape, rows):
+        """
+        Appends trades newer than the last stored one.
+        """
+        if len(rows) == 0:
+            return 0
+
+        offset = 0
+        while offset < len(rows):
+            if len(tape.chunks) == 0 or tape.fill == self._chunk_size:
+                self._add_chunk(symbol, tape)
+
+            count = min(self._chunk_size - tape.fill, len(rows) - offset)
+            tape.chunks[-1][tape.fill:tape.fill + count] = rows[offset:offset + count]
+            tape.fill += count
+            offset += count
+
+        tape.last_id = int(rows['id'][-1])
+        return len(rows)
+
+    def symbols(self):
+        """
+        Returns:
+            List of symbols with trades.
+        """
+        with self._lock:
+            return list(self._tapes)
+
+    def count(self, symbol):
+        """
+        Returns:
+            Number of trades in memory for a symbol.
+        """
+        with self._lock:
+            tape = self._tapes.get(symbol)
+            return tape.size(self._chunk_size) if tape is not None else 0
+
+    def trades(self, symbol, start_ms=None, end_ms=None):
+        """
+        Args:
+            symbol (str, required): Symbol name.
+            start_ms (int, optional): Only trades at or after this time in ms since epoch.
+            end_ms (int, optional): Only trades before this time in ms since epoch.
+
+        Returns:
+            Array of TRADE_DTYPE in trade id order, columns are accessed by name e.g. trades['price'].
+        """
+        with self._lock:
+            tape = self._tapes.get(symbol)
+            rows = tape.view() if tape is not None else np.empty(0, dtype=TRADE_DTYPE)
+
+            if start_ms is None and end_ms is None:
+                return rows.copy() if rows.base is not None else rows
+
+        ts = rows['ts']
+        mask = np.ones(len(rows), dtype=bool)
+        if start_ms is not None:
+            mask &= ts >= start_ms
+        if end_ms is not None:
+            mask &= ts < end_ms
+
+        return rows[mask]
+
+    def last(self, symbol, n=1):
+        """
+        Returns:
+            Array of the n most recent trades of a symbol.
+        """
+        with self._lock:
+            tape = self._tapes.get(symbol)
+            if tape is None:
+                return np.empty(0, dtype=TRADE_DTYPE)
+
+            return tape.view()[-n:].copy()
+
+    def vwap(self, symbol, start_ms=None, end_ms=None):
+        """
+        Returns:
+            Volume weighted average price of a symbol's trades in the window, nan when there are none.
+        """
+        rows = self.trades(symbol, start_ms, end_ms)
+        quantity = rows['quantity'].sum()
+        if quantity == 0:
+            return float('nan')
+
+        return float(np.dot(rows['price'], rows['quantity']) / quantity)
+
+    def volume_buckets(self, symbol, interval_ms, start_ms=None, end_ms=None):
+        """
+        Aggregates trades into fixed time buckets, empty buckets are omitted.
+
+        Args:
+            symbol (str, required): Symbol name.
+            interval_ms (int, required): Bucket length in ms, buckets start at multiples of it.
+            start_ms (int, optional): Only trades at or after this time in ms since epoch.
+            end_ms (int, optional): Only trades before this time in ms since epoch.
+
+        Returns:
+            Dictionary of numpy arrays with one value per bucket:
+                {
+                    'start': Bucket start in ms since epoch,
+                    'count': Number of trades,
+                    'volume': Base units traded,
+                    'buy_volume': Base units bought by takers,
+                    'sell_volume': Base units sold by takers,
+                    'notional': Quote units traded,
+                    'vwap': Volume weighted average price
+                }
+        """
+        rows = self.trades(symbol, start_ms, end_ms)
+        if len(rows) > 1 and np.any(rows['ts'][1:] < rows['ts'][:-1]):
+            rows = rows[np.argsort(rows['ts'], kind='stable')]
+
+        bucket = rows['ts'] // interval_ms * interval_ms
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]]) if len(rows) > 0 else np.empty(0, np.intp)
+
+        quantity = rows['quantity']
+        buy = np.where(rows['side'] == BUY, quantity, 0.0)
+        notional = rows['price'] * quantity
+
+        def _sum(values):
+            return np.add.reduceat(values, starts) if len(starts) > 0 else np.empty(0, values.dtype)
+
+        volume = _sum(quantity)
+        buy_volume = _sum(buy)
+        notional_sum = _sum(notional)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vwap = notional_sum / volume
+
+        return {
+            'start': bucket[starts],
+            'count': np.diff(np.r_[starts, len(rows)]),
+            'volume': volume,
+            'buy_volume': buy_volume,
+            'sell_volume': volume - buy_volume,
+            'notional': notional_sum,
+            'vwap': vwap
+        }
+
+    def to_arrow(self, symbol):
+        """
+        Returns:
+            pyarrow.Table of a symbol's trades in memory.
+
+        Raises:
+            ImportError: pyarrow is not installed.
+        """
+        return _to_table(self.trades(symbol))
+
+    def clear(self, symbol=None):
+        """
+        Drops the trades of a symbol, all symbols when None.
+        """
+        with self._lock:
+            if symbol is None:
+                self._tapes.clear()
+            else:
+                self._tapes.pop(symbol, None)
+
+    def _time(self, trade):
+        for field in self._time_fields:
+            value = trade.get(field)
+            if value is not None:
+                return int(value)
+
+        return 0
+
+    def _add_chunk(self, symbol, tape):
+        if len(tape.chunks) >= self._max_chunks:
+            evicted = tape.chunks.popleft()
+            tape.evicted_id = int(evicted['id'][-1])
+            if self._spill_dir is not None:
+                self._spill(symbol, evicted)
+
+        tape.chunks.append(np.empty(self._chunk_size, dtype=TRADE_DTYPE))
+        tape.fill = 0
+
+    def _spill(self, symbol, rows):
+        """
+        Writes an evicted chunk to <spill_dir>/<symbol>/<first id>.parquet.
+        """
+        pq = _import_parquet()
+        directory = os.path.join(self._spill_dir, symbol)
+        os.makedirs(directory, exist_ok=True)
+        pq.write_table(_to_table(rows), os.path.join(directory, f'{int(rows["id"][0])}.parquet'))
+
+
+def _import_parquet():
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError('Arrow and Parquet export requires pyarrow, install it with: pip install pyarrow')
+
+    return pq
+
+
+def _to_table(rows):
+    _import_parquet()
+    import pyarrow as pa
+
+    return pa.table({name: rows[name] for name in TRADE_DTYPE.names})
+
+
+def read_spilled(spill_dir, symbol):
+    """
+    Reads the chunks of a symbol spilled to Parquet back into one array.
+
+    Returns:
+        Array of TRADE_DTYPE in trade id order.
+
+    Raises:
+        ImportError: pyarrow is not installed.
+    """
+    pq = _import_parquet()
+    directory = os.path.join(spill_dir, symbol)
+    if not os.path.isdir(directory):
+        return np.empty(0, dtype=TRADE_DTYPE)
+
+    names = sorted((name for name in os.listdir(directory) if name.endswith('.parquet')),
+                   key=lambda name: int(name.split('.')[0]))
+    parts = []
+    for name in names:
+        table = pq.read_table(os.path.join(directory, name))
+        part = np.empty(table.num_rows, dtype=TRADE_DTYPE)
+        for field in TRADE_DTYPE.names:
+            part[field] = table.column(field).to_numpy()
+        parts.append(part)
+
+    return np.concatenate(parts) if len(parts) > 0 else np.empty(0, dtype=TRADE_DTYPE)
@@ -0,0 +1,11 @@
+from polosdk.spot.ws.bar_builder import BarBuilder
+
+
+def test_close_time_is_last_ms_of_bar():
+    bars = []
+    builder = BarBuilder([1000], on_bar=bars.append, emit_empty=True)
+    builder.add('BTC_USDT', 1500, 10.0, 1.0)
+    builder.add('BTC_USDT', 3200, 11.0, 1.0)
+
+    assert [(bar['startTime'], bar['closeTime']) for bar in bars] == [(1000, 1999), (2000, 2999)]
+    assert builder.current('BTC_USDT', 1000)['closeTime'] == 3999
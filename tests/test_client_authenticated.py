@@ -0,0 +1,29 @@
+import asyncio
+import json
+
+import pytest
+
+from polosdk.spot.ws.client_authenticated import ClientAuthenticated
+
+
+class _Socket:
+    def __init__(self, client):
+        self.client = client
+        self.sent = []
+
+    async def send(self, frame):
+        msg = json.loads(frame)
+        self.sent.append(msg)
+        self.client._handle_message({'id': msg['id'], 'data': [{'orderId': '1', 'clientOrderId': '', 'code': 0}]})
+
+
+def test_deprecated_create_order_delegates():
+    client = ClientAuthenticated(print, ws_url='ws://localhost/')
+    client._websocket = _Socket(client)
+
+    with pytest.deprecated_call():
+        result = asyncio.run(client.subscribe_to_createorder('BTC_USDT', 'BUY', type='LIMIT', price='1', quantity='1'))
+
+    assert result['orderId'] == '1'
+    assert client._websocket.sent[0]['event'] == 'createOrder'
+    assert client._websocket.sent[0]['params']['symbol'] == 'BTC_USDT'
@@ -0,0 +1,63 @@
+import asyncio
+import json
+
+from polosdk.spot.ws import channels
+from polosdk.spot.ws.client_base import ClientBase
+
+
+class _Socket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, frame):
+        self.sent.append(json.loads(frame))
+
+
+def _client():
+    client = ClientBase(print, 'ws://localhost/')
+    client._websocket = _Socket()
+    return client
+
+
+def test_subscriptions_are_replayed_after_unsubscribe():
+    client = _client()
+
+    async def run():
+        await client.subscribe(['trades'], ['BTC_USDT', 'ETH_USDT'])
+        await client._send_frame(channels.balances_frame())
+        await client.unsubscribe('trades', 'ETH_USDT')
+        client._websocket = _Socket()
+        await client._restore_session()
+
+    asyncio.run(run())
+    assert client._websocket.sent == [
+        {'event': 'subscribe', 'channel': ['trades'], 'symbols': ['BTC_USDT']},
+        {'event': 'subscribe', 'channel': ['balances']}
+    ]
+
+
+def test_dict_parameters_are_tracked():
+    client = _client()
+
+    async def run():
+        await client.subscribe(['book'], ['BTC_USDT'], params={'depth': 5})
+        client._websocket = _Socket()
+        await client._restore_session()
+
+    asyncio.run(run())
+    assert client._websocket.sent == [
+        {'event': 'subscribe', 'channel': ['book'], 'symbols': ['BTC_USDT'], 'params': {'depth': 5}}
+    ]
+
+
+def test_unsubscribe_all_forgets_subscriptions():
+    client = _client()
+
+    async def run():
+        await client.subscribe(['trades'], ['BTC_USDT'])
+        await client.unsubscribe_all()
+        client._websocket = _Socket()
+        await client._restore_session()
+
+    asyncio.run(run())
+    assert client._websocket.sent == []
@@ -0,0 +1,107 @@
+from polosdk.futures.ws.order_store import OrderStore as FuturesOrderStore
+from polosdk.spot.ws.order_store import OrderStore
+
+
+def _order(order_id, state='NEW', ts=1, symbol='BTC_USDT', **fields):
+    return dict({'orderId': order_id, 'symbol': symbol, 'state': state, 'ts': ts}, **fields)
+
+
+def _apply(store, *events):
+    store.apply({'channel': 'orders', 'data': list(events)})
+
+
+def test_older_events_are_ignored():
+    store = OrderStore()
+    _apply(store, _order('1', 'PARTIALLY_FILLED', ts=20), _order('1', 'NEW', ts=10))
+
+    assert store.get('1')['state'] == 'PARTIALLY_FILLED'
+    assert [order['orderId'] for order in store.get_open('BTC_USDT')] == ['1']
+
+
+def test_older_update_time_is_ignored():
+    store = FuturesOrderStore()
+    store.apply({'channel': 'orders', 'data': [{'ordId': '1', 'symbol': 'BTC_USDT_PERP', 'state': 'FILLED',
+                                                'uTime': 20}]})
+    store.apply({'channel': 'orders', 'data': [{'ordId': '1', 'symbol': 'BTC_USDT_PERP', 'state': 'NEW',
+                                                'uTime': 10}]})
+
+    assert store.get('1')['state'] == 'FILLED'
+    assert store.get_open() == []
+
+
+def test_get_returns_a_copy():
+    store = OrderStore()
+    _apply(store, _order('1', clientOrderId='a'))
+
+    store.get('1')['state'] = 'FILLED'
+    store.get_by_client_order_id('a')['symbol'] = 'ETH_USDT'
+    store.get_open()[0]['state'] = 'CANCELED'
+
+    assert store.get('1')['state'] == 'NEW'
+    assert store.get('1')['symbol'] == 'BTC_USDT'
+
+
+def test_reconcile_after_reconnect():
+    store = OrderStore()
+    _apply(store, _order('1'), _order('2'))
+    store.mark_stale()
+
+    store.reconcile([{'id': '2', 'symbol': 'BTC_USDT', 'state': 'PARTIALLY_FILLED', 'updateTime': 5}],
+                    fetch=lambda order_id: {'orderId': order_id, 'symbol': 'BTC_USDT', 'state': 'FILLED'})
+
+    assert not store.is_stale()
+    assert store.get('1')['state'] == 'FILLED'
+    assert [order['orderId'] for order in store.get_open()] == ['2']
+
+
+def test_reconcile_without_fetch_drops_missing_orders():
+    store = OrderStore()
+    _apply(store, _order('1'), _order('2'))
+    store.mark_stale()
+
+    store.reconcile({'data': [{'id': '2', 'symbol': 'BTC_USDT', 'state': 'NEW'}]})
+
+    assert not store.is_stale()
+    assert store.get('1') is None
+
+
+def test_reconcile_page_keeps_orders_it_does_not_cover():
+    store = OrderStore()
+    _apply(store, _order('5'), _order('15'), _order('25'))
+    store.mark_stale()
+
+    store.reconcile([{'id': '10', 'symbol': 'BTC_USDT', 'state': 'NEW'},
+                     {'id': '20', 'symbol': 'BTC_USDT', 'state': 'NEW'}], limit=2)
+
+    assert store.is_stale()
+    assert store.get('15') is None
+    assert sorted(order['orderId'] for order in store.get_open()) == ['10', '20', '25', '5']
+
+    store.reconcile([{'id': '10', 'symbol': 'BTC_USDT', 'state': 'NEW'},
+                     {'id': '20', 'symbol': 'BTC_USDT', 'state': 'NEW'}], fetch=lambda order_id: None, limit=2)
+    assert not store.is_stale()
+    assert sorted(order['orderId'] for order in store.get_open()) == ['10', '20']
+
+
+def test_stale_mark_during_reconcile_is_kept():
+    store = OrderStore()
+    _apply(store, _order('1'))
+    store.mark_stale()
+
+    def fetch(order_id):
+        store.mark_stale()
+        return None
+
+    store.reconcile([], fetch=fetch)
+    assert store.is_stale()
+
+
+def test_closed_orders_are_evicted():
+    store = OrderStore(max_closed=2)
+    _apply(store, *[_order(str(order_id), 'FILLED', clientOrderId=f'c{order_id}') for order_id in range(4)])
+    store.apply({'channel': 'orders', 'data': [_order('3', 'FILLED', ts=2, eventType='trade')]})
+
+    assert store.get('0') is None
+    assert store.get_by_client_order_id('c1') is None
+    assert store.get('3')['state'] == 'FILLED'
+    assert len(store.get_fills('3')) == 1
@@ -0,0 +1,13 @@
+import pytest
+
+from polosdk.spot.ws.replay import ReplayClient
+
+
+@pytest.mark.parametrize('speed', [0, -1.0])
+def test_non_positive_speed_is_rejected(speed):
+    with pytest.raises(ValueError):
+        ReplayClient(print, 'recordings', speed=speed)
+
+
+def test_speed_none_replays_as_fast_as_possible():
+    assert ReplayClient(print, 'recordings', speed=None)._speed is None
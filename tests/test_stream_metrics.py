@@ -0,0 +1,28 @@
+import time
+
+from polosdk.spot.ws.metrics import StreamMetrics
+
+
+def _trades(*symbols):
+    return {'channel': 'trades', 'data': [{'symbol': symbol, 'ts': int(time.time() * 1000)} for symbol in symbols]}
+
+
+def test_multi_symbol_message_counts_every_symbol():
+    metrics = StreamMetrics()
+    metrics.record(100, _trades('BTC_USDT', 'ETH_USDT', 'BTC_USDT'), 0.0001, 0.0001, time.time())
+    metrics.record(50, _trades('ETH_USDT'), 0.0001, 0.0001, time.time())
+
+    streams = metrics.snapshot()['streams']
+    assert streams['trades:BTC_USDT']['messages'] == 1
+    assert streams['trades:ETH_USDT']['messages'] == 2
+    assert streams['trades:BTC_USDT']['bytes'] + streams['trades:ETH_USDT']['bytes'] == 150
+
+
+def test_snapshot_reset_starts_a_new_period():
+    metrics = StreamMetrics()
+    metrics.record(10, _trades('BTC_USDT'), 0.0001, 0.0001, time.time())
+
+    assert metrics.snapshot(reset=True)['decode']['count'] == 1
+    snapshot = metrics.snapshot()
+    assert snapshot['streams'] == {}
+    assert snapshot['decode']['count'] == 0
@@ -0,0 +1,40 @@
+import asyncio
+import json
+
+from polosdk.spot.ws.client_base import subscription_frame
+from polosdk.spot.ws.client_public import ClientPublic
+
+
+class _Socket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, frame):
+        self.sent.append(json.loads(frame))
+
+
+def test_frame_is_cached():
+    frame = subscription_frame('subscribe', ['trades'], ['BTC_USDT', 'ETH_USDT'])
+
+    assert frame is subscription_frame('subscribe', 'trades', ('BTC_USDT', 'ETH_USDT'))
+    assert json.loads(frame) == {'event': 'subscribe', 'channel': ['trades'], 'symbols': ['BTC_USDT', 'ETH_USDT']}
+
+
+def test_dict_parameters_are_encoded_as_objects():
+    frame = subscription_frame('subscribe', ['book'], ['BTC_USDT'], params={'depth': 5, 'levels': [1, {'a': 2}]})
+
+    assert json.loads(frame)['params'] == {'depth': 5, 'levels': [1, {'a': 2}]}
+    params = {'levels': [1, {'a': 2}], 'depth': 5}
+    assert frame is subscription_frame('subscribe', ['book'], ['BTC_USDT'], params=params)
+
+
+def test_single_symbol_helpers_default_symbol():
+    client = ClientPublic(print, ws_url='ws://localhost/')
+    client._websocket = _Socket()
+
+    async def subscribe():
+        await client.subscribe_to_trades()
+        await client.subscribe_to_book()
+
+    asyncio.run(subscribe())
+    assert [msg['symbols'] for msg in client._websocket.sent] == [['BTC_USDT'], ['BTC_USDT']]
@@ -0,0 +1,48 @@
+import numpy as np
+
+from polosdk.spot.ws.trade_tape import TRADE_DTYPE, TradeTape
+
+
+def _rows(ids):
+    rows = np.zeros(len(ids), dtype=TRADE_DTYPE)
+    rows['id'] = ids
+    rows['ts'] = np.asarray(ids) * 1000
+    rows['price'] = 1.0
+    rows['quantity'] = 1.0
+    return rows
+
+
+def test_backfill_after_stream_is_merged_in_id_order():
+    tape = TradeTape(chunk_size=4)
+    assert tape.append_rows('BTC_USDT', _rows([10, 11, 12])) == 3
+    assert tape.append_rows('BTC_USDT', _rows(range(1, 12))) == 9
+
+    assert tape.trades('BTC_USDT')['id'].tolist() == list(range(1, 13))
+    assert tape.append_rows('BTC_USDT', _rows([13])) == 1
+    assert tape.count('BTC_USDT') == 13
+
+
+def test_duplicates_are_dropped():
+    tape = TradeTape(chunk_size=4)
+    tape.append_rows('BTC_USDT', _rows([1, 2, 3, 5]))
+
+    assert tape.append_rows('BTC_USDT', _rows([5, 3, 4, 4])) == 1
+    assert tape.trades('BTC_USDT')['id'].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_trades_older_than_evicted_are_counted():
+    tape = TradeTape(chunk_size=2, max_trades=4)
+    tape.append_rows('BTC_USDT', _rows(range(10, 16)))
+
+    assert tape.trades('BTC_USDT')['id'].tolist() == [12, 13, 14, 15]
+    assert tape.append_rows('BTC_USDT', _rows([5, 11, 13])) == 0
+    assert tape.dropped_trades == 2
+
+
+def test_extend_rest_trades():
+    tape = TradeTape()
+    trades = [{'id': '2', 'price': '10', 'quantity': '2', 'takerSide': 'BUY', 'createTime': 2000},
+              {'id': '1', 'price': '20', 'quantity': '1', 'takerSide': 'SELL', 'createTime': 1000}]
+
+    assert tape.extend('BTC_USDT', trades) == 2
+    assert tape.vwap('BTC_USDT') == (10 * 2 + 20 * 1) / 3